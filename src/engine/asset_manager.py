@@ -13,6 +13,8 @@ class AssetManager:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.images = {}
+        self._scaled = {}
+        self.scales = 0
         self.load_images()
     
     def load_images(self):
@@ -28,7 +30,7 @@ class AssetManager:
         try:
             for asset_type, path in image_paths.items():
                 if os.path.exists(path):
-                    image = pygame.image.load(path)
+                    image = self._convert(pygame.image.load(path))
                     
                     if asset_type == AssetType.TITLE_SCREEN:
                         image = pygame.transform.scale(image, (self.screen_width, self.screen_height))
@@ -39,9 +41,29 @@ class AssetManager:
         except Exception as e:
             print(f"Error loading images: {e}")
     
+    def _convert(self, image):
+        """Match the display's pixel format once so blits skip the conversion; needs a display mode"""
+        if pygame.display.get_surface() is None:
+            return image
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+    
     def get_image(self, asset_type):
         return self.images.get(asset_type)
     
+    def get_scaled_image(self, asset_type, size):
+        """The image scaled to size, scaled only the first time each (asset, size) is asked for"""
+        key = (asset_type, tuple(size))
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            image = self.images.get(asset_type)
+            if image is None:
+                return None
+            scaled = self._scaled[key] = pygame.transform.scale(image, key[1])
+            self.scales += 1
+        return scaled
+    
     def get_enemy_image(self, enemy_name):
         enemy_type_map = {
             "Goblin": AssetType.ENEMY_GOBLIN,
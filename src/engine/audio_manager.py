@@ -1,6 +1,12 @@
 import os
 import pygame
 from enum import Enum, auto
+from typing import Optional
+from .settings import SettingsStore, get_settings
+from .sound_bank import SoundBank, get_sound_bank
+from .channel_pool import ChannelMixer, ChannelPool
+
+AUDIO_SETTINGS = ("master_volume", "music_volume", "ui_volume", "sfx_volume")
 
 class MusicType(Enum):
     MENU = auto()
@@ -14,25 +20,61 @@ class SoundType(Enum):
     ATTACK = auto()
     HEAL = auto()
 
+SKILL_SOUNDS = {"attack": SoundType.ATTACK, "heal": SoundType.HEAL}
+
+# Reserved mixer channels per category; a category never plays more voices than this
+CHANNEL_POOLS = {"ui": 2, "sfx": 2, "combat": 4}
+UI_SOUNDS = (SoundType.UI_CLICK, SoundType.UI_DROP)
+SOUND_PRIORITIES = {SoundType.UI_CLICK: 2, SoundType.UI_DROP: 2, SoundType.HEAL: 1, SoundType.ATTACK: 0}
+
+# Tracks are decoded whole so two can overlap in a crossfade; a four minute track is about 40 MB
+MUSIC_CHANNELS = 2
+MUSIC_CACHE_BYTES = 128 * 1024 * 1024
+CROSSFADE_MS = 1500
+
 class AudioManager:
-    def __init__(self):
+    def __init__(self, settings: Optional[SettingsStore] = None, sound_bank: Optional[SoundBank] = None,
+                 music_bank: Optional[SoundBank] = None):
         # Initialize pygame mixer if it hasn't been already
         if not pygame.mixer.get_init():
             pygame.mixer.init()
             
-        self.sounds = {}
+        self.sound_paths = {}
         self.current_music = None
         self.music_paths = {}
+        self.sound_bank = sound_bank or get_sound_bank()
+        self.music_bank = music_bank or SoundBank(MUSIC_CACHE_BYTES)
+        self.music_channels = []
+        self.music_channel = None
+        self.music_sound = None
+        self.mixer = self._reserve_channels()
         
         # Volume settings (0.0 to 1.0)
         self.master_volume = 1.0
         self.music_volume = 0.7
         self.ui_volume = 0.8
         self.sfx_volume = 0.9
+        self.settings = settings or get_settings()
         
         self.load_audio_files()
         self.load_settings()
         
+    def _reserve_channels(self):
+        total = sum(CHANNEL_POOLS.values()) + MUSIC_CHANNELS
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+        pygame.mixer.set_reserved(total)
+        pools = {}
+        first = 0
+        for category, count in CHANNEL_POOLS.items():
+            pools[category] = ChannelPool(category, [pygame.mixer.Channel(index) for index in range(first, first + count)])
+            first += count
+        self.music_channels = [pygame.mixer.Channel(index) for index in range(first, total)]
+        return ChannelMixer(pools, self._load_sound)
+        
+    def _load_sound(self, sound_type):
+        path = self.sound_paths.get(sound_type)
+        return self.sound_bank.get(path) if path else None
+        
     def load_audio_files(self):
         # Get paths to audio files
         audio_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "audio")
@@ -43,36 +85,53 @@ class AudioManager:
         self.music_paths[MusicType.BATTLE] = os.path.join(audio_folder, "Battle Music 1.mp3")
         self.music_paths[MusicType.AFTER_COMBAT] = os.path.join(audio_folder, "After Combat.mp3")
         
-        # Sound effect paths
-        sound_paths = {
+        # Sound effect paths; the bank decodes them in the background
+        self.sound_paths = {
             SoundType.UI_CLICK: os.path.join(audio_folder, "ui_click.wav"),
             SoundType.UI_DROP: os.path.join(audio_folder, "ui_click2.mp3"),
             SoundType.ATTACK: os.path.join(audio_folder, "attack.wav"),
             SoundType.HEAL: os.path.join(audio_folder, "heal.wav")
         }
-        
-        # Load sound effects
-        try:
-            for sound_type, path in sound_paths.items():
-                if os.path.exists(path):
-                    self.sounds[sound_type] = pygame.mixer.Sound(path)
-        except Exception as e:
-            print(f"Error loading sounds: {e}")
+        self.sound_bank.preload(self.sound_paths.values())
     
     def play_music(self, music_type):
+        """Crossfade to a track, decoding it on the music bank's thread first unless it was prefetched"""
         path = self.music_paths.get(music_type)
         if not path or not os.path.exists(path) or self.current_music == music_type:
             return
             
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(path)
-        self.update_music_volume()
-        pygame.mixer.music.play(-1)  # Loop indefinitely
         self.current_music = music_type
+        if path in self.music_bank:
+            self._crossfade_to(music_type, self.music_bank.get(path))
+        else:
+            self.music_bank.submit(lambda: self.music_bank.get(path), lambda sound: self._crossfade_to(music_type, sound))
+            
+    def prefetch_music(self, music_types):
+        """Decode tracks that are likely to play next in the background"""
+        paths = [self.music_paths.get(music_type) for music_type in music_types if music_type != self.current_music]
+        self.music_bank.preload(path for path in paths if path and os.path.exists(path) and path not in self.music_bank)
+        
+    def _crossfade_to(self, music_type, sound):
+        if self.current_music != music_type or sound is None:
+            return
+        if self.music_channel:
+            self.music_channel.fadeout(CROSSFADE_MS)
+        channel = self.music_channels[1] if self.music_channel is self.music_channels[0] else self.music_channels[0]
+        channel.stop()
+        sound.set_volume(self.master_volume * self.music_volume)
+        channel.play(sound, loops=-1, fade_ms=CROSSFADE_MS)
+        self.music_channel = channel
+        self.music_sound = sound
+        
+    def update(self):
+        self.sound_bank.poll()
+        self.music_bank.poll()
+        self.mixer.update()
         
     def update_music_volume(self):
         effective_volume = self.master_volume * self.music_volume
-        pygame.mixer.music.set_volume(effective_volume)
+        if self.music_sound:
+            self.music_sound.set_volume(effective_volume)
     
     def play_menu_music(self):
         self.play_music(MusicType.MENU)
@@ -87,20 +146,22 @@ class AudioManager:
         self.play_music(MusicType.AFTER_COMBAT)
     
     def stop_music(self):
-        pygame.mixer.music.stop()
+        for channel in self.music_channels:
+            channel.stop()
+        self.music_channel = None
+        self.music_sound = None
         self.current_music = None
     
-    def play_sound(self, sound_type):
-        sound = self.sounds.get(sound_type)
-        if sound:
-            # Apply appropriate volume based on sound type
-            if sound_type in [SoundType.UI_CLICK, SoundType.UI_DROP]:
-                effective_volume = self.master_volume * self.ui_volume
-            else:
-                effective_volume = self.master_volume * self.sfx_volume
-                
-            sound.set_volume(effective_volume)
-            sound.play()
+    def play_sound(self, sound_type, category=None):
+        """Queue a sound on its category's channels; it starts at the next update()"""
+        # Apply appropriate volume based on sound type
+        if sound_type in UI_SOUNDS:
+            effective_volume = self.master_volume * self.ui_volume
+        else:
+            effective_volume = self.master_volume * self.sfx_volume
+            
+        category = category or ("ui" if sound_type in UI_SOUNDS else "sfx")
+        self.mixer.request(category, sound_type, effective_volume, SOUND_PRIORITIES.get(sound_type, 0))
     
     def play_ui_click(self):
         self.play_sound(SoundType.UI_CLICK)
@@ -114,63 +175,36 @@ class AudioManager:
     def play_heal_sound(self):
         self.play_sound(SoundType.HEAL)
         
+    def play_skill_sound(self, name):
+        """Play a skill's sound by the name in its data: attack or heal"""
+        sound_type = SKILL_SOUNDS.get(name)
+        if sound_type:
+            self.play_sound(sound_type, "combat")
+        
     def set_master_volume(self, volume):
         self.master_volume = max(0.0, min(1.0, volume))
         self.update_music_volume()
-        self.save_settings()
+        self.settings.set("audio.master_volume", self.master_volume)
         
     def set_music_volume(self, volume):
         self.music_volume = max(0.0, min(1.0, volume))
         self.update_music_volume()
-        self.save_settings()
+        self.settings.set("audio.music_volume", self.music_volume)
         
     def set_ui_volume(self, volume):
         self.ui_volume = max(0.0, min(1.0, volume))
-        self.save_settings()
+        self.settings.set("audio.ui_volume", self.ui_volume)
         
     def set_sfx_volume(self, volume):
         self.sfx_volume = max(0.0, min(1.0, volume))
-        self.save_settings()
+        self.settings.set("audio.sfx_volume", self.sfx_volume)
         
     def save_settings(self):
-        import json
-        import os
-        
-        settings = {
-            "master_volume": self.master_volume,
-            "music_volume": self.music_volume,
-            "ui_volume": self.ui_volume,
-            "sfx_volume": self.sfx_volume
-        }
-        
-        settings_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-        os.makedirs(settings_dir, exist_ok=True)
-        
-        settings_path = os.path.join(settings_dir, "audio_settings.json")
-        
-        try:
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f)
-        except Exception as e:
-            print(f"Error saving audio settings: {e}")
+        """Hand the volumes to the settings store, which writes them to disk in the background"""
+        for key in AUDIO_SETTINGS:
+            self.settings.set(f"audio.{key}", getattr(self, key))
             
     def load_settings(self):
-        import json
-        import os
-        
-        settings_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-        settings_path = os.path.join(settings_dir, "audio_settings.json")
-        
-        if os.path.exists(settings_path):
-            try:
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    
-                self.master_volume = settings.get("master_volume", self.master_volume)
-                self.music_volume = settings.get("music_volume", self.music_volume)
-                self.ui_volume = settings.get("ui_volume", self.ui_volume)
-                self.sfx_volume = settings.get("sfx_volume", self.sfx_volume)
-                
-                self.update_music_volume()
-            except Exception as e:
-                print(f"Error loading audio settings: {e}")
+        for key in AUDIO_SETTINGS:
+            setattr(self, key, self.settings.get(f"audio.{key}", getattr(self, key)))
+        self.update_music_volume()
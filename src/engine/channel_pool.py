@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class ChannelPool:
+    """
+    A fixed set of reserved mixer channels for one category of sounds. Never plays more than
+    len(channels) voices: when all are busy, a new sound takes over the channel with the lowest
+    priority (the oldest among equals) as long as that priority is not above its own, and is
+    dropped otherwise.
+    """
+    def __init__(self, name: str, channels: Sequence[Any]):
+        self.name = name
+        self.channels = list(channels)
+        self._voices: List[Tuple[int, int]] = [(0, 0)] * len(self.channels)  # (priority, start order) per channel
+        self._started = 0
+        self.plays = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def _free_channel(self, priority: int) -> Optional[int]:
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if victim is None or self._voices[index] < self._voices[victim]:
+                victim = index
+        if victim is not None and self._voices[victim][0] <= priority:
+            self.stolen += 1
+            return victim
+        return None
+
+    def play(self, sound, volume: float = 1.0, priority: int = 0) -> bool:
+        index = self._free_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return False
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self._started += 1
+        self._voices[index] = (priority, self._started)
+        self.plays += 1
+        return True
+
+    def stop(self) -> None:
+        for channel in self.channels:
+            channel.stop()
+
+
+class ChannelMixer:
+    """
+    Channel pools by category, fed through a per-frame queue: request() only records which
+    sound to play, and identical sounds requested in the same frame collapse into one voice at
+    the highest requested priority. update() looks the queued keys up with load (the key is
+    the sound itself without one) and plays them.
+    """
+    def __init__(self, pools: Dict[str, ChannelPool], load: Optional[Callable[[Any], Any]] = None):
+        self.pools = pools
+        self.load = load
+        self.requests = 0
+        self.deduped = 0
+        self._queue: Dict[Tuple[str, Any], Tuple[float, int]] = {}
+
+    def request(self, category: str, key: Any, volume: float = 1.0, priority: int = 0) -> None:
+        self.requests += 1
+        queued = self._queue.get((category, key))
+        if queued is not None:
+            self.deduped += 1
+            if queued[1] >= priority:
+                return
+        self._queue[(category, key)] = (volume, priority)
+
+    def update(self) -> int:
+        """Play everything requested since the last update; returns how many voices started"""
+        if not self._queue:
+            return 0
+        queue, self._queue = self._queue, {}
+        started = 0
+        for (category, key), (volume, priority) in sorted(queue.items(), key=lambda entry: -entry[1][1]):
+            sound = self.load(key) if self.load else key
+            if sound is not None and self.pools[category].play(sound, volume, priority):
+                started += 1
+        return started
+
+    def stop(self) -> None:
+        self._queue.clear()
+        for pool in self.pools.values():
+            pool.stop()
@@ -3,12 +3,16 @@ import sys
 from enum import Enum, auto
 from typing import Dict, List, Optional
 from .ui import UIManager
-from .audio_manager import AudioManager
+from .audio_manager import AudioManager, MusicType
 from .asset_manager import AssetManager
 from .save_manager import SaveManager
+from .settings import get_settings
 from ..game.player import Player
+from ..game.save_migrations import needs_migration
 from ..game.combat import CombatManager
+from ..game.combat_events import EventBus, SkillUsed, DamageDealt, CombatEnded, log_events
 from ..game.action_manager import ActionManager
+from ..game.expedition import Expedition, ExpeditionScheduler
 
 class GameState(Enum):
     MAIN_MENU = auto()
@@ -20,6 +24,46 @@ class GameState(Enum):
     RESULTS = auto()
     SETTINGS = auto()
     END_COMBAT = auto()
+    SHOP = auto()
+    LOAD_GAME = auto()
+
+STATE_MUSIC = {
+    GameState.MAIN_MENU: MusicType.MENU,
+    GameState.CHARACTER: MusicType.TOWN,
+    GameState.EQUIPMENT: MusicType.TOWN,
+    GameState.SKILLS: MusicType.TOWN,
+    GameState.COMBAT_SETUP: MusicType.TOWN,
+    GameState.SHOP: MusicType.TOWN,
+    GameState.COMBAT: MusicType.BATTLE,
+    GameState.RESULTS: MusicType.AFTER_COMBAT,
+    GameState.END_COMBAT: MusicType.AFTER_COMBAT
+}
+
+# The screens each state's UI can switch to
+STATE_TRANSITIONS = {
+    GameState.MAIN_MENU: (GameState.CHARACTER, GameState.LOAD_GAME, GameState.SETTINGS),
+    GameState.LOAD_GAME: (GameState.CHARACTER, GameState.MAIN_MENU),
+    GameState.CHARACTER: (GameState.EQUIPMENT, GameState.SKILLS, GameState.SETTINGS, GameState.COMBAT_SETUP, GameState.SHOP),
+    GameState.EQUIPMENT: (GameState.CHARACTER,),
+    GameState.SKILLS: (GameState.CHARACTER,),
+    GameState.SHOP: (GameState.CHARACTER,),
+    GameState.COMBAT_SETUP: (GameState.COMBAT, GameState.CHARACTER),
+    GameState.COMBAT: (GameState.END_COMBAT,),
+    GameState.RESULTS: (GameState.CHARACTER,),
+    GameState.END_COMBAT: (GameState.CHARACTER,)
+}
+
+def upcoming_music(state: GameState, depth: int = 2) -> List[MusicType]:
+    """Tracks of the states reachable from state within depth transitions, nearest first"""
+    tracks = []
+    frontier = [state]
+    for _ in range(depth):
+        frontier = [following for current in frontier for following in STATE_TRANSITIONS.get(current, ())]
+        for following in frontier:
+            track = STATE_MUSIC.get(following)
+            if track and track != STATE_MUSIC.get(state) and track not in tracks:
+                tracks.append(track)
+    return tracks
 
 class Game:
     def __init__(self, width: int = 800, height: int = 600):
@@ -33,22 +77,48 @@ class Game:
         self.state = GameState.MAIN_MENU
         self.previous_state = GameState.MAIN_MENU  # Track previous state for returning from settings
         self.action_manager = ActionManager()
-        self.audio_manager = AudioManager()
+        self.settings = get_settings()
+        self.audio_manager = AudioManager(self.settings)
         self.asset_manager = AssetManager(width, height)
         self.save_manager = SaveManager()
         self.player = None
         self.combat_manager = None
+        self.events = EventBus()
+        self.events.subscribe(SkillUsed, self._on_skills_used)
+        self.events.subscribe(CombatEnded, self._on_combat_ended)
+        for event_type in (SkillUsed, DamageDealt, CombatEnded):
+            self.events.subscribe(event_type, log_events)
+        self.main_expedition = None
+        self.expeditions = ExpeditionScheduler()
         self.ui_manager = UIManager(self)
         self.ui_manager.build_ui_for_state(self.state)
         self.audio_manager.play_menu_music()
+        self.audio_manager.prefetch_music(upcoming_music(self.state))
         
 
         
     def create_new_player(self):
         self.player = Player("Hero", self.action_manager)
-        self.combat_manager = CombatManager(self.player)
+        self.save_manager.active_slot = self.save_manager.free_slot()
+        self._attach_combat_manager()
         self.audio_manager.play_town_music()
         
+    def _attach_combat_manager(self):
+        # The player's own battle is the focused expedition; only it is ever rendered
+        if self.main_expedition:
+            self.expeditions.remove(self.main_expedition)
+        self.combat_manager = CombatManager(self.player, self.events)
+        self.main_expedition = Expedition(self.player, auto_restart=False, combat_manager=self.combat_manager)
+        self.expeditions.add(self.main_expedition, focus=True)
+        
+    def start_expedition(self) -> Expedition:
+        """Send a new party out to grind battles in the background"""
+        number = len(self.expeditions.background()) + 1
+        party = Player(f"Mercenary {number}", ActionManager())
+        expedition = Expedition(party, enemy_level=self.player.level if self.player else None)
+        expedition.start()
+        return self.expeditions.add(expedition)
+        
     def process_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -56,18 +126,26 @@ class Game:
             self.ui_manager.handle_event(event)
                 
     def update(self):
+        self.save_manager.poll()
+        if self.player:
+            self.player.playtime += self.clock.get_time() / 1000
         self.ui_manager.update()
+        self.expeditions.update()
+        self.events.dispatch()
+        self.audio_manager.update()
         
+        if self.state == GameState.COMBAT and self.combat_manager:
+            # Rebuild the UI to reflect the updated combat state
+            self.ui_manager.clear()
+            self.ui_manager.build_ui_for_state(self.state)
+            
+    def _on_skills_used(self, events):
+        for event in events:
+            self.audio_manager.play_skill_sound(event.sound)
+            
+    def _on_combat_ended(self, events):
         if self.state == GameState.COMBAT:
-            if self.combat_manager:
-                combat_finished = self.combat_manager.update()
-                
-                # Rebuild the UI to reflect the updated combat state
-                self.ui_manager.clear()
-                self.ui_manager.build_ui_for_state(self.state)
-                
-                if combat_finished:
-                    self.change_state(GameState.END_COMBAT)
+            self.change_state(GameState.END_COMBAT)
         
     def render(self):
         self.screen.fill((30, 30, 40))  # Dark background
@@ -80,6 +158,8 @@ class Game:
             self.update()
             self.render()
             self.clock.tick(60)
+        self.save_manager.flush()
+        self.settings.flush()
         pygame.quit()
         sys.exit()
         
@@ -95,47 +175,53 @@ class Game:
         self.state = new_state
         self.ui_manager.build_ui_for_state(new_state)
         
-        # Play appropriate music based on the new state
-        if new_state == GameState.MAIN_MENU:
-            self.audio_manager.play_menu_music()
-        elif new_state in [GameState.CHARACTER, GameState.EQUIPMENT, GameState.SKILLS, GameState.COMBAT_SETUP]:
-            self.audio_manager.play_town_music()
-        elif new_state == GameState.COMBAT:
-            self.audio_manager.play_battle_music()
-        elif new_state in [GameState.RESULTS, GameState.END_COMBAT]:
-            self.audio_manager.play_after_combat_music()
+        # Play appropriate music based on the new state, and decode what is likely to come next
+        if new_state in STATE_MUSIC:
+            self.audio_manager.play_music(STATE_MUSIC[new_state])
+        self.audio_manager.prefetch_music(upcoming_music(new_state))
+            
+        # Autosave after every fight; the write happens off the frame
+        if new_state == GameState.END_COMBAT and self.player:
+            self.save_game()
             
-    def save_game(self):
+    def save_game(self, background: bool = True):
+        """Snapshot the player now; by default the encode and disk write happen on the save thread"""
         if not self.player:
             return False, "No player data to save"
             
         try:
             player_data = self.player.to_dict()
-            
-            # We don't need to pass combat_sequence separately since it's included in player_data
-            success, message = self.save_manager.save_game(player_data, None)
-            
-            if success:
-                self.ui_manager.show_notification("Game saved successfully!")
-            else:
-                self.ui_manager.show_notification(f"Save failed: {message}")
-                
-            return success, message
         except Exception as e:
             error_msg = f"Error saving game: {str(e)}"
             self.ui_manager.show_notification(error_msg)
             return False, error_msg
+            
+        if background:
+            self.save_manager.save_game_async(player_data, self._on_game_saved)
+            return True, "Saving..."
+            
+        success, message = self.save_manager.save_game(player_data, None)
+        self._on_game_saved(success, message)
+        return success, message
+    
+    def _on_game_saved(self, success, message):
+        if success:
+            self.ui_manager.show_notification("Game saved successfully!")
+        else:
+            self.ui_manager.show_notification(f"Save failed: {message}")
     
-    def load_game(self):
-        success, player_data = self.save_manager.load_game()
+    def load_game(self, slot=None):
+        success, save = self.save_manager.load_save(slot)
         
         if not success:
             self.ui_manager.show_notification("No save file found or load failed")
             return False
             
         try:
-            self.player = Player.from_dict(player_data, self.action_manager)
-            self.combat_manager = CombatManager(self.player)
+            self.player = Player.from_save(save, self.action_manager)
+            if needs_migration(save.lazy_player_data()[0]):
+                self.save_manager.save_game_async(self.player.to_dict(), compact=True)
+            self._attach_combat_manager()
             self.change_state(GameState.CHARACTER)
             self.ui_manager.show_notification("Game loaded successfully!")
             return True
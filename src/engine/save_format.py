@@ -0,0 +1,168 @@
+"""
+Binary save files.
+A fixed header (magic, format version, section count, CRC32 and length of the body) is followed
+by length-prefixed sections, each compressed on its own, so a reader can validate the file up
+front and only decompress the sections it actually touches. Worn equipment and the inventory
+bag are separate sections, so a save can be shown and played before the bag is decoded.
+"""
+import json
+import lzma
+import struct
+import zlib
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+MAGIC = b"DNUT"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHII")
+SECTION = struct.Struct("<BBII")
+
+CORE_SECTION = "player"
+SECTION_PATHS = {
+    1: {"inventory": ("inventory",), "skills": ("skills",)},
+    2: {"equipment": ("inventory", "equipment"), "inventory": ("inventory", "inventory"), "skills": ("skills",)}
+}
+
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+CODEC_NAMES = {code: name for name, code in CODECS.items()}
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+def compress(raw: bytes, codec: str, level: int) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(raw, level)
+    if codec == "lzma":
+        return lzma.compress(raw, preset=level)
+    if codec == "none":
+        return raw
+    raise SaveFormatError(f"Unknown compression: {codec}")
+
+
+def decompress(payload: bytes, code: int) -> bytes:
+    if code == CODECS["zlib"]:
+        return zlib.decompress(payload)
+    if code == CODECS["lzma"]:
+        return lzma.decompress(payload)
+    if code == CODECS["none"]:
+        return payload
+    raise SaveFormatError(f"Unknown compression code: {code}")
+
+
+def split_sections(player_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Core player fields in one section; equipment, inventory and skills in their own"""
+    paths = SECTION_PATHS[FORMAT_VERSION]
+    roots = {path[0] for path in paths.values()}
+    sections = {CORE_SECTION: {key: value for key, value in player_data.items() if key not in roots}}
+    for name, path in paths.items():
+        value = player_data
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            sections[name] = value
+    return sections
+
+
+def encode_save(player_data: Dict[str, Any], compression: str = "zlib", level: int = 6) -> bytes:
+    body = bytearray()
+    sections = split_sections(player_data)
+    for name, value in sections.items():
+        raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        payload = compress(raw, compression, level)
+        encoded_name = name.encode("utf-8")
+        body += SECTION.pack(len(encoded_name), CODECS[compression], len(raw), len(payload))
+        body += encoded_name
+        body += payload
+    return HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), zlib.crc32(body), len(body)) + bytes(body)
+
+
+def is_binary_save(data: bytes) -> bool:
+    return data[:len(MAGIC)] == MAGIC
+
+
+class SaveFile:
+    """
+    A validated binary save. Sections stay compressed until section() first asks for them.
+    """
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size or not is_binary_save(data):
+            raise SaveFormatError("Not a save file")
+        _, self.version, count, checksum, length = HEADER.unpack_from(data)
+        if self.version > FORMAT_VERSION:
+            raise SaveFormatError(f"Save format {self.version} is newer than supported {FORMAT_VERSION}")
+        body = memoryview(data)[HEADER.size:]
+        if len(body) != length or zlib.crc32(body) != checksum:
+            raise SaveFormatError("Save file is corrupt: checksum mismatch")
+
+        self._raw: Dict[str, Tuple[int, int, memoryview]] = {}
+        self._decoded: Dict[str, Any] = {}
+        offset = 0
+        for _ in range(count):
+            name_length, code, raw_length, payload_length = SECTION.unpack_from(body, offset)
+            offset += SECTION.size
+            name = bytes(body[offset:offset + name_length]).decode("utf-8")
+            offset += name_length
+            self._raw[name] = (code, raw_length, body[offset:offset + payload_length])
+            offset += payload_length
+        if offset != length:
+            raise SaveFormatError("Save file is corrupt: bad section table")
+
+    @classmethod
+    def read(cls, path: str) -> "SaveFile":
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._raw
+
+    def names(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def compression(self, name: str) -> str:
+        return CODEC_NAMES.get(self._raw[name][0], "unknown")
+
+    def section(self, name: str, default: Any = None) -> Any:
+        """Decompress and parse a section on first access"""
+        if name in self._decoded:
+            return self._decoded[name]
+        if name not in self._raw:
+            return default
+        code, raw_length, payload = self._raw[name]
+        raw = decompress(bytes(payload), code)
+        if len(raw) != raw_length:
+            raise SaveFormatError(f"Save section {name} is corrupt")
+        value = self._decoded[name] = json.loads(raw)
+        return value
+
+    def player_data(self) -> Dict[str, Any]:
+        """Every section merged back into the dict Player.to_dict produced"""
+        data = dict(self.section(CORE_SECTION, {}))
+        for name, path in SECTION_PATHS.get(self.version, {}).items():
+            if name not in self._raw:
+                continue
+            parent = data
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            parent[path[-1]] = self.section(name)
+        return data
+
+    def lazy_player_data(self) -> Tuple[Dict[str, Any], Callable[[], Any]]:
+        """
+        Player data without the inventory bag, plus a loader for the bag's item list.
+        Only the core, equipment and skills sections are decoded up front.
+        """
+        if self.version < 2:
+            data = self.player_data()
+            inventory = dict(data.get("inventory") or {})
+            items = inventory.pop("inventory", [])
+            data["inventory"] = inventory
+            return data, lambda: items
+        data = dict(self.section(CORE_SECTION, {}))
+        data["inventory"] = {"equipment": self.section("equipment", {})}
+        if "skills" in self._raw:
+            data["skills"] = self.section("skills")
+        return data, lambda: self.section("inventory", [])
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps({"version": self.version, "player": self.player_data()}, indent=indent)
@@ -0,0 +1,190 @@
+"""
+Append-only save journal.
+Between full snapshots a save is written as a small delta against the previous one: changed
+player fields, changed equipment slots and the inventory edits. Each journal starts with the
+CRC32 of the snapshot it applies to, so a journal left behind by an older snapshot is ignored.
+"""
+import json
+import os
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+INVENTORY = "inventory"
+EQUIPMENT = "equipment"
+
+
+def snapshot_checksum(data: bytes) -> int:
+    return zlib.crc32(data)
+
+
+def _same_stack(first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+    """Saved items that differ at most in their count"""
+    if first.keys() - {"count"} != second.keys() - {"count"}:
+        return False
+    return all(first[key] == second[key] for key in first if key != "count")
+
+
+def diff_items(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Inventory edits turning old into new. The inventory only ever appends, so new is old with
+    some entries dropped or recounted plus a tail of new entries, and one pass finds them.
+    """
+    if old is new:
+        return None
+    changed: Dict[str, Dict[str, Any]] = {}
+    removed: List[int] = []
+    position = 0
+    for index, item in enumerate(old):
+        if position < len(new) and (new[position] == item or _same_stack(new[position], item)):
+            if new[position] != item:
+                changed[str(index)] = new[position]
+            position += 1
+        else:
+            removed.append(index)
+    ops: Dict[str, Any] = {}
+    if changed:
+        ops["set"] = changed
+    if removed:
+        ops["remove"] = removed
+    if position < len(new):
+        ops["append"] = new[position:]
+    return ops or None
+
+
+def apply_items(items: List[Dict[str, Any]], ops: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = list(items)
+    for index, item in ops.get("set", {}).items():
+        result[int(index)] = item
+    for index in reversed(ops.get("remove", [])):
+        del result[index]
+    result.extend(ops.get("append", []))
+    return result
+
+
+def diff_player_data(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Delta from one Player.to_dict snapshot to the next, or None if nothing changed"""
+    delta: Dict[str, Any] = {}
+    fields = {key: value for key, value in new.items() if key != INVENTORY and old.get(key) != value}
+    if fields:
+        delta["set"] = fields
+
+    old_inventory = old.get(INVENTORY) or {}
+    new_inventory = new.get(INVENTORY) or {}
+    old_equipment = old_inventory.get(EQUIPMENT) or {}
+    equipment = {slot: item for slot, item in (new_inventory.get(EQUIPMENT) or {}).items()
+                 if old_equipment.get(slot) != item}
+    if equipment:
+        delta[EQUIPMENT] = equipment
+
+    items = diff_items(old_inventory.get(INVENTORY) or [], new_inventory.get(INVENTORY) or [])
+    if items:
+        delta["items"] = items
+    return delta or None
+
+
+def apply_fields(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply everything but the inventory edits, returning a new dict"""
+    data = dict(data)
+    data.update(delta.get("set", {}))
+    if EQUIPMENT in delta:
+        inventory = dict(data.get(INVENTORY) or {})
+        inventory[EQUIPMENT] = dict(inventory.get(EQUIPMENT) or {}, **delta[EQUIPMENT])
+        data[INVENTORY] = inventory
+    return data
+
+
+class Journal:
+    """Delta log of one save slot; every entry is one JSON line"""
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = 0
+        self.size = 0
+        self.clean = True
+
+    def reset(self, base: int, write: Callable[[str, bytes], None]) -> None:
+        """Start a fresh journal on top of the snapshot with the given checksum"""
+        header = json.dumps({"base": base}).encode("utf-8") + b"\n"
+        write(self.path, header)
+        self.entries = 0
+        self.size = len(header)
+        self.clean = True
+
+    def append(self, delta: Dict[str, Any]) -> int:
+        line = json.dumps(delta, separators=(",", ":")).encode("utf-8") + b"\n"
+        with open(self.path, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries += 1
+        self.size += len(line)
+        return len(line)
+
+    def read(self, base: int) -> List[Dict[str, Any]]:
+        """
+        Deltas recorded on top of the snapshot with the given checksum. Reading stops at a torn
+        line; the journal is then marked unclean so the next save compacts it.
+        """
+        self.entries = 0
+        self.size = 0
+        self.clean = False
+        try:
+            with open(self.path, 'rb') as f:
+                lines = f.read().split(b"\n")
+            if json.loads(lines[0]).get("base") != base:
+                return []
+        except (OSError, ValueError, AttributeError):
+            return []
+
+        deltas = []
+        self.clean = True
+        for line in lines[1:-1]:
+            try:
+                deltas.append(json.loads(line))
+            except ValueError:
+                self.clean = False
+                break
+        if lines[-1]:
+            self.clean = False
+        self.entries = len(deltas)
+        self.size = sum(len(line) + 1 for line in lines[:len(deltas) + 1])
+        return deltas
+
+
+class JournaledSave:
+    """
+    A snapshot with its journal replayed on top. Offers the same player_data and
+    lazy_player_data as SaveFile; inventory edits are only replayed when the bag is loaded.
+    """
+    def __init__(self, save, deltas: List[Dict[str, Any]]):
+        self.save = save
+        self.deltas = deltas
+
+    def _replay_items(self, load_items: Callable[[], Any]) -> Callable[[], Any]:
+        edits = [delta["items"] for delta in self.deltas if "items" in delta]
+        if not edits:
+            return load_items
+        replayed: List[Any] = []
+
+        def load():
+            if not replayed:
+                items = load_items() or []
+                for ops in edits:
+                    items = apply_items(items, ops)
+                replayed.append(items)
+            return replayed[0]
+        return load
+
+    def lazy_player_data(self) -> Tuple[Dict[str, Any], Callable[[], Any]]:
+        data, load_items = self.save.lazy_player_data()
+        for delta in self.deltas:
+            data = apply_fields(data, delta)
+        return data, self._replay_items(load_items)
+
+    def player_data(self) -> Dict[str, Any]:
+        if not self.deltas:
+            return self.save.player_data()
+        data, load_items = self.lazy_player_data()
+        inventory = dict(data.get(INVENTORY) or {})
+        inventory[INVENTORY] = load_items()
+        data[INVENTORY] = inventory
+        return data
@@ -1,43 +1,328 @@
 import os
 import json
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-class SaveManager:
+from .save_format import SaveFile, encode_save, is_binary_save
+from .save_journal import Journal, JournaledSave, diff_player_data, snapshot_checksum
+
+SaveCallback = Callable[[bool, str], None]
+
+SAVE_SLOTS = 3
+INDEX_VERSION = 1
+JOURNAL_ENTRIES = 32
+JOURNAL_BYTES = 64 * 1024
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write to a temp file next to path, fsync it and swap it in, so a crash never leaves a torn save"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class SaveWriter:
+    """
+    Background thread that runs save jobs.
+    A job for a key that is still waiting replaces the older one, so bursts of saves
+    only write the newest snapshot. Callbacks run on the thread that calls poll().
+    """
     def __init__(self):
-        self.save_file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "player_save.json")
-    
-    def save_game(self, player_data, combat_sequence=None):
+        self._condition = threading.Condition()
+        self._pending: Dict[str, Tuple[Callable[[], None], List[SaveCallback]]] = {}
+        self._results: List[Tuple[SaveCallback, bool, str]] = []
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+        self.coalesced = 0
+
+    def submit(self, key: str, job: Callable[[], None], callback: Optional[SaveCallback] = None) -> None:
+        with self._condition:
+            previous = self._pending.pop(key, None)
+            callbacks = previous[1] if previous else []
+            if previous:
+                self.coalesced += 1
+            if callback:
+                callbacks.append(callback)
+            self._pending[key] = (job, callbacks)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                key = next(iter(self._pending))
+                job, callbacks = self._pending.pop(key)
+                self._busy = True
+
+            try:
+                job()
+                success, message = True, "Game saved successfully!"
+            except Exception as e:
+                success, message = False, f"Error saving game: {e}"
+                print(message)
+
+            with self._condition:
+                self._busy = False
+                self.writes += 1
+                self._results.extend((callback, success, message) for callback in callbacks)
+                self._condition.notify_all()
+
+    def poll(self) -> int:
+        """Run the callbacks of finished writes; returns how many ran"""
+        with self._condition:
+            results, self._results = self._results, []
+        for callback, success, message in results:
+            callback(success, message)
+        return len(results)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted save is on disk"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+
+class SaveManager:
+    """
+    Numbered save slots in the binary format from save_format, compressed with zlib or lzma
+    at the given level. A small index file keeps the name, level, gold, playtime and time of
+    every slot, so menus never open the saves themselves.
+    Saves after the first are appended to the slot's journal as deltas; once the journal holds
+    journal_entries deltas or journal_bytes bytes, the next save writes a full snapshot instead.
+    Snapshots and the index are replaced atomically. Loading replays the journal over the
+    snapshot, also accepts older JSON saves, and export_json writes a readable copy.
+    """
+    def __init__(self, save_dir: Optional[str] = None, compression: str = "zlib", level: int = 6, slots: int = SAVE_SLOTS,
+                 journal_entries: int = JOURNAL_ENTRIES, journal_bytes: int = JOURNAL_BYTES):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.save_dir = save_dir or os.path.join(root, "saves")
+        self.index_path = os.path.join(self.save_dir, "index.json")
+        self.legacy_file_paths = [os.path.join(root, "player_save.sav"), os.path.join(root, "player_save.json")] if save_dir is None else []
+        self.compression = compression
+        self.level = level
+        self.slots = slots
+        self.active_slot = 1
+        self.journal_entries = journal_entries
+        self.journal_bytes = journal_bytes
+        self.writer = SaveWriter()
+        self.snapshots = 0
+        self.deltas = 0
+        self._journals: Dict[int, Journal] = {}
+        self._baselines: Dict[int, Any] = {}
+        self._slot_lock = threading.Lock()
+
+        os.makedirs(self.save_dir, exist_ok=True)
+        self.index: Dict[int, Dict[str, Any]] = self._read_index()
+        if not self.index:
+            self._import_legacy_save()
+
+    @property
+    def save_file_path(self) -> str:
+        return self.slot_path(self.active_slot)
+
+    def slot_path(self, slot: int) -> str:
+        return os.path.join(self.save_dir, f"slot_{slot}.sav")
+
+    def journal_path(self, slot: int) -> str:
+        return os.path.join(self.save_dir, f"slot_{slot}.journal")
+
+    def _journal(self, slot: int) -> Journal:
+        journal = self._journals.get(slot)
+        if journal is None:
+            journal = self._journals[slot] = Journal(self.journal_path(slot))
+        return journal
+
+    def slot_info(self, slot: int) -> Optional[Dict[str, Any]]:
+        return self.index.get(slot)
+
+    def free_slot(self) -> int:
+        """First empty slot, or the one saved longest ago"""
+        for slot in range(1, self.slots + 1):
+            if slot not in self.index:
+                return slot
+        return min(self.index, key=lambda slot: self.index[slot].get("timestamp", 0))
+
+    @staticmethod
+    def slot_metadata(player_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "name": player_data.get("name", "Hero"),
+            "level": player_data.get("level", 1),
+            "gold": player_data.get("gold", 0),
+            "playtime": player_data.get("playtime", 0),
+            "timestamp": time.time()
+        }
+
+    def _read_index(self) -> Dict[int, Dict[str, Any]]:
         try:
-            save_data = {
-                "player": player_data
-            }
-            
-            with open(self.save_file_path, 'w') as f:
-                json.dump(save_data, f)
-                
+            with open(self.index_path, 'r') as f:
+                slots = json.load(f).get("slots", {})
+            return {int(slot): info for slot, info in slots.items() if 1 <= int(slot) <= self.slots}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _import_legacy_save(self) -> None:
+        """Move a save from before slots existed into slot 1"""
+        for path in self.legacy_file_paths:
+            if os.path.exists(path):
+                try:
+                    player_data = self._read_file(path)
+                except Exception as e:
+                    print(f"Error importing old save: {e}")
+                    return
+                self.save_game(player_data, slot=1)
+                return
+
+    def _record(self, slot: int, player_data: Dict[str, Any]) -> bytes:
+        """Update the slot's index entry and return the encoded index to write"""
+        self.index[slot] = self.slot_metadata(player_data)
+        slots = {str(slot): info for slot, info in sorted(self.index.items())}
+        return json.dumps({"version": INDEX_VERSION, "slots": slots}, indent=2).encode("utf-8")
+
+    def _write_slot(self, slot: int, player_data: Dict[str, Any], index: bytes, compact: bool = False) -> None:
+        """Append a delta against what the slot holds on disk, or compact into a new snapshot"""
+        with self._slot_lock:
+            journal = self._journal(slot)
+            baseline = self._baselines.pop(slot, None)
+            if isinstance(baseline, JournaledSave):
+                baseline = baseline.player_data()
+            if (compact or baseline is None or not journal.clean or journal.entries >= self.journal_entries
+                    or journal.size >= self.journal_bytes):
+                encoded = self.encode(player_data)
+                write_atomic(self.slot_path(slot), encoded)
+                journal.reset(snapshot_checksum(encoded), write_atomic)
+                self.snapshots += 1
+            else:
+                delta = diff_player_data(baseline, player_data)
+                if delta:
+                    journal.append(delta)
+                    self.deltas += 1
+            self._baselines[slot] = player_data
+            write_atomic(self.index_path, index)
+
+    def encode(self, player_data: Dict[str, Any]) -> bytes:
+        return encode_save(player_data, self.compression, self.level)
+
+    def save_game(self, player_data, combat_sequence=None, slot: Optional[int] = None):
+        slot = slot or self.active_slot
+        try:
+            self._write_slot(slot, player_data, self._record(slot, player_data))
             return True, "Game saved successfully!"
-                
+
         except Exception as e:
             error_msg = f"Error saving game: {e}"
             print(error_msg)
             return False, error_msg
-    
-    def load_game(self):
-        if not os.path.exists(self.save_file_path):
+
+    def save_game_async(self, player_data: Dict[str, Any], callback: Optional[SaveCallback] = None,
+                        slot: Optional[int] = None, compact: bool = False) -> None:
+        """
+        Queue a save on the writer thread. player_data must be a snapshot the caller no
+        longer mutates; encoding and disk I/O both happen off the calling thread.
+        compact writes a full snapshot even if a journal delta would do.
+        """
+        slot = slot or self.active_slot
+        index = self._record(slot, player_data)
+        self.writer.submit(self.slot_path(slot), lambda: self._write_slot(slot, player_data, index, compact), callback)
+
+    def poll(self) -> int:
+        return self.writer.poll()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self.writer.flush(timeout)
+
+    def _read_file(self, path: str) -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if is_binary_save(data):
+            return SaveFile(data).player_data()
+        return json.loads(data).get("player")
+
+    def open_save(self, slot: Optional[int] = None) -> JournaledSave:
+        """
+        A slot's snapshot with its journal replayed, sections still undecoded.
+        JSON snapshots are wrapped uncompressed.
+        """
+        slot = slot or self.active_slot
+        self.flush()
+        with open(self.slot_path(slot), 'rb') as f:
+            data = f.read()
+        if is_binary_save(data):
+            save = SaveFile(data)
+        else:
+            save = SaveFile(encode_save(json.loads(data).get("player"), "none"))
+
+        with self._slot_lock:
+            journaled = JournaledSave(save, self._journal(slot).read(snapshot_checksum(data)))
+            self._baselines[slot] = journaled
+        return journaled
+
+    def read_save(self, slot: Optional[int] = None) -> Dict[str, Any]:
+        """Player data from a slot, whichever format its snapshot is in"""
+        return self.open_save(slot).player_data()
+
+    def load_game(self, slot: Optional[int] = None):
+        slot = slot or self.active_slot
+        if not os.path.exists(self.slot_path(slot)):
             print("No save file found.")
             return False, None
-            
+
         try:
-            with open(self.save_file_path, 'r') as f:
-                save_data = json.load(f)
-                
-            player_data = save_data.get("player")
-                
+            player_data = self.read_save(slot)
+            self.active_slot = slot
             return True, player_data
-                
+
+        except Exception as e:
+            error_msg = f"Error loading game: {e}"
+            print(error_msg)
+            return False, None
+
+    def load_save(self, slot: Optional[int] = None):
+        """Like load_game, but returns the SaveFile so sections can be decoded on demand"""
+        slot = slot or self.active_slot
+        if not os.path.exists(self.slot_path(slot)):
+            print("No save file found.")
+            return False, None
+
+        try:
+            save = self.open_save(slot)
+            self.active_slot = slot
+            return True, save
+
         except Exception as e:
             error_msg = f"Error loading game: {e}"
             print(error_msg)
             return False, None
-    
+
     def save_exists(self):
-        return os.path.exists(self.save_file_path)
+        return bool(self.index)
+
+    def export_json(self, path: Optional[str] = None, slot: Optional[int] = None) -> str:
+        """Write a slot's save as indented JSON for debugging; returns the path written"""
+        slot = slot or self.active_slot
+        path = path or os.path.splitext(self.slot_path(slot))[0] + ".debug.json"
+        write_atomic(path, json.dumps({"player": self.read_save(slot)}, indent=2).encode("utf-8"))
+        return path
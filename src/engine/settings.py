@@ -0,0 +1,117 @@
+import os
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .save_manager import write_atomic
+
+DEBOUNCE_SECONDS = 0.5
+
+SettingsListener = Callable[[str, Any], None]
+
+
+class SettingsStore:
+    """
+    Every preference in memory under dotted keys such as "audio.master_volume".
+    set() applies a change at once and tells listeners; the file is rewritten atomically on a
+    background thread once no change has arrived for delay seconds, so a slider drag costs a
+    single write. flush() writes anything still pending right away.
+    """
+    def __init__(self, path: Optional[str] = None, delay: float = DEBOUNCE_SECONDS,
+                 legacy_paths: Optional[Dict[str, str]] = None):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.path = path or os.path.join(root, "data", "settings.json")
+        if legacy_paths is None and path is None:
+            legacy_paths = {"audio": os.path.join(root, "data", "audio_settings.json")}
+        self.delay = delay
+        self.writes = 0
+        self._listeners: Dict[str, List[SettingsListener]] = {}
+        self._changed = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self.values: Dict[str, Any] = self._read(legacy_paths or {})
+
+    def _read(self, legacy_paths: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                values = json.load(f)
+            if isinstance(values, dict):
+                return values
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error loading settings: {e}")
+
+        values = {}
+        for section, legacy_path in legacy_paths.items():
+            try:
+                with open(legacy_path, 'r') as f:
+                    values.update((f"{section}.{key}", value) for key, value in json.load(f).items())
+            except (OSError, ValueError, AttributeError):
+                pass
+        return values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._changed:
+            if key in self.values and self.values[key] == value:
+                return
+            self.values[key] = value
+            self._dirty_at = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+            self._changed.notify_all()
+        for listener in self._listeners.get(key, ()):
+            listener(key, value)
+
+    def subscribe(self, key: str, listener: SettingsListener) -> None:
+        self._listeners.setdefault(key, []).append(listener)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty_at is not None
+
+    def _run(self) -> None:
+        while True:
+            with self._changed:
+                while self._dirty_at is None:
+                    self._changed.wait()
+                remaining = self._dirty_at + self.delay - time.monotonic()
+                if remaining > 0:
+                    self._changed.wait(remaining)
+                    continue
+            self._write_pending()
+
+    def _write_pending(self) -> bool:
+        with self._write_lock:
+            with self._changed:
+                if self._dirty_at is None:
+                    return False
+                data = json.dumps(self.values, indent=2, sort_keys=True).encode("utf-8")
+                self._dirty_at = None
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                write_atomic(self.path, data)
+                self.writes += 1
+            except OSError as e:
+                print(f"Error saving settings: {e}")
+            return True
+
+    def flush(self) -> bool:
+        """Write pending changes now instead of waiting out the delay; True if anything was written"""
+        return self._write_pending()
+
+
+_settings: Optional[SettingsStore] = None
+
+
+def get_settings() -> SettingsStore:
+    global _settings
+    if _settings is None:
+        _settings = SettingsStore()
+    return _settings
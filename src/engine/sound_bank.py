@@ -0,0 +1,145 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+SOUND_CACHE_BYTES = 16 * 1024 * 1024
+
+JobCallback = Callable[[Any], None]
+
+
+def sound_bytes(sound) -> int:
+    """Memory held by a decoded sound, from its length and the mixer's sample format"""
+    frequency, size, channels = pygame.mixer.get_init() or (44100, -16, 2)
+    return int(sound.get_length() * frequency * channels * (abs(size) // 8))
+
+
+class SoundBank:
+    """
+    Decoded sound effects shared by everything that plays them, keyed by absolute path.
+    get() returns a cached sound or decodes it on the spot; preload() decodes on a background
+    thread instead. Once the decoded sounds exceed cache_bytes the least recently used are
+    dropped, to be decoded again if they are ever played. submit() runs other slow audio
+    work, such as opening a music stream, on the same thread; callbacks run in poll().
+    """
+    def __init__(self, cache_bytes: int = SOUND_CACHE_BYTES, loader: Callable[[str], Any] = None,
+                 measure: Callable[[Any], int] = sound_bytes):
+        self.cache_bytes = cache_bytes
+        self.loader = loader or pygame.mixer.Sound
+        self.measure = measure
+        self.cached_bytes = 0
+        self.decodes = 0
+        self.evictions = 0
+        self._sounds: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._loading: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._jobs: List[Tuple[Callable[[], Any], Optional[JobCallback]]] = []
+        self._results: List[Tuple[JobCallback, Any]] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self._sounds
+
+    def get(self, path: str):
+        """The decoded sound for path, or None if it is missing or cannot be decoded"""
+        path = os.path.abspath(path)
+        while True:
+            with self._lock:
+                entry = self._sounds.get(path)
+                if entry is not None:
+                    self._sounds.move_to_end(path)
+                    return entry[0]
+                loading = self._loading.get(path)
+                if loading is None:
+                    loading = self._loading[path] = threading.Event()
+                    break
+            loading.wait()
+            if path not in self._sounds:
+                return None
+        return self._decode(path, loading)
+
+    def _decode(self, path: str, loading: threading.Event):
+        sound = None
+        try:
+            if os.path.exists(path):
+                sound = self.loader(path)
+        except Exception as e:
+            print(f"Error loading sound {path}: {e}")
+
+        with self._lock:
+            if sound is not None:
+                size = self.measure(sound)
+                self._sounds[path] = (sound, size)
+                self.cached_bytes += size
+                self.decodes += 1
+                self._evict(path)
+            del self._loading[path]
+        loading.set()
+        return sound
+
+    def _evict(self, keep: str) -> None:
+        while self.cached_bytes > self.cache_bytes and len(self._sounds) > 1:
+            path = next(iter(self._sounds))
+            if path == keep:
+                break
+            _, size = self._sounds.pop(path)
+            self.cached_bytes -= size
+            self.evictions += 1
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """Decode sounds on the background thread so the first get() finds them ready"""
+        for path in paths:
+            self.submit(lambda path=path: self.get(path))
+
+    def submit(self, job: Callable[[], Any], callback: Optional[JobCallback] = None) -> None:
+        with self._condition:
+            self._jobs.append((job, callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sound-bank", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._jobs:
+                    self._condition.wait()
+                job, callback = self._jobs[0]
+
+            try:
+                result = job()
+            except Exception as e:
+                print(f"Error in audio job: {e}")
+                result = None
+
+            with self._condition:
+                self._jobs.pop(0)
+                if callback:
+                    self._results.append((callback, result))
+                self._condition.notify_all()
+
+    def poll(self) -> int:
+        """Run the callbacks of finished jobs; returns how many ran"""
+        with self._condition:
+            results, self._results = self._results, []
+        for callback, result in results:
+            callback(result)
+        return len(results)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted job has finished"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._jobs, timeout)
+
+
+_sound_bank: Optional[SoundBank] = None
+
+
+def get_sound_bank() -> SoundBank:
+    global _sound_bank
+    if _sound_bank is None:
+        _sound_bank = SoundBank()
+    return _sound_bank
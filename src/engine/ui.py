@@ -96,7 +96,7 @@ class UIManager:
             self.state_builder.build_character_ui(self.game.player)
                                    
         elif state == GameState.EQUIPMENT:
-            self.state_builder.build_equipment_ui(self.game.player)
+            self.state_builder.build_equipment_ui(self.game.player, equip_best_callback=self._equip_best)
                                    
         elif state == GameState.SKILLS:
             self.state_builder.build_skills_ui(self.game.player)
@@ -105,7 +105,9 @@ class UIManager:
             self.state_builder.build_combat_setup_ui(
                 add_skill_callback=self._add_skill_to_sequence,
                 remove_skill_callback=self._remove_skill_from_sequence,
-                start_combat_callback=self._start_combat
+                start_combat_callback=self._start_combat,
+                start_wave_callback=self._start_wave_combat,
+                send_expedition_callback=self._send_expedition
             )
                                    
         elif state == GameState.COMBAT:
@@ -120,6 +122,18 @@ class UIManager:
             
         elif state == GameState.SETTINGS:
             self.state_builder.build_settings_ui()
+            
+        elif state == GameState.LOAD_GAME:
+            self.state_builder.build_load_game_ui(load_slot_callback=self._load_slot)
+            
+        elif state == GameState.SHOP:
+            self.state_builder.build_shop_ui(
+                self.game.player,
+                sell_callback=self._sell_item,
+                buy_callback=self._buy_item,
+                sell_below_rarity_callback=self._sell_below_rarity,
+                sell_duplicates_callback=self._sell_duplicates
+            )
     
     def _start_new_game(self):
         from .game import GameState
@@ -127,7 +141,11 @@ class UIManager:
         self.game.change_state(GameState.CHARACTER)
         
     def _load_game(self):
-        if self.game.load_game():
+        from .game import GameState
+        self.game.change_state(GameState.LOAD_GAME)
+        
+    def _load_slot(self, slot):
+        if self.game.load_game(slot):
             self.game.audio_manager.play_ui_click()
             
     def show_notification(self, text, color=(255, 255, 255)):
@@ -152,6 +170,54 @@ class UIManager:
             self.game.combat_manager.start_new_battle()
             self.game.change_state(GameState.COMBAT)
             
+    def _start_wave_combat(self):
+        from .game import GameState
+        if self.game.combat_manager:
+            self.game.combat_manager.start_wave_battle()
+            self.game.change_state(GameState.COMBAT)
+            
+    def _send_expedition(self):
+        if self.game.player:
+            expedition = self.game.start_expedition()
+            self.show_notification(f"{expedition.name} set out on an expedition!")
+            self.build_ui_for_state(self.game.state)
+            
+    def _equip_best(self, objective):
+        if self.game.player:
+            equipped = self.game.player.inventory.equip_best(objective)
+            if equipped:
+                self.show_notification(f"Equipped {', '.join(item.name for item in equipped)}")
+            else:
+                self.show_notification("Already wearing the best gear")
+            self.build_ui_for_state(self.game.state)
+            
+    def _sell_item(self, item):
+        if self.game.player:
+            gold = self.game.player.inventory.get_shop().sell(item)
+            self.show_notification(f"Sold {item.name} for {gold} gold", (255, 215, 0))
+            self.build_ui_for_state(self.game.state)
+            
+    def _buy_item(self, template_id):
+        if self.game.player:
+            item = self.game.player.inventory.get_shop().buy(template_id)
+            if item:
+                self.show_notification(f"Bought {item.name}", (255, 215, 0))
+            else:
+                self.show_notification("Not enough gold", (255, 100, 100))
+            self.build_ui_for_state(self.game.state)
+            
+    def _sell_below_rarity(self, rarity):
+        if self.game.player:
+            gold = self.game.player.inventory.get_shop().sell_below_rarity(rarity)
+            self.show_notification(f"Sold items below {rarity} for {gold} gold", (255, 215, 0))
+            self.build_ui_for_state(self.game.state)
+            
+    def _sell_duplicates(self):
+        if self.game.player:
+            gold = self.game.player.inventory.get_shop().sell_duplicates()
+            self.show_notification(f"Sold duplicates for {gold} gold", (255, 215, 0))
+            self.build_ui_for_state(self.game.state)
+            
     def _add_skill_to_sequence(self, skill):
         from .game import GameState
         if self.game.player:
@@ -53,6 +53,11 @@ class ScrollableList(UIElement):
                             item.remove_callback()
                             return True
                             
+                        # Check for an item action button such as "Sell" or "Buy"
+                        if hasattr(item, 'action_callback') and rel_x > self.rect.width - 90:
+                            item.action_callback()
+                            return True
+                            
                         # If not clicking on a button, start dragging
                         self.dragging = True
                         self.drag_item = item_idx
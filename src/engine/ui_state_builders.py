@@ -73,6 +73,56 @@ class StateUIBuilder:
             lambda: exit_game_callback()
         ))
         
+    def build_load_game_ui(self, load_slot_callback):
+        import time
+        from .game import GameState
+        
+        # Title - positioned at 5% from top, 5% from left
+        title_y = int(self.screen_height * 0.05)
+        title_x = int(self.screen_width * 0.05)
+        self.ui_manager.add_element(Label(title_x, title_y, "Load Game", (255, 215, 0), 36))
+        
+        # One row per slot, filled from the save index only
+        save_manager = self.game.save_manager
+        info_x = int(self.screen_width * 0.1)
+        start_y = int(self.screen_height * 0.2)
+        slot_spacing = int(self.screen_height * 0.15)  # 15% of screen height
+        button_width = int(self.screen_width * 0.2)  # 20% of screen width
+        button_height = int(self.screen_height * 0.07)  # 7% of screen height
+        button_x = int(self.screen_width * 0.95 - button_width)  # 5% from right edge
+        
+        for slot in range(1, save_manager.slots + 1):
+            y_pos = start_y + (slot - 1) * slot_spacing
+            info = save_manager.slot_info(slot)
+            if info:
+                minutes = int(info.get("playtime", 0)) // 60
+                saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(info.get("timestamp", 0)))
+                self.ui_manager.add_element(Label(info_x, y_pos, f"Slot {slot}: {info.get('name', 'Hero')} - Level {info.get('level', 1)}", (220, 220, 220)))
+                self.ui_manager.add_element(Label(info_x, y_pos + 30, f"Gold: {info.get('gold', 0)}   Playtime: {minutes // 60}h {minutes % 60:02d}m   Saved: {saved}", (173, 216, 230), 20))
+            else:
+                self.ui_manager.add_element(Label(info_x, y_pos, f"Slot {slot}: Empty", (120, 120, 120)))
+            
+            load_btn = Button(
+                button_x,
+                y_pos,
+                button_width,
+                button_height,
+                "Load",
+                lambda slot=slot: load_slot_callback(slot)
+            )
+            load_btn.enabled = info is not None
+            self.ui_manager.add_element(load_btn)
+        
+        # Back button - positioned at bottom right
+        self.ui_manager.add_element(Button(
+            button_x, 
+            int(self.screen_height * 0.95 - button_height), 
+            button_width, 
+            button_height, 
+            "Back", 
+            lambda: self.game.change_state(GameState.MAIN_MENU)
+        ))
+    
     def build_character_ui(self, player):
         from .game import GameState
         
@@ -163,6 +213,16 @@ class StateUIBuilder:
             lambda: self.game.change_state(GameState.COMBAT_SETUP)
         ))
         
+        # Shop button
+        self.ui_manager.add_element(Button(
+            button_x, 
+            button_start_y + button_spacing * 4, 
+            button_width, 
+            button_height, 
+            "Shop", 
+            lambda: self.game.change_state(GameState.SHOP)
+        ))
+        
         # Save button - positioned at bottom right
         save_button_width = int(self.screen_width * 0.15)  # 15% of screen width
         save_button_height = int(self.screen_height * 0.06)  # 6% of screen height
@@ -178,7 +238,7 @@ class StateUIBuilder:
             lambda: self.game.save_game()
         ))
     
-    def build_equipment_ui(self, player):
+    def build_equipment_ui(self, player, equip_best_callback=None):
         from .game import GameState
         
         # Title - positioned at 5% from top, 5% from left
@@ -203,6 +263,116 @@ class StateUIBuilder:
         button_height = int(self.screen_height * 0.07)  # 7% of screen height
         button_x = int(self.screen_width * 0.95 - button_width)  # 5% from right edge
         
+        # Equip best buttons - stacked on the right below the back button
+        if equip_best_callback:
+            best_y = int(self.screen_height * 0.2)
+            for label, objective in (("Best Damage", "damage"), ("Best Defense", "defense"), ("Best DPS", "dps")):
+                self.ui_manager.add_element(Button(
+                    button_x,
+                    best_y,
+                    button_width,
+                    button_height,
+                    label,
+                    lambda objective=objective: equip_best_callback(objective)
+                ))
+                best_y += int(button_height * 1.3)
+        
+        self.ui_manager.add_element(Button(
+            button_x, 
+            title_y, 
+            button_width, 
+            button_height, 
+            "Back", 
+            lambda: self.game.change_state(GameState.CHARACTER)
+        ))
+    
+    def build_shop_ui(self, player, sell_callback, buy_callback, sell_below_rarity_callback=None, sell_duplicates_callback=None):
+        from .game import GameState
+        
+        # Title - positioned at 5% from top, 5% from left
+        title_y = int(self.screen_height * 0.05)
+        title_x = int(self.screen_width * 0.05)
+        self.ui_manager.add_element(Label(title_x, title_y, "Shop", (255, 215, 0), 36))
+        
+        if not player:
+            return
+        shop = player.inventory.get_shop()
+        
+        label_y = int(self.screen_height * 0.15)
+        left_x = int(self.screen_width * 0.05)
+        right_x = int(self.screen_width * 0.52)
+        list_y = int(self.screen_height * 0.2)
+        list_width = int(self.screen_width * 0.43)
+        list_height = int(self.screen_height * 0.5)
+        item_height = int(self.screen_height * 0.07)
+        
+        self.ui_manager.add_element(Label(int(self.screen_width * 0.3), title_y + 8, f"Gold: {player.gold}", (255, 215, 0)))
+        self.ui_manager.add_element(Label(left_x, label_y, "Your items:", (220, 220, 220)))
+        self.ui_manager.add_element(Label(right_x, label_y, "For sale:", (220, 220, 220)))
+        
+        class ShopListItem:
+            def __init__(self, name, price, action, action_callback, color):
+                self.name = f"{name} ({price}g)"
+                self.action = action
+                self.action_callback = action_callback
+                self.color = color
+            
+            def render_in_list(self, surface, x, y, width, height):
+                font = pygame.font.SysFont(None, 22)
+                text = font.render(self.name, True, (220, 220, 220))
+                surface.blit(text, (x + 10, y + (height - text.get_height()) // 2))
+                
+                button_width = 80
+                button_height = 30
+                button_x = x + width - button_width - 10
+                button_y = y + (height - button_height) // 2
+                pygame.draw.rect(surface, self.color, pygame.Rect(button_x, button_y, button_width, button_height))
+                
+                button_font = pygame.font.SysFont(None, 20)
+                button_text = button_font.render(self.action, True, (255, 255, 255))
+                surface.blit(button_text, (button_x + (button_width - button_text.get_width()) // 2,
+                                           button_y + (button_height - button_text.get_height()) // 2))
+        
+        # Inventory, most valuable first
+        sell_list = ScrollableList(left_x, list_y, list_width, list_height, item_height)
+        self.ui_manager.add_element(sell_list)
+        for item in shop.items_by_price():
+            name = f"{item.name} x{item.count}" if item.count > 1 else item.name
+            sell_list.add_item(ShopListItem(name, shop.sell_price(item), "Sell",
+                                            lambda item=item: sell_callback(item), (200, 150, 50)))
+        
+        # Stock, cheapest first
+        buy_list = ScrollableList(right_x, list_y, list_width, list_height, item_height)
+        self.ui_manager.add_element(buy_list)
+        for template in shop.stock:
+            buy_list.add_item(ShopListItem(template.name, shop.buy_price(template), "Buy",
+                                           lambda template_id=template.id: buy_callback(template_id), (100, 200, 100)))
+        
+        # Bulk sale buttons - below the inventory list
+        button_width = int(self.screen_width * 0.2)  # 20% of screen width
+        button_height = int(self.screen_height * 0.07)  # 7% of screen height
+        bulk_y = int(self.screen_height * 0.75)
+        if sell_below_rarity_callback and len(shop.rarities) > 1:
+            self.ui_manager.add_element(Button(
+                left_x,
+                bulk_y,
+                button_width,
+                button_height,
+                f"Sell {shop.rarities[0].title()} Gear",
+                lambda: sell_below_rarity_callback(shop.rarities[1])
+            ))
+        if sell_duplicates_callback:
+            self.ui_manager.add_element(Button(
+                left_x + int(button_width * 1.1),
+                bulk_y,
+                button_width,
+                button_height,
+                "Sell Duplicates",
+                sell_duplicates_callback
+            ))
+        
+        # Back button - positioned at top right
+        button_x = int(self.screen_width * 0.95 - button_width)  # 5% from right edge
         self.ui_manager.add_element(Button(
             button_x, 
             title_y, 
@@ -245,7 +415,8 @@ class StateUIBuilder:
             lambda: self.game.change_state(GameState.CHARACTER)
         ))
         
-    def build_combat_setup_ui(self, add_skill_callback, remove_skill_callback, start_combat_callback):
+    def build_combat_setup_ui(self, add_skill_callback, remove_skill_callback, start_combat_callback, start_wave_callback=None,
+                              send_expedition_callback=None):
         from .game import GameState
         
         # Title - positioned at 5% from top, 5% from left
@@ -359,6 +530,8 @@ class StateUIBuilder:
         button_height = int(self.screen_height * 0.07)  # 7% of screen height
         start_button_x = int(self.screen_width * 0.5 - button_width * 0.5)  # Centered horizontally
         start_button_y = int(self.screen_height * 0.85)  # 85% from top
+        if start_wave_callback:
+            start_button_x = int(self.screen_width * 0.5 - button_width * 1.1)  # Left of center, wave button on the right
         
         self.ui_manager.add_element(Button(
             start_button_x, 
@@ -369,6 +542,37 @@ class StateUIBuilder:
             lambda: start_combat_callback()
         ))
         
+        if start_wave_callback:
+            self.ui_manager.add_element(Button(
+                int(self.screen_width * 0.5 + button_width * 0.1), 
+                start_button_y, 
+                button_width, 
+                button_height, 
+                "Start Wave", 
+                lambda: start_wave_callback()
+            ))
+            
+        if send_expedition_callback:
+            expeditions = self.game.expeditions.background()
+            won = sum(expedition.victories for expedition in expeditions)
+            lost = sum(expedition.defeats for expedition in expeditions)
+            expedition_x = int(self.screen_width * 0.98 - button_width)  # 2% from right edge
+            self.ui_manager.add_element(Label(
+                expedition_x, 
+                start_button_y - int(self.screen_height * 0.05), 
+                f"Expeditions: {len(expeditions)} ({won} won / {lost} lost)", 
+                (180, 180, 220), 
+                20
+            ))
+            self.ui_manager.add_element(Button(
+                expedition_x, 
+                start_button_y, 
+                button_width, 
+                button_height, 
+                "Send Expedition", 
+                lambda: send_expedition_callback()
+            ))
+        
         # Back button - positioned at top right
         back_button_x = int(self.screen_width * 0.95 - button_width)  # 5% from right edge
         
@@ -451,18 +655,26 @@ class StateUIBuilder:
         enemy_section_x = int(self.screen_width * 0.65)
         enemy_section_y = int(self.screen_height * 0.15)
         
-        # Enemy info
-        self.ui_manager.add_element(Label(enemy_section_x, enemy_section_y, f"{enemy.name}", (220, 100, 100), 28))
+        # Enemy info - a wave is shown as one combined opponent
+        wave = self.game.combat_manager.wave
+        if wave:
+            enemy_name = f"Wave: {wave.alive_count()}/{wave.size} left"
+            enemy_hp, enemy_max_hp = wave.total_hp(), wave.total_max_hp()
+        else:
+            enemy_name = enemy.name
+            enemy_hp, enemy_max_hp = enemy.current_hp, enemy.max_hp
+            
+        self.ui_manager.add_element(Label(enemy_section_x, enemy_section_y, enemy_name, (220, 100, 100), 28))
         self.ui_manager.add_element(Label(
             enemy_section_x, 
             enemy_section_y + label_spacing, 
-            f"HP: {enemy.current_hp}/{enemy.max_hp}", 
+            f"HP: {enemy_hp}/{enemy_max_hp}", 
             (220, 100, 100)
         ))
         
         # Enemy HP bar
         enemy_hp_bar_y = enemy_section_y + label_spacing * 2
-        hp_ratio = max(0, min(1, enemy.current_hp / enemy.max_hp))
+        hp_ratio = max(0, min(1, enemy_hp / enemy_max_hp))
         enemy_hp_bar = self.ui_manager.add_element(ProgressBar(
             enemy_section_x, 
             enemy_hp_bar_y, 
@@ -474,7 +686,10 @@ class StateUIBuilder:
         
         # Enemy AP bar
         enemy_action = 0.0
-        if enemy and action_manager and hasattr(enemy, 'id'):
+        if wave:
+            front = wave.select()
+            enemy_action = float(wave.ap[front.indices[0]]) if front else 0.0
+        elif enemy and action_manager and hasattr(enemy, 'id'):
             enemy_action = action_manager.get_current_action(enemy.id)
         
         ap_ratio = max(0, min(1, enemy_action))
@@ -497,10 +712,9 @@ class StateUIBuilder:
         ))
         
         # Add enemy logo (hardcoded to goblin for now)
-        enemy_image = self.ui_manager.asset_manager.get_image(AssetType.ENEMY_GOBLIN)
+        image_size = int(self.screen_height * 0.12)  # 12% of screen height
+        enemy_image = self.ui_manager.asset_manager.get_scaled_image(AssetType.ENEMY_GOBLIN, (image_size, image_size))
         if enemy_image:
-            image_size = int(self.screen_height * 0.12)  # 12% of screen height
-            enemy_image = pygame.transform.scale(enemy_image, (image_size, image_size))
             image_x = enemy_section_x + int(section_width * 0.3)  # 30% of section width
             image_y = enemy_ap_bar_y + label_spacing * 1.5
             self.ui_manager.enemy_image = enemy_image
@@ -738,10 +952,6 @@ class StateUIBuilder:
         combat_manager = self.game.combat_manager
         victory = combat_manager.victory if combat_manager else False
         
-        # Automatically save the game when entering END_COMBAT state
-        if self.game.player:
-            self.game.save_game()
-        
         # Title - positioned at top center
         title_y = int(self.screen_height * 0.1)
         title_x = int(self.screen_width * 0.5)
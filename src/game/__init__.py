@@ -12,4 +12,12 @@ from .skill_effects import register_default_effects
 from .enemy_manager import EnemyManager
 from .enemy_database import EnemyDatabase
 from .skills import create_skill_manager
-from .combat import CombatManager
\ No newline at end of file
+from .combat import CombatManager
+from .combatant import CombatantCore
+from .wave import Wave
+from .item_store import ItemStore, ItemView
+from .item_database import ItemDatabase, ItemTemplate
+from .loot import LootGenerator
+from .loadout import LoadoutOptimizer
+from .shop import Shop
+from .combat_events import EventBus, SkillUsed, DamageDealt, CombatEnded
\ No newline at end of file
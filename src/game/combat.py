@@ -1,53 +1,28 @@
 from typing import Dict, List, Optional
 import random
 import time
-import os
-import pygame
 import logging
 from .player import Player
 from .enemy import Enemy, create_random_enemy
 from .skills import create_skill_manager
-from .items import Item, create_health_potion
-from .action_manager import ActionManager
+from .items import Item
+from .loot import get_loot_generator
 from .enemy_database import EnemyDatabase
 from .enemy_manager import EnemyManager
+from .wave import Wave, TARGET_FRONT, TARGET_RULES
+from .status_engine import get_status_engine
+from .combatant import Combatant
+from .combat_events import EventBus, SkillUsed, DamageDealt, CombatEnded
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Initialize sound variables
-attack_sound = None
-heal_sound = None
-sounds_initialized = False
-
-def init_combat_sounds():
-    """Initialize combat sound effects when pygame is ready"""
-    global attack_sound, heal_sound, sounds_initialized
-    
-    if sounds_initialized:
-        return
-        
-    try:
-        if pygame.mixer.get_init() is None:
-            return
-            
-        audio_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'audio')
-        attack_sound_path = os.path.join(audio_dir, 'attack.wav')
-        heal_sound_path = os.path.join(audio_dir, 'heal.wav')
-        
-        if os.path.exists(attack_sound_path):
-            attack_sound = pygame.mixer.Sound(attack_sound_path)
-        if os.path.exists(heal_sound_path):
-            heal_sound = pygame.mixer.Sound(heal_sound_path)
-            
-        sounds_initialized = True
-    except Exception as e:
-        print(f"Error loading combat sounds: {e}")
-
 class CombatManager:
-    def __init__(self, player: Player):
+    def __init__(self, player: Player, events: Optional[EventBus] = None):
         self.player = player
         self.current_enemy: Optional[Enemy] = None
+        self.wave: Optional[Wave] = None
+        self.wave_targeting = TARGET_FRONT
         self.turn = 0
         self.combat_log: List[str] = []
         self.combat_active = False
@@ -58,16 +33,17 @@ class CombatManager:
         self.last_action_time = 0
         self.last_tick_time = 0
         self.tick_interval = 1.0  # seconds between ticks for action points
-        self.action_manager = player.action_manager if hasattr(player, 'action_manager') else ActionManager()
+        self.scheduled = False  # action points are granted by an expedition scheduler instead
+        self.action_manager = player.action_manager
         
         # Create skill and enemy managers
         self.skill_manager = create_skill_manager()
         self.enemy_database = EnemyDatabase()
         self.enemy_manager = EnemyManager(self.enemy_database, self.skill_manager, self.action_manager)
         self.enemy_manager.load_all_enemies()
-        
-        # Initialize sounds
-        init_combat_sounds()
+        self.status_engine = get_status_engine()
+        self.loot = get_loot_generator()
+        self.events = events or EventBus()
         
 
         
@@ -75,6 +51,7 @@ class CombatManager:
         if enemy_level is None:
             enemy_level = max(1, self.player.level)
             
+        self.wave = None
         self.current_enemy = create_random_enemy(enemy_level, self.player.level)
         
         if not self.current_enemy:
@@ -95,7 +72,7 @@ class CombatManager:
             self.current_enemy = Enemy("goblin", enemy_data, self.skill_manager, self.action_manager)
             
         # Make sure the enemy uses the same action manager as the player
-        if self.action_manager and hasattr(self.current_enemy, 'id'):
+        if self.action_manager:
             logging.debug(f"Combat: Setting enemy {self.current_enemy.id} to use the combat manager's action manager")
             self.current_enemy.action_manager = self.action_manager
             
@@ -105,18 +82,34 @@ class CombatManager:
             self.action_manager.register_entity(self.current_enemy.id, 1.0)
             logging.debug(f"Combat: Action manager entities: {list(self.action_manager.action_consumers.keys())}")
             
+        self._begin(self.current_enemy.name)
+        
+    def start_wave_battle(self, size: int = 20, enemy_level: Optional[int] = None):
+        """Start a battle against a whole wave of enemies instead of a single one"""
+        if enemy_level is None:
+            enemy_level = max(1, self.player.level)
+            
+        self.current_enemy = None
+        self.wave = self.enemy_manager.create_random_wave(size, enemy_level, self.player.level)
+        if not self.wave:
+            self.start_new_battle(enemy_level)
+            return
+            
+        self._begin(f"a wave of {self.wave.size} enemies")
+        
+    def _begin(self, opponent_name: str):
         self.combat_active = True
         self.victory = False
         self.turn = 0
         self.player_sequence_index = 0
         self.combat_log = []
-        self.log_message(f"Battle started against {self.current_enemy.name}!")
+        self.log_message(f"Battle started against {opponent_name}!")
         
     def log_message(self, message: str):
         """Add a message to the combat log"""
         self.combat_log.append(message)
         
-    def update(self) -> bool:
+    def update(self, current_time: Optional[float] = None) -> bool:
         """
         Update the combat state, executing actions when appropriate
         Returns True if combat is finished
@@ -124,7 +117,8 @@ class CombatManager:
         if not self.combat_active:
             return True
             
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         if current_time - self.last_action_time < self.action_delay:
             return False  # Wait for delay
             
@@ -134,13 +128,19 @@ class CombatManager:
             self.end_combat(False)
             return True
             
-        if not self.current_enemy.is_alive():
+        if self.wave:
+            if self.wave.is_cleared():
+                self.log_message(f"All {self.wave.size} enemies have been defeated!")
+                self.end_combat(True)
+                return True
+        elif not self.current_enemy.is_alive():
             self.log_message(f"{self.current_enemy.name} has been defeated!")
             self.end_combat(True)
             return True
             
         # Update action points for both combatants
-        self._update_action_points()
+        if not self.scheduled:
+            self._update_action_points(current_time)
             
         # Execute the next action
         if self.turn % 2 == 0:
@@ -153,9 +153,10 @@ class CombatManager:
         self.turn += 1
         self.last_action_time = current_time
         
-        # Update skill cooldowns at end of turn pair
+        # Update skill cooldowns and effects at end of turn pair
         if self.turn % 2 == 0:
             self._update_cooldowns()
+            self._update_status_effects()
             
         return False
         
@@ -178,28 +179,39 @@ class CombatManager:
             # for enough AP to accumulate before taking action
             return
             
+        target = self._select_player_target(skill)
+        if target is None:
+            return
+            
         # Use the skill
-        result = skill.use(self.player, self.current_enemy)
+        result = skill.use(self.player, target)
         self.log_message(result["message"])
-        
-        # Play appropriate sound effect
-        if skill.name == "Healing":
-            if heal_sound:
-                heal_sound.play()
-        elif "attack" in skill.name.lower() or "strike" in skill.name.lower():
-            if attack_sound:
-                attack_sound.play()
+        self._publish_skill(skill, self.player, target, result)
         
         # Move to next skill in sequence
         self.player_sequence_index = (self.player_sequence_index + 1) % len(self.player.combat_sequence)
         
+    def _select_player_target(self, skill) -> Optional[Combatant]:
+        if not self.wave:
+            return self.current_enemy
+        rule = skill.targeting if skill.targeting in TARGET_RULES else self.wave_targeting
+        return self.wave.select(rule)
+        
     def _execute_enemy_action(self):
         """Execute the enemy's chosen action"""
+        if self.wave:
+            result = self.wave.resolve_attacks(self.player)
+            if result["attackers"]:
+                self.log_message(result["message"])
+                self.events.publish(SkillUsed("wave", self.player.name, "attack", "attack", result["message"]))
+                self.events.publish(DamageDealt("wave", self.player.name, result["damage"]))
+            return
+            
         if not self.current_enemy:
             return
             
         # Enemy AI chooses a skill based on available AP
-        skill = self.current_enemy.choose_action(self.player)
+        skill = self.current_enemy.choose_action(self.player, self.player_sequence_index)
         
         # If no skill is available (not enough AP or all on cooldown), wait
         if not skill:
@@ -210,9 +222,25 @@ class CombatManager:
         # Use the skill
         result = skill.use(self.current_enemy, self.player)
         self.log_message(result["message"])
+        self._publish_skill(skill, self.current_enemy, self.player, result)
         
-    def _update_action_points(self):
-        current_time = time.time()
+    def _publish_skill(self, skill, user: Combatant, target: Combatant, result: Dict):
+        self.events.publish(SkillUsed(user.name, target.name, skill.id, skill.sound, result["message"]))
+        damage = result.get("total_damage", result.get("damage"))
+        if damage:
+            self.events.publish(DamageDealt(user.name, target.name, damage))
+        
+    def generate_action_points(self, tick_time: float = 1.0):
+        """Grant action points to everyone in this battle for the given amount of time"""
+        if not self.action_manager:
+            return
+        self.action_manager.generate_action(self.player.id, tick_time)
+        if self.wave:
+            self.wave.generate_action(tick_time)
+        elif self.current_enemy:
+            self.action_manager.generate_action(self.current_enemy.id, tick_time)
+        
+    def _update_action_points(self, current_time: float):
         # Only update action points at the specified tick interval
         if current_time - self.last_tick_time < self.tick_interval:
             return
@@ -222,23 +250,20 @@ class CombatManager:
         
         logging.debug(f"Updating action points. Action manager exists: {self.action_manager is not None}")
         if self.action_manager:
-            if hasattr(self.player, 'id'):
-                logging.debug(f"Generating action for player {self.player.id}")
-                # Pass 1.0 as the tick time (representing 1 second)
-                self.action_manager.generate_action(self.player.id, 1.0)
-                player_action = self.action_manager.get_current_action(self.player.id)
-                logging.debug(f"Player action points: {player_action}")
-            else:
-                logging.debug("Player has no id attribute")
+            logging.debug(f"Generating action for player {self.player.id}")
+            # Pass 1.0 as the tick time (representing 1 second)
+            self.action_manager.generate_action(self.player.id, 1.0)
+            player_action = self.action_manager.get_current_action(self.player.id)
+            logging.debug(f"Player action points: {player_action}")
             
-            if self.current_enemy and hasattr(self.current_enemy, 'id'):
+            if self.wave:
+                self.wave.generate_action(1.0)
+            elif self.current_enemy:
                 logging.debug(f"Generating action for enemy {self.current_enemy.id}")
                 # Pass 1.0 as the tick time (representing 1 second)
                 self.action_manager.generate_action(self.current_enemy.id, 1.0)
                 enemy_action = self.action_manager.get_current_action(self.current_enemy.id)
                 logging.debug(f"Enemy action points: {enemy_action}")
-            elif self.current_enemy:
-                logging.debug("Enemy has no id attribute")
             else:
                 logging.debug("No current enemy")
         else:
@@ -255,6 +280,15 @@ class CombatManager:
             for skill in self.current_enemy.skills:
                 skill.update_cooldown()
                 
+    def _update_status_effects(self):
+        """Tick buffs and statuses once per round for everyone in the battle"""
+        for message in self.status_engine.tick_round([self.player, self.current_enemy]):
+            self.log_message(message)
+            
+        if self.wave:
+            for message in self.wave.end_round():
+                self.log_message(message)
+                
     def end_combat(self, victory: bool):
         """End the combat and determine rewards if victorious"""
         self.combat_active = False
@@ -262,13 +296,15 @@ class CombatManager:
         
         if victory:
             # Calculate rewards
-            exp_reward = self.current_enemy.level * 20
-            gold_reward = self.current_enemy.level * 10 + random.randint(0, 10)
-            
-            # Maybe reward an item (20% chance)
-            items_reward = []
-            if random.random() < 0.2:
-                items_reward.append(create_health_potion())
+            if self.wave:
+                wave_rewards = self.wave.rewards()
+                exp_reward = wave_rewards["experience"]
+                gold_reward = wave_rewards["gold"]
+                items_reward = self.loot.roll_kills(self.wave.defeated_by_kind())
+            else:
+                exp_reward = self.current_enemy.level * 20
+                gold_reward = self.current_enemy.level * 10 + random.randint(0, 10)
+                items_reward = self.loot.roll(self.current_enemy.id)
                 
             self.rewards = {
                 "experience": exp_reward,
@@ -280,15 +316,17 @@ class CombatManager:
             self.player.gold += gold_reward
             leveled_up = self.player.gain_experience(exp_reward)
             
-            for item in items_reward:
-                self.player.inventory.append(item)
+            found = ", ".join(item.name if item.count == 1 else f"{item.name} x{item.count}" for item in items_reward)
+            self.player.inventory.add_items(items_reward)
                 
             # Add reward info to log
             self.log_message(f"Gained {exp_reward} experience and {gold_reward} gold!")
             if items_reward:
-                self.log_message(f"Found: {', '.join(item.name for item in items_reward)}")
+                self.log_message(f"Found: {found}")
             if leveled_up:
                 self.log_message(f"{self.player.name} leveled up to level {self.player.level}!")
         else:
             # Player was defeated - maybe apply penalties in the future
-            pass
\ No newline at end of file
+            pass
+            
+        self.events.publish(CombatEnded(self.player.name, victory, self.rewards if victory else {}))
\ No newline at end of file
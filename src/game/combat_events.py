@@ -0,0 +1,79 @@
+"""
+Combat events.
+The simulation publishes what happened as small typed events; audio, UI and logging subscribe
+to the types they care about and receive everything published since the last dispatch() as one
+batch, so none of them runs on the combat hot path.
+"""
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger("combat")
+
+
+class SkillUsed(NamedTuple):
+    user: str
+    target: str
+    skill_id: str
+    sound: Optional[str]
+    message: str
+
+
+class DamageDealt(NamedTuple):
+    source: str
+    target: str
+    amount: int
+
+
+class CombatEnded(NamedTuple):
+    player: str
+    victory: bool
+    rewards: Dict[str, Any]
+
+
+Handler = Callable[[List[Any]], None]
+
+
+class EventBus:
+    """
+    Queue of published events. Events of a type nobody subscribed to are dropped on publish,
+    so a battle without listeners pays almost nothing for its events.
+    """
+    def __init__(self):
+        self._handlers: Dict[type, List[Handler]] = {}
+        self._queue: List[Any] = []
+        self.published = 0
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: type, handler: Handler) -> None:
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(event_type, None)
+
+    def publish(self, event: Any) -> None:
+        if type(event) in self._handlers:
+            self._queue.append(event)
+            self.published += 1
+
+    def dispatch(self) -> int:
+        """Hand every queued event to its subscribers, one batch per event type; returns the count"""
+        if not self._queue:
+            return 0
+        queue, self._queue = self._queue, []
+        batches: Dict[type, List[Any]] = {}
+        for event in queue:
+            batches.setdefault(type(event), []).append(event)
+        for event_type, events in batches.items():
+            for handler in list(self._handlers.get(event_type, ())):
+                handler(events)
+        return len(queue)
+
+
+def log_events(events: List[Any]) -> None:
+    """Subscriber that writes a batch of events to the combat logger"""
+    if logger.isEnabledFor(logging.DEBUG):
+        for event in events:
+            logger.debug("%s", event)
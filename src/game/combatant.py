@@ -0,0 +1,351 @@
+"""
+Compact, slotted combat state shared by players and enemies.
+Stats live in fixed slots and buffs/status effects are stored as small-integer codes
+in parallel arrays, exposed through dict-like views for the existing APIs.
+"""
+from typing import Dict, List, Any, Optional, Iterator, Mapping, Tuple, Protocol, runtime_checkable
+from collections.abc import MutableMapping
+from array import array
+from bisect import bisect_right
+
+STAT_NAMES = ("strength", "dexterity", "constitution", "intelligence", "wisdom")
+
+_effect_codes: Dict[str, int] = {}
+_effect_names: List[str] = []
+
+def effect_code(name: str) -> int:
+    """Get the small-integer code for a buff or status name, registering it on first use"""
+    code = _effect_codes.get(name)
+    if code is None:
+        code = len(_effect_names)
+        _effect_codes[name] = code
+        _effect_names.append(name)
+    return code
+
+def effect_name(code: int) -> str:
+    return _effect_names[code]
+
+
+class EffectList:
+    """
+    Active effects of one kind (buffs or statuses) stored as parallel arrays sorted by expiry.
+    Expiries are absolute round numbers, so advancing a round only drops the expired prefix.
+    """
+    __slots__ = ("codes", "values", "expiries", "round")
+
+    def __init__(self):
+        self.codes = array("H")
+        self.values: List[Any] = []
+        self.expiries = array("i")
+        self.round = 0
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def index(self, code: int) -> int:
+        try:
+            return self.codes.index(code)
+        except ValueError:
+            return -1
+
+    def get_value(self, code: int, default: Any = 0) -> Any:
+        i = self.index(code)
+        return self.values[i] if i >= 0 else default
+
+    def duration(self, i: int) -> int:
+        return self.expiries[i] - self.round
+
+    def set(self, code: int, value: Any, duration: int) -> None:
+        i = self.index(code)
+        if i >= 0:
+            self._delete(i)
+        expiry = self.round + duration
+        i = bisect_right(self.expiries, expiry)
+        self.codes.insert(i, code)
+        self.values.insert(i, value)
+        self.expiries.insert(i, expiry)
+
+    def remove(self, code: int) -> bool:
+        i = self.index(code)
+        if i < 0:
+            return False
+        self._delete(i)
+        return True
+
+    def _delete(self, i: int) -> None:
+        del self.codes[i]
+        del self.values[i]
+        del self.expiries[i]
+
+    def advance(self) -> List[int]:
+        """Count down one round and return the codes that expired"""
+        self.round += 1
+        count = bisect_right(self.expiries, self.round)
+        if not count:
+            return []
+        expired = self.codes[:count].tolist()
+        del self.codes[:count]
+        del self.values[:count]
+        del self.expiries[:count]
+        return expired
+
+    def clear(self) -> None:
+        del self.codes[:]
+        del self.values[:]
+        del self.expiries[:]
+
+
+class EffectEntry:
+    """Live dict-style handle to one active effect, so existing code can read and write 'value' and 'duration'."""
+    __slots__ = ("effects", "code")
+
+    def __init__(self, effects: EffectList, code: int):
+        self.effects = effects
+        self.code = code
+
+    def __getitem__(self, key: str) -> Any:
+        i = self.effects.index(self.code)
+        if i < 0:
+            raise KeyError(key)
+        if key == "value":
+            return self.effects.values[i]
+        if key == "duration":
+            return self.effects.duration(i)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        i = self.effects.index(self.code)
+        if i < 0:
+            raise KeyError(key)
+        if key == "value":
+            self.effects.values[i] = value
+        elif key == "duration":
+            self.effects.set(self.code, self.effects.values[i], int(value))
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in ("value", "duration")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self["value"], "duration": self["duration"]}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, EffectEntry):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+class EffectView(MutableMapping):
+    """Dict-like view of a combatant's buffs or status effects keyed by name."""
+    __slots__ = ("owner", "slot")
+
+    def __init__(self, owner: 'CombatantCore', slot: str):
+        self.owner = owner
+        self.slot = slot
+
+    def _effects(self, create: bool = False) -> Optional[EffectList]:
+        effects = getattr(self.owner, self.slot)
+        if effects is None and create:
+            effects = EffectList()
+            setattr(self.owner, self.slot, effects)
+        return effects
+
+    def __getitem__(self, name: str) -> EffectEntry:
+        effects = self._effects()
+        code = _effect_codes.get(name)
+        if effects is None or code is None or effects.index(code) < 0:
+            raise KeyError(name)
+        return EffectEntry(effects, code)
+
+    def __setitem__(self, name: str, data: Mapping) -> None:
+        self._effects(create=True).set(effect_code(name), data.get("value", 0), int(data.get("duration", 0)))
+
+    def __delitem__(self, name: str) -> None:
+        effects = self._effects()
+        code = _effect_codes.get(name)
+        if effects is None or code is None or not effects.remove(code):
+            raise KeyError(name)
+
+    def __contains__(self, name) -> bool:
+        effects = self._effects()
+        code = _effect_codes.get(name)
+        return effects is not None and code is not None and effects.index(code) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        effects = self._effects()
+        if effects is None:
+            return iter(())
+        return iter([_effect_names[code] for code in effects.codes])
+
+    def __len__(self) -> int:
+        effects = self._effects()
+        return len(effects) if effects is not None else 0
+
+    def clear(self) -> None:
+        effects = self._effects()
+        if effects is not None:
+            effects.clear()
+
+    def replace(self, data: Mapping) -> None:
+        entries = [(name, {"value": entry.get("value", 0), "duration": entry.get("duration", 0)})
+                   for name, entry in data.items()]
+        self.clear()
+        for name, entry in entries:
+            self[name] = entry
+
+    def __repr__(self) -> str:
+        return repr({name: self[name].to_dict() for name in self})
+
+
+class StatsView(MutableMapping):
+    """Dict-like view over the fixed stat slots of a combatant."""
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: 'CombatantCore'):
+        self.owner = owner
+
+    def __getitem__(self, stat: str) -> int:
+        if stat not in STAT_NAMES:
+            raise KeyError(stat)
+        return getattr(self.owner, stat)
+
+    def __setitem__(self, stat: str, value: int) -> None:
+        if stat not in STAT_NAMES:
+            raise KeyError(stat)
+        setattr(self.owner, stat, value)
+
+    def __delitem__(self, stat: str) -> None:
+        raise TypeError("Stats cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STAT_NAMES)
+
+    def __len__(self) -> int:
+        return len(STAT_NAMES)
+
+    def copy(self) -> Dict[str, int]:
+        return self.owner.get_base_stats()
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+@runtime_checkable
+class Combatant(Protocol):
+    """
+    Attributes every skill user and target provides directly, so skills and combat
+    code read them without hasattr probes or attribute forwarding. Player, Enemy and
+    WaveTarget (a wave's selected members) all satisfy it.
+    """
+    id: str
+    name: str
+    current_hp: int
+    max_hp: int
+    action_manager: Optional[Any]
+    energy: Optional[int]
+    equipment: Optional[Dict[str, Any]]
+    buffs: MutableMapping
+    status_effects: MutableMapping
+
+    def get_weapon(self) -> Optional[Any]: ...
+
+    def get_stat(self, stat: str) -> int: ...
+
+    def get_stats(self) -> Dict[str, int]: ...
+
+    def take_damage(self, amount: int) -> int: ...
+
+    def heal(self, amount: int) -> int: ...
+
+    def is_alive(self) -> bool: ...
+
+
+class CombatantCore:
+    """
+    Slotted state shared by every combatant: level, fixed-position stats, HP and
+    compact buff/status arrays. Enemy and Player build their public APIs on top of it.
+    """
+    __slots__ = ("level", "strength", "dexterity", "constitution", "intelligence", "wisdom",
+                 "max_hp", "current_hp", "_buff_list", "_status_list")
+    action_manager = None
+    energy: Optional[int] = None
+    equipment: Optional[Dict[str, Any]] = None
+
+    def _init_core(self, level: int, stats: Mapping[str, int]) -> None:
+        self.level = level
+        self.strength = stats.get("strength", 0)
+        self.dexterity = stats.get("dexterity", 0)
+        self.constitution = stats.get("constitution", 0)
+        self.intelligence = stats.get("intelligence", 0)
+        self.wisdom = stats.get("wisdom", 0)
+        self.max_hp = 0
+        self.current_hp = 0
+        self._buff_list: Optional[EffectList] = None
+        self._status_list: Optional[EffectList] = None
+
+    def get_base_stats(self) -> Dict[str, int]:
+        return {
+            "strength": self.strength,
+            "dexterity": self.dexterity,
+            "constitution": self.constitution,
+            "intelligence": self.intelligence,
+            "wisdom": self.wisdom
+        }
+
+    def get_stat(self, stat: str) -> int:
+        return getattr(self, stat) if stat in STAT_NAMES else 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return self.get_base_stats()
+
+    def get_weapon(self) -> Optional[Any]:
+        return None
+
+    def get_effect_lists(self) -> Tuple[Optional[EffectList], Optional[EffectList]]:
+        return self._buff_list, self._status_list
+
+    def get_buff_value(self, buff_type: str, default: Any = 0) -> Any:
+        buffs = self._buff_list
+        if buffs is None or not buffs.codes:
+            return default
+        code = _effect_codes.get(buff_type)
+        if code is None:
+            return default
+        return buffs.get_value(code, default)
+
+    @property
+    def base_stats(self) -> StatsView:
+        return StatsView(self)
+
+    @base_stats.setter
+    def base_stats(self, stats: Mapping[str, int]) -> None:
+        for stat in STAT_NAMES:
+            setattr(self, stat, stats.get(stat, 0))
+
+    @property
+    def buffs(self) -> EffectView:
+        return EffectView(self, "_buff_list")
+
+    @buffs.setter
+    def buffs(self, data: Mapping) -> None:
+        EffectView(self, "_buff_list").replace(data)
+
+    @property
+    def status_effects(self) -> EffectView:
+        return EffectView(self, "_status_list")
+
+    @status_effects.setter
+    def status_effects(self, data: Mapping) -> None:
+        EffectView(self, "_status_list").replace(data)
@@ -0,0 +1,386 @@
+"""
+Search-based decision making for enemies with "smart" behavior.
+Runs a depth-limited expectimax over cheap combat snapshots under a time and node budget.
+"""
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+import time
+
+from .skill_effects import apply_weapon_scaling, apply_stat_scaling
+
+DEFAULT_TIME_BUDGET = 0.002
+DEFAULT_NODE_BUDGET = 600
+DEFAULT_MAX_DEPTH = 6
+DEFAULT_CACHE_SIZE = 4096
+
+WAIT = -1
+WIN_SCORE = 1000.0
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class SkillModel:
+    """Expected outcome of one skill for a specific user."""
+    __slots__ = ("skill_id", "action_cost", "cooldown", "hits", "healing", "guard", "guard_turns", "statuses")
+
+    def __init__(self, skill, user):
+        self.skill_id = skill.id
+        self.action_cost = skill.action_cost
+        self.cooldown = skill.cooldown
+        hits = []
+        self.healing = 0
+        self.guard = 0
+        self.guard_turns = 0
+        statuses = []
+
+        for effect in skill.effects:
+            effect_type = effect.get("type")
+            params = effect.get("params", {})
+            if effect_type == "damage":
+                hits.append(max(1, int(_raw_value(user, params) * _mean_variance(params, 0.8, 1.2))))
+            elif effect_type == "multi_hit":
+                raw = _raw_value(user, params) * _mean_variance(params, 0.8, 1.2)
+                scaling = params.get("damage_scaling", 1.0)
+                for hit in range(expected_hits(params)):
+                    hits.append(max(1, int(raw * scaling ** hit)))
+            elif effect_type == "healing":
+                base = apply_stat_scaling(user, params.get("base_value", 0), params)
+                self.healing += max(1, int(base * _mean_variance(params, 0.9, 1.1)))
+            elif effect_type == "buff" and params.get("buff_type", "defense") == "defense":
+                self.guard = params.get("value", 1)
+                self.guard_turns = params.get("duration", 3)
+            elif effect_type == "status":
+                statuses.append((
+                    params.get("status_type", "poison"),
+                    params.get("value", 1),
+                    params.get("duration", 3),
+                    params.get("chance", 1.0)
+                ))
+
+        self.hits = tuple(hits)
+        self.statuses = tuple(statuses)
+
+    def signature(self) -> Tuple:
+        return (self.skill_id, self.hits, self.healing, self.guard)
+
+
+def _raw_value(user, params) -> float:
+    base = params.get("base_value", 0)
+    base = apply_weapon_scaling(user, base, params)
+    return apply_stat_scaling(user, base, params)
+
+
+def _mean_variance(params, default_min: float, default_max: float) -> float:
+    return (params.get("variance_min", default_min) + params.get("variance_max", default_max)) / 2
+
+
+def expected_hits(params) -> int:
+    """Number of hits a multi_hit effect lands on average, rounded to whole hits"""
+    min_hits = params.get("min_hits", 1)
+    max_hits = params.get("max_hits", 1)
+    if min_hits == max_hits:
+        return min_hits
+    return max(min_hits, int(round(max_hits * params.get("hit_chance", 1.0))))
+
+
+class CombatantSnapshot:
+    """Cheap, copyable view of the combat-relevant state of one combatant."""
+    __slots__ = ("hp", "max_hp", "ap", "ap_rate", "defense", "guard", "guard_turns",
+                 "poison", "poison_turns", "regen", "regen_turns", "stun_turns",
+                 "slow", "slow_turns", "cooldowns", "sequence_index")
+
+    @classmethod
+    def capture(cls, combatant, skills: List[Any], sequence_index: int = 0) -> 'CombatantSnapshot':
+        snapshot = cls()
+        snapshot.hp = combatant.current_hp
+        snapshot.max_hp = max(1, combatant.max_hp)
+        snapshot.defense = _base_defense(combatant)
+
+        action_manager = getattr(combatant, "action_manager", None)
+        if action_manager:
+            snapshot.ap = action_manager.get_current_action(combatant.id)
+            snapshot.ap_rate = action_manager.get_action_rate(combatant.id)
+        else:
+            snapshot.ap = float("inf")
+            snapshot.ap_rate = 0.0
+
+        buffs = getattr(combatant, "buffs", None) or {}
+        guard = buffs.get("defense")
+        snapshot.guard = guard["value"] if guard else 0
+        snapshot.guard_turns = guard["duration"] if guard else 0
+
+        statuses = getattr(combatant, "status_effects", None) or {}
+        snapshot.poison, snapshot.poison_turns = _status_pair(statuses, "poison", 0)
+        snapshot.regen, snapshot.regen_turns = _status_pair(statuses, "regeneration", 0)
+        snapshot.slow, snapshot.slow_turns = _status_pair(statuses, "slowed", 0.5)
+        snapshot.stun_turns = _status_pair(statuses, "stunned", 0)[1]
+
+        snapshot.cooldowns = tuple(skill.current_cooldown if skill else 0 for skill in skills)
+        snapshot.sequence_index = sequence_index
+        return snapshot
+
+    def copy(self) -> 'CombatantSnapshot':
+        clone = CombatantSnapshot.__new__(CombatantSnapshot)
+        for name in CombatantSnapshot.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def key(self) -> Tuple:
+        ap = round(self.ap, 1) if self.ap != float("inf") else -1
+        return (self.hp, ap, self.guard, self.guard_turns, self.poison, self.poison_turns,
+                self.regen, self.regen_turns, self.stun_turns, self.slow, self.slow_turns,
+                self.cooldowns, self.sequence_index)
+
+
+def _base_defense(combatant) -> int:
+    inventory = getattr(combatant, "inventory", None)
+    if inventory is not None and hasattr(inventory, "get_defense"):
+        return inventory.get_defense()
+    return getattr(combatant, "defense", 0)
+
+
+def _status_pair(statuses: Dict[str, Any], status_type: str, default_value) -> Tuple[Any, int]:
+    data = statuses.get(status_type)
+    if not data:
+        return 0, 0
+    return data.get("value", default_value), data.get("duration", 0)
+
+
+class SmartPlanner:
+    """
+    Chooses enemy skills by expectimax search over the enemy's usable skills against
+    the player's known combat sequence. Results are cached by a compact state hash.
+    """
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET, node_budget: int = DEFAULT_NODE_BUDGET,
+                 max_depth: int = DEFAULT_MAX_DEPTH, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.max_depth = max_depth
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[int, int]" = OrderedDict()
+        self.nodes = 0
+        self.last_depth = 0
+        self._deadline = 0.0
+        self._enforce_budget = False
+
+    def choose(self, enemy, player, available_skills: List[Any], player_sequence_index: int = 0) -> Optional[Any]:
+        """Return the skill to use now, or None if waiting for more action points is better"""
+        enemy_skills = list(enemy.skills)
+        player_sequence = list(getattr(player, "combat_sequence", None) or [])
+
+        enemy_models = [SkillModel(skill, enemy) for skill in enemy_skills]
+        player_models = [SkillModel(skill, player) if skill else None for skill in player_sequence]
+
+        if player_sequence:
+            player_sequence_index %= len(player_sequence)
+        enemy_state = CombatantSnapshot.capture(enemy, enemy_skills)
+        player_state = CombatantSnapshot.capture(player, player_sequence, player_sequence_index)
+
+        available_ids = {skill.id for skill in available_skills}
+        candidates = [i for i, model in enumerate(enemy_models) if model.skill_id in available_ids]
+        candidates.append(WAIT)
+
+        state_hash = hash((
+            enemy.id,
+            tuple(model.signature() for model in enemy_models),
+            tuple(model.signature() if model else None for model in player_models),
+            tuple(candidates),
+            enemy_state.key(),
+            player_state.key()
+        ))
+
+        cached = self.cache.get(state_hash)
+        if cached is not None:
+            self.cache.move_to_end(state_hash)
+            choice = cached
+        else:
+            choice = self._iterative_deepening(enemy_state, player_state, enemy_models, player_models, candidates)
+            self.cache[state_hash] = choice
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+        if choice == WAIT:
+            return None
+        chosen_id = enemy_models[choice].skill_id
+        return next((skill for skill in available_skills if skill.id == chosen_id), None)
+
+    def _iterative_deepening(self, enemy_state, player_state, enemy_models, player_models, candidates) -> int:
+        self.nodes = 0
+        self._deadline = time.perf_counter() + self.time_budget
+        self._enforce_budget = False
+        best = candidates[0]
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._search_root(enemy_state, player_state, enemy_models, player_models, candidates, depth)
+                self.last_depth = depth
+            except _BudgetExceeded:
+                break
+            self._enforce_budget = True
+
+        return best
+
+    def _search_root(self, enemy_state, player_state, enemy_models, player_models, candidates, depth) -> int:
+        best_choice = candidates[0]
+        best_value = float("-inf")
+        for choice in candidates:
+            value = self._choice_value(enemy_state, player_state, enemy_models, player_models, choice, depth)
+            if value > best_value:
+                best_value = value
+                best_choice = choice
+        return best_choice
+
+    def _max_value(self, enemy_state, player_state, enemy_models, player_models, depth) -> float:
+        if depth == 0 or enemy_state.hp <= 0 or player_state.hp <= 0:
+            return self._evaluate(enemy_state, player_state)
+
+        best_value = float("-inf")
+        for choice in self._enemy_options(enemy_state, enemy_models):
+            value = self._choice_value(enemy_state, player_state, enemy_models, player_models, choice, depth)
+            if value > best_value:
+                best_value = value
+        return best_value
+
+    def _choice_value(self, enemy_state, player_state, enemy_models, player_models, choice, depth) -> float:
+        self._count_node()
+        expected = 0.0
+        enemy_model = enemy_models[choice] if choice != WAIT else None
+
+        for probability, enemy_after, player_after in self._apply(enemy_state, player_state, enemy_model, choice):
+            if player_after.hp <= 0 or enemy_after.hp <= 0:
+                expected += probability * self._evaluate(enemy_after, player_after)
+                continue
+
+            player_choice = self._player_option(player_after, player_models)
+            player_model = player_models[player_choice] if player_choice != WAIT else None
+            for reply_probability, player_final, enemy_final in self._apply(player_after, enemy_after, player_model, player_choice):
+                if player_choice != WAIT:
+                    player_final.sequence_index = (player_choice + 1) % len(player_models)
+                _end_round(enemy_final)
+                _end_round(player_final)
+                value = self._max_value(enemy_final, player_final, enemy_models, player_models, depth - 1)
+                expected += probability * reply_probability * value
+
+        return expected
+
+    def _enemy_options(self, state: CombatantSnapshot, models: List[SkillModel]) -> List[int]:
+        if state.stun_turns > 0:
+            return [WAIT]
+        options = [i for i, model in enumerate(models)
+                   if state.cooldowns[i] == 0 and state.ap >= model.action_cost]
+        options.append(WAIT)
+        return options
+
+    def _player_option(self, state: CombatantSnapshot, models: List[Optional[SkillModel]]) -> int:
+        if not models or state.stun_turns > 0:
+            return WAIT
+        index = state.sequence_index
+        model = models[index]
+        if model is None or state.cooldowns[index] > 0 or state.ap < model.action_cost:
+            return WAIT
+        return index
+
+    def _apply(self, actor: CombatantSnapshot, target: CombatantSnapshot,
+               model: Optional[SkillModel], index: int) -> List[Tuple[float, CombatantSnapshot, CombatantSnapshot]]:
+        actor = actor.copy()
+        target = target.copy()
+        if model is None:
+            return [(1.0, actor, target)]
+
+        actor.ap -= model.action_cost
+        cooldowns = list(actor.cooldowns)
+        cooldowns[index] = model.cooldown
+        actor.cooldowns = tuple(cooldowns)
+
+        reduction = target.defense + target.guard
+        for raw in model.hits:
+            target.hp -= max(1, raw - reduction)
+        target.hp = max(0, target.hp)
+
+        if model.healing:
+            actor.hp = min(actor.max_hp, actor.hp + model.healing)
+
+        if model.guard:
+            target.guard = model.guard
+            target.guard_turns = model.guard_turns
+
+        outcomes = [(1.0, actor, target)]
+        for status in model.statuses:
+            chance = status[3]
+            branched = []
+            for probability, outcome_actor, outcome_target in outcomes:
+                if chance < 1.0:
+                    branched.append((probability * (1.0 - chance), outcome_actor, outcome_target))
+                    outcome_actor = outcome_actor.copy()
+                    outcome_target = outcome_target.copy()
+                _apply_status(outcome_target, status)
+                branched.append((probability * min(1.0, chance), outcome_actor, outcome_target))
+            outcomes = branched
+        return outcomes
+
+    def _evaluate(self, enemy_state: CombatantSnapshot, player_state: CombatantSnapshot) -> float:
+        if player_state.hp <= 0:
+            return WIN_SCORE
+        if enemy_state.hp <= 0:
+            return -WIN_SCORE
+
+        player_pending = player_state.poison * player_state.poison_turns
+        enemy_pending = enemy_state.poison * enemy_state.poison_turns
+        enemy_ratio = (enemy_state.hp - enemy_pending) / enemy_state.max_hp
+        player_ratio = (player_state.hp - player_pending) / player_state.max_hp
+        return enemy_ratio - player_ratio
+
+    def _count_node(self) -> None:
+        self.nodes += 1
+        if self._enforce_budget and (self.nodes > self.node_budget or time.perf_counter() > self._deadline):
+            raise _BudgetExceeded()
+
+
+def _apply_status(target: CombatantSnapshot, status: Tuple) -> None:
+    status_type, value, duration, _ = status
+    if status_type == "poison":
+        target.poison, target.poison_turns = value, duration
+    elif status_type == "regeneration":
+        target.regen, target.regen_turns = value, duration
+    elif status_type == "stunned":
+        target.stun_turns = duration
+    elif status_type == "slowed":
+        target.slow, target.slow_turns = value, duration
+
+
+def _end_round(state: CombatantSnapshot) -> None:
+    rate = state.ap_rate
+    if state.stun_turns > 0:
+        rate = 0.0
+        state.stun_turns -= 1
+    elif state.slow_turns > 0:
+        rate *= max(0.0, 1.0 - state.slow)
+        state.slow_turns -= 1
+    state.ap += rate
+
+    if any(state.cooldowns):
+        state.cooldowns = tuple(cooldown - 1 if cooldown > 0 else 0 for cooldown in state.cooldowns)
+
+    if state.poison_turns > 0:
+        state.hp = max(0, state.hp - state.poison)
+        state.poison_turns -= 1
+    if state.regen_turns > 0:
+        state.hp = min(state.max_hp, state.hp + state.regen)
+        state.regen_turns -= 1
+    if state.guard_turns > 0:
+        state.guard_turns -= 1
+        if state.guard_turns == 0:
+            state.guard = 0
+
+
+_planners: Dict[str, SmartPlanner] = {}
+
+def get_planner(enemy_id: str) -> SmartPlanner:
+    """Get the shared planner for an enemy type so its decision cache survives between battles"""
+    planner = _planners.get(enemy_id)
+    if planner is None:
+        planner = SmartPlanner()
+        _planners[enemy_id] = planner
+    return planner
@@ -6,24 +6,31 @@ from .skill import Skill
 from .skill_manager import SkillManager
 from .skill_database import SkillDatabase
 from .action_manager import ActionManager
+from .enemy_ai import get_planner
+from .combatant import CombatantCore
+from .wave import Wave
+from .status_engine import get_status_engine
 
-class Enemy:
+class Enemy(CombatantCore):
     """
     Represents an enemy created from data.
     """
+    __slots__ = ("id", "name", "damage", "defense", "skill_manager", "skills", "action_manager",
+                 "behavior", "skill_weights", "skill_sequence", "current_sequence_index")
+    
     def __init__(self, enemy_id: str, data: Dict[str, Any], skill_manager: SkillManager, action_manager: Optional[ActionManager] = None):
         self.id = enemy_id
         self.name = data["name"]
-        self.level = data.get("level", 1)
+        level = data.get("level", 1)
         
         # Stats
-        self.base_stats = data.get("base_stats", {
-            "strength": 8 + self.level,
-            "dexterity": 8 + self.level,
-            "constitution": 8 + self.level,
-            "intelligence": 8 + self.level,
-            "wisdom": 8 + self.level
-        })
+        self._init_core(level, data.get("base_stats", {
+            "strength": 8 + level,
+            "dexterity": 8 + level,
+            "constitution": 8 + level,
+            "intelligence": 8 + level,
+            "wisdom": 8 + level
+        }))
         
         # HP and combat stats
         self.max_hp = self._calculate_max_hp()
@@ -46,10 +53,6 @@ class Enemy:
         if not self.skills:
             logging.warning(f"Enemy {self.name} (ID: {self.id}) has no defined skills")
         
-        # Combat state
-        self.buffs = {}
-        self.status_effects = {}
-        
         # Action management
         self.action_manager = action_manager
         if self.action_manager:
@@ -66,20 +69,18 @@ class Enemy:
         
     def _calculate_max_hp(self) -> int:
         base_hp = 30
-        con_bonus = self.base_stats["constitution"] * 3
+        con_bonus = self.constitution * 3
         level_bonus = (self.level - 1) * 15
         return base_hp + con_bonus + level_bonus
         
     def get_stats(self) -> Dict[str, int]:
-        return self.base_stats.copy()
-        
-    def take_damage(self, amount: int) -> int:
-        damage_reduction = self.defense
+        return self.get_base_stats()
         
-        if hasattr(self, 'buffs') and 'defense' in self.buffs:
-            damage_reduction += self.buffs['defense']['value']
+    def get_damage_reduction(self) -> int:
+        return self.defense + self.get_buff_value('defense')
         
-        actual_damage = max(1, amount - damage_reduction)
+    def take_damage(self, amount: int) -> int:
+        actual_damage = max(1, amount - self.get_damage_reduction())
         self.current_hp = max(0, self.current_hp - actual_damage)
         return actual_damage
         
@@ -95,84 +96,18 @@ class Enemy:
         return self.current_hp > 0
         
     def update_status_effects(self) -> List[str]:
-        messages = []
-        
-        # Update buffs
-        messages.extend(self._update_buffs())
-        
-        # Update status effects
-        messages.extend(self._update_status_effects_internal())
-        
-        # Update action modifiers
-        if self.action_manager:
-            expired_modifiers = self.action_manager.update_action_modifiers(self.id)
-            for modifier in expired_modifiers:
-                messages.append(f"{self.name}'s {modifier} effect has expired.")
-            
-        return messages
-        
-    def _update_buffs(self) -> List[str]:
-        messages = []
-        buffs_to_remove = []
-        
-        for buff_type, buff_data in self.buffs.items():
-            buff_data['duration'] -= 1
-            if buff_data['duration'] <= 0:
-                buffs_to_remove.append(buff_type)
-                messages.append(f"{self.name}'s {buff_type} buff has expired.")
-        
-        for buff_type in buffs_to_remove:
-            del self.buffs[buff_type]
-            
-        return messages
-        
-    def _update_status_effects_internal(self) -> List[str]:
-        messages = []
-        statuses_to_remove = []
-        
-        for status_type, status_data in self.status_effects.items():
-            messages.extend(self._process_status_effect(status_type, status_data))
-            
-            status_data['duration'] -= 1
-            if status_data['duration'] <= 0:
-                statuses_to_remove.append(status_type)
-                messages.append(f"{self.name} is no longer affected by {status_type}.")
+        return get_status_engine().tick(self)
         
-        for status_type in statuses_to_remove:
-            del self.status_effects[status_type]
-            
-        return messages
-        
-    def _process_status_effect(self, status_type: str, status_data: Dict[str, Any]) -> List[str]:
-        messages = []
-        
-        if status_type == 'poison':
-            damage = status_data['value']
-            self.current_hp = max(0, self.current_hp - damage)
-            messages.append(f"{self.name} takes {damage} poison damage.")
-        elif status_type == 'regeneration':
-            healing = status_data['value']
-            self.current_hp = min(self.max_hp, self.current_hp + healing)
-            messages.append(f"{self.name} regenerates {healing} health.")
-        elif status_type == 'stunned':
-            messages.append(f"{self.name} is stunned and cannot act.")
-            if self.action_manager:
-                self.action_manager.add_action_modifier(self.id, "stunned", -1.0, 1)
-        elif status_type == 'slowed':
-            slow_value = status_data.get('value', 0.5)
-            messages.append(f"{self.name} is slowed and gains action more slowly.")
-            if self.action_manager:
-                self.action_manager.add_action_modifier(self.id, "slowed", -slow_value, 1)
-                
-        return messages
-        
-    def choose_action(self, player) -> Any:
-        """Choose a skill to use in combat based on predefined sequence"""
+    def choose_action(self, player, player_sequence_index: int = 0) -> Any:
+        """Choose a skill to use in combat, searching ahead for smart enemies or following the predefined sequence"""
         available_skills = self._get_available_skills()
         
         if not available_skills:
             return None
         
+        if self.behavior == "smart" and player is not None:
+            return get_planner(self.id).choose(self, player, available_skills, player_sequence_index)
+        
         return self._choose_sequence_skill(available_skills)
         
     def _get_available_skills(self) -> List[Any]:
@@ -253,6 +188,35 @@ class EnemyManager:
         for enemy_id, enemy_data in self.database.get_all_enemies().items():
             self.create_enemy(enemy_id, enemy_data)
     
+    def create_wave(self, enemy_ids: List[str], level: Optional[int] = None, rng=None) -> Optional[Wave]:
+        """Create a wave with one member per entry in enemy_ids, sharing one archetype per distinct enemy"""
+        kinds = []
+        archetypes = []
+        action_rates = []
+        kind_by_id = {}
+        for enemy_id in enemy_ids:
+            if enemy_id not in kind_by_id:
+                enemy_data = self.database.get_enemy(enemy_id)
+                if not enemy_data:
+                    continue
+                kind_by_id[enemy_id] = len(archetypes)
+                archetypes.append(Enemy(enemy_id, self._process_enemy_data(enemy_id, enemy_data, level), self.skill_manager))
+                action_rates.append(enemy_data.get("action_speed", 1.0))
+            kinds.append(kind_by_id[enemy_id])
+            
+        if not kinds:
+            return None
+        return Wave(archetypes, kinds, action_rates, rng)
+        
+    def create_random_wave(self, size: int, level: Optional[int] = None, player_level: int = 1, rng=None) -> Optional[Wave]:
+        """Create a wave of random enemies suitable for the player's level"""
+        suitable_enemies = self._get_suitable_enemies(self.database.get_all_enemies(), player_level)
+        if not suitable_enemies:
+            return None
+            
+        enemy_ids = [enemy_id for enemy_id, _ in suitable_enemies]
+        return self.create_wave([random.choice(enemy_ids) for _ in range(size)], level, rng)
+        
     def create_random_enemy(self, level: Optional[int] = None, player_level: int = 1) -> Optional[Enemy]:
         """Create a random enemy from available enemies based on player level"""
         all_enemies = self.database.get_all_enemies()
@@ -0,0 +1,144 @@
+"""
+Expeditions: independent battles that keep grinding in the background.
+One scheduler advances every expedition each frame within a fixed time budget,
+grants action points to all of them in one batched pass per tick, and leaves
+rendering to whichever expedition is focused.
+"""
+from typing import List, Optional
+import time
+
+from .player import Player
+from .combat import CombatManager
+
+DEFAULT_FRAME_BUDGET = 0.004
+DEFAULT_TICK_INTERVAL = 1.0
+MAX_CATCH_UP_SECONDS = 5.0
+
+
+class Expedition:
+    """A player party fighting battle after battle on its own simulated clock."""
+    def __init__(self, player: Player, enemy_level: Optional[int] = None, wave_size: int = 0,
+                 auto_restart: bool = True, combat_manager: Optional[CombatManager] = None):
+        self.player = player
+        self.enemy_level = enemy_level
+        self.wave_size = wave_size
+        self.auto_restart = auto_restart
+        self.combat = combat_manager or CombatManager(player)
+        self.combat.scheduled = True
+        self.clock = 0.0
+        self.victories = 0
+        self.defeats = 0
+
+    @property
+    def name(self) -> str:
+        return self.player.name
+
+    def start(self) -> None:
+        """Begin the next battle"""
+        if self.wave_size > 0:
+            self.combat.start_wave_battle(self.wave_size, self.enemy_level)
+        else:
+            self.combat.start_new_battle(self.enemy_level)
+
+    def advance(self, now: float, deadline: float) -> bool:
+        """Run the actions that are due by `now`; returns False if the deadline cut it short"""
+        step = self.combat.action_delay
+        self.clock = max(self.clock, now - MAX_CATCH_UP_SECONDS)
+        while True:
+            if not self.combat.combat_active:
+                self.clock = now
+                return True
+            if self.clock + step > now:
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            self.clock += step
+            if self.combat.update(self.clock):
+                self._finish_battle()
+
+    def _finish_battle(self) -> None:
+        if self.combat.victory:
+            self.victories += 1
+        else:
+            self.defeats += 1
+        if not self.auto_restart:
+            return
+        if not self.player.is_alive():
+            self.player.current_hp = self.player.max_hp
+        self.start()
+
+
+class ExpeditionScheduler:
+    """
+    Advances many expeditions from one game loop. The focused expedition runs first;
+    the rest share the remaining frame budget in round-robin order, so frame time
+    stays flat as expeditions are added and lagging ones catch up on later frames.
+    """
+    def __init__(self, frame_budget: float = DEFAULT_FRAME_BUDGET, tick_interval: float = DEFAULT_TICK_INTERVAL):
+        self.frame_budget = frame_budget
+        self.tick_interval = tick_interval
+        self.expeditions: List[Expedition] = []
+        self.focused: Optional[Expedition] = None
+        self.lagging = 0
+        self._next = 0
+        self._tick_clock: Optional[float] = None
+
+    def add(self, expedition: Expedition, focus: bool = False) -> Expedition:
+        self.expeditions.append(expedition)
+        if focus or self.focused is None:
+            self.focused = expedition
+        return expedition
+
+    def remove(self, expedition: Expedition) -> None:
+        if expedition in self.expeditions:
+            self.expeditions.remove(expedition)
+        if self.focused is expedition:
+            self.focused = self.expeditions[0] if self.expeditions else None
+
+    def focus(self, expedition: Expedition) -> None:
+        if expedition in self.expeditions:
+            self.focused = expedition
+
+    def background(self) -> List[Expedition]:
+        return [expedition for expedition in self.expeditions if expedition is not self.focused]
+
+    def update(self, now: Optional[float] = None) -> None:
+        """Advance every expedition up to `now` without exceeding the frame budget"""
+        if now is None:
+            now = time.time()
+        self._tick_action_points(now)
+
+        frame_deadline = time.perf_counter() + self.frame_budget
+        if self.focused:
+            self.focused.advance(now, frame_deadline)
+
+        others = self.background()
+        self.lagging = 0
+        if not others:
+            return
+        start = self._next % len(others)
+        order = others[start:] + others[:start]
+        self._next = start + 1
+
+        for position, expedition in enumerate(order):
+            remaining = frame_deadline - time.perf_counter()
+            if remaining <= 0:
+                self.lagging += len(order) - position
+                break
+            slice_deadline = time.perf_counter() + remaining / (len(order) - position)
+            if not expedition.advance(now, slice_deadline):
+                self.lagging += 1
+
+    def _tick_action_points(self, now: float) -> None:
+        if self._tick_clock is None:
+            self._tick_clock = now
+            return
+        ticks = int((now - self._tick_clock) // self.tick_interval)
+        if ticks <= 0:
+            return
+        self._tick_clock += ticks * self.tick_interval
+        ticks = min(ticks, int(MAX_CATCH_UP_SECONDS // self.tick_interval))
+
+        active = [expedition.combat for expedition in self.expeditions if expedition.combat.combat_active]
+        for combat in active:
+            combat.generate_action_points(ticks * self.tick_interval)
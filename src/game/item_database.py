@@ -0,0 +1,132 @@
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+
+EQUIPMENT_TYPES = ("weapon", "armor", "helmet", "boots", "accessory")
+ITEM_FIELDS = ("name", "value", "rarity", "damage", "defense", "stat_bonuses", "effect_type", "effect_value")
+
+
+class ItemTemplate:
+    """
+    Immutable item definition shared by every item created from it.
+    Items only store a reference to their template plus the stats they rolled differently.
+    """
+    __slots__ = ("id", "type", "slot") + ITEM_FIELDS
+
+    def __init__(self, template_id: str, data: Dict[str, Any]):
+        item_type = data.get("type", "item")
+        fields = {
+            "id": template_id,
+            "type": item_type,
+            "slot": item_type if item_type in EQUIPMENT_TYPES else "",
+            "name": data.get("name", template_id),
+            "value": data.get("value", 0),
+            "rarity": data.get("rarity", "common"),
+            "damage": data.get("damage", 0),
+            "defense": data.get("defense", 0),
+            "stat_bonuses": MappingProxyType(dict(data.get("stat_bonuses", {}))),
+            "effect_type": data.get("effect_type"),
+            "effect_value": data.get("effect_value", 0)
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("item templates are immutable")
+
+    def __repr__(self) -> str:
+        return f"ItemTemplate({self.id!r})"
+
+
+class ItemDatabase:
+    """
+    Handles loading and saving item data from JSON files.
+    Templates are built once per item id and shared; items built in code from
+    names that are not in the data get an interned ad-hoc template instead.
+    """
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.items_dir = self.data_dir / "items"
+        self.items = {}
+        self.loot = {"rarities": {}, "affixes": {}, "tables": {}}
+        self.templates: Dict[str, ItemTemplate] = {}
+        self._by_name: Dict[Tuple[str, str], ItemTemplate] = {}
+
+        # Create directories if they don't exist
+        os.makedirs(self.items_dir, exist_ok=True)
+
+        # Load data
+        self.load_data()
+
+    def load_data(self) -> None:
+        """Load all item data from JSON files"""
+        items_path = self.items_dir / "items.json"
+        if items_path.exists():
+            with open(items_path, 'r') as f:
+                self.items = json.load(f)
+        
+        # Load drop tables, rarities and affixes
+        loot_path = self.items_dir / "loot.json"
+        if loot_path.exists():
+            with open(loot_path, 'r') as f:
+                self.loot = json.load(f)
+        self._build_templates()
+
+    def save_data(self) -> None:
+        """Save all item data to JSON files"""
+        with open(self.items_dir / "items.json", 'w') as f:
+            json.dump(self.items, f, indent=2)
+        
+        with open(self.items_dir / "loot.json", 'w') as f:
+            json.dump(self.loot, f, indent=2)
+
+    def _build_templates(self) -> None:
+        self.templates = {item_id: ItemTemplate(item_id, data) for item_id, data in self.items.items()}
+        self._by_name = {(template.type, template.name): template for template in self.templates.values()}
+
+    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Get an item definition by ID"""
+        return self.items.get(item_id)
+
+    def add_item(self, item_id: str, item_data: Dict[str, Any]) -> None:
+        """Add or update an item"""
+        self.items[item_id] = item_data
+        self._build_templates()
+        self.save_data()
+
+    def get_all_items(self) -> Dict[str, Any]:
+        """Get all items"""
+        return self.items
+
+    def get_loot_data(self) -> Dict[str, Any]:
+        """Rarity weights, affix pools and drop tables"""
+        return self.loot
+
+    def get_template(self, item_id: str) -> Optional[ItemTemplate]:
+        return self.templates.get(item_id)
+
+    def is_data_template(self, template: ItemTemplate) -> bool:
+        return self.templates.get(template.id) is template
+
+    def template_for(self, item_type: str, fields: Dict[str, Any]) -> ItemTemplate:
+        """Template for an item of this type and name, interning a new one if the data has none"""
+        key = (item_type, fields.get("name", "Unknown Item"))
+        template = self._by_name.get(key)
+        if template is None:
+            template_id = "_".join(key[1].lower().split())
+            template = ItemTemplate(template_id, dict(fields, type=item_type))
+            self._by_name[key] = template
+        return template
+
+
+_item_database: Optional[ItemDatabase] = None
+
+
+def get_item_database() -> ItemDatabase:
+    """Shared database built from the default data directory"""
+    global _item_database
+    if _item_database is None:
+        _item_database = ItemDatabase()
+    return _item_database
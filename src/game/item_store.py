@@ -0,0 +1,206 @@
+"""
+Indexed item storage for inventories.
+Items are kept in insertion order and indexed by id, name, slot, type and rarity, so inserts,
+removals and lookups are O(1) and filtered views are updated incrementally.
+Stackable items are merged into one stack per template.
+"""
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator
+from itertools import count, islice
+
+_item_ids = count(1)
+
+
+def item_type(item) -> str:
+    return type(item).__name__.lower()
+
+
+class ItemView:
+    """Live, ordered subset of an ItemStore kept up to date as items come and go."""
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items: Dict[int, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self.items.values()))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def __contains__(self, item) -> bool:
+        return getattr(item, "uid", None) in self.items
+
+    def first(self) -> Optional[Any]:
+        return next(iter(self.items.values()), None)
+
+    def to_list(self) -> List[Any]:
+        return list(self.items.values())
+
+
+class ItemStore:
+    """
+    Ordered item collection indexed by item id, name, slot, type and rarity.
+    Keeps the list operations the inventory code already uses (append, remove, clear, iteration).
+    """
+    INDEXES = {
+        "name": lambda item: item.name,
+        "slot": lambda item: getattr(item, "slot", ""),
+        "type": item_type,
+        "rarity": lambda item: getattr(item, "rarity", "common")
+    }
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._items: Dict[int, Any] = {}
+        self._indexes: Dict[str, Dict[Any, ItemView]] = {name: {} for name in self.INDEXES}
+        self._views: List[tuple] = []
+        self._stacks: Dict[Any, Any] = {}
+        self._listeners: List[Callable[[Optional[Any], bool], None]] = []
+        self.extend(items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._items.values()))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, item) -> bool:
+        uid = getattr(item, "uid", None)
+        return uid is not None and self._items.get(uid) is item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._items.values())[index]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("item index out of range")
+        return next(islice(self._items.values(), index, None))
+
+    def add(self, item) -> Any:
+        """
+        Insert an item at the end, assigning it an id if it has none.
+        A stackable item is merged into the existing stack of its template, which is returned.
+        """
+        if item in self:
+            return item
+        if getattr(item, "stackable", False):
+            key = item.stack_key()
+            stack = self._stacks.get(key)
+            if stack is not None and stack.merge(item):
+                return stack
+            self._stacks[key] = item
+        if getattr(item, "uid", None) is None or item.uid in self._items:
+            item.uid = next(_item_ids)
+        self._items[item.uid] = item
+        for index_name, key in self.INDEXES.items():
+            self._indexes[index_name].setdefault(key(item), ItemView()).items[item.uid] = item
+        for predicate, view in self._views:
+            if predicate(item):
+                view.items[item.uid] = item
+        for listener in self._listeners:
+            listener(item, True)
+        return item
+
+    append = add
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.add(item)
+
+    def discard(self, item) -> bool:
+        """Remove an item if present; returns whether it was removed"""
+        if item not in self:
+            return False
+        uid = item.uid
+        del self._items[uid]
+        if getattr(item, "stackable", False) and self._stacks.get(item.stack_key()) is item:
+            del self._stacks[item.stack_key()]
+        for index_name, key in self.INDEXES.items():
+            view = self._indexes[index_name].get(key(item))
+            if view is not None:
+                view.items.pop(uid, None)
+        for _, view in self._views:
+            view.items.pop(uid, None)
+        for listener in self._listeners:
+            listener(item, False)
+        return True
+
+    def remove(self, item) -> None:
+        if not self.discard(item):
+            raise ValueError("item not in store")
+
+    def take(self, item, amount: int = 1) -> Optional[Any]:
+        """Remove amount items of a stack, returning them as their own stack"""
+        if item not in self or amount <= 0:
+            return None
+        if amount < getattr(item, "count", 1):
+            return item.split(amount)
+        self.discard(item)
+        return item
+
+    def release_empty(self, item) -> bool:
+        """Drop a stack whose count has run out"""
+        if getattr(item, "count", 1) > 0:
+            return False
+        return self.discard(item)
+
+    def count(self, name: str) -> int:
+        return sum(getattr(item, "count", 1) for item in self.lookup("name", name).items.values())
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._stacks.clear()
+        for index in self._indexes.values():
+            for view in index.values():
+                view.items.clear()
+        for _, view in self._views:
+            view.items.clear()
+        for listener in self._listeners:
+            listener(None, False)
+
+    def get(self, uid: int) -> Optional[Any]:
+        return self._items.get(uid)
+
+    def lookup(self, index_name: str, key: Any) -> ItemView:
+        return self._indexes[index_name].setdefault(key, ItemView())
+
+    def first_by_name(self, name: str) -> Optional[Any]:
+        return self.lookup("name", name).first()
+
+    def by_name(self, name: str) -> ItemView:
+        return self.lookup("name", name)
+
+    def by_slot(self, slot: str) -> ItemView:
+        return self.lookup("slot", slot)
+
+    def by_type(self, type_name: str) -> ItemView:
+        return self.lookup("type", type_name)
+
+    def by_rarity(self, rarity: str) -> ItemView:
+        return self.lookup("rarity", rarity)
+
+    def view(self, predicate: Callable[[Any], bool]) -> ItemView:
+        """Create a filtered view that is maintained on every insert and removal"""
+        view = ItemView()
+        for item in self._items.values():
+            if predicate(item):
+                view.items[item.uid] = item
+        self._views.append((predicate, view))
+        return view
+
+    def drop_view(self, view: ItemView) -> None:
+        self._views = [(predicate, existing) for predicate, existing in self._views if existing is not view]
+
+    def add_listener(self, listener: Callable[[Optional[Any], bool], None]) -> None:
+        """Call listener(item, added) whenever an entry is inserted or removed; clear() passes None"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Optional[Any], bool], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
@@ -1,153 +1,245 @@
-from typing import Dict, Optional
+import copy
+from typing import Dict, Optional, Tuple, Any
+
+from .item_database import ItemTemplate, ITEM_FIELDS, EQUIPMENT_TYPES, get_item_database
+
+def _template_field(name: str) -> property:
+    def getter(self):
+        rolled = self.rolled
+        if rolled is not None and name in rolled:
+            return rolled[name]
+        return getattr(self.template, name)
+
+    def setter(self, value):
+        self._roll(name, value)
+
+    return property(getter, setter)
 
 class Item:
-    def __init__(self, name: str, value: int):
-        self.name = name
-        self.value = value
-        
+    __slots__ = ("template", "rolled", "count", "uid")
+    item_type = "item"
+    stackable = True
+    FIELDS: Tuple[str, ...] = ("name", "value")
+
+    name = _template_field("name")
+    value = _template_field("value")
+    rarity = _template_field("rarity")
+
+    def __init__(self, name: str, value: int, count: int = 1):
+        self._bind(self.item_type, {"name": name, "value": value}, count)
+
+    def _bind(self, item_type: str, fields: Dict[str, Any], count: int) -> None:
+        self._attach(get_item_database().template_for(item_type, fields), fields, count)
+
+    def _attach(self, template: ItemTemplate, rolled: Optional[Dict[str, Any]], count: int) -> None:
+        self.template = template
+        self.rolled = None
+        self.count = count
+        self.uid = None
+        for field, value in (rolled or {}).items():
+            self._roll(field, value)
+
+    def _roll(self, field: str, value) -> None:
+        """Store a stat only when it differs from the template"""
+        if getattr(self.template, field) == value:
+            if self.rolled is not None:
+                self.rolled.pop(field, None)
+                if not self.rolled:
+                    self.rolled = None
+            return
+        if self.rolled is None:
+            self.rolled = {}
+        self.rolled[field] = dict(value) if field == "stat_bonuses" else value
+
+    @classmethod
+    def from_template(cls, template: ItemTemplate, count: int = 1, rolled: Optional[Dict[str, Any]] = None) -> "Item":
+        item = cls.__new__(cls)
+        item._attach(template, rolled, count)
+        return item
+
     def use(self, target) -> bool:
         return False
-        
+
+    def stack_key(self) -> Tuple:
+        """Items sharing a stack key are the same template and can share one stack"""
+        if self.rolled is None:
+            return (self.template.type, self.template.id)
+        return (self.template.type, self.template.id, repr(sorted(self.rolled.items())))
+
+    def can_stack_with(self, other: "Item") -> bool:
+        return self.stackable and other is not self and other.stack_key() == self.stack_key()
+
+    def merge(self, other: "Item") -> bool:
+        """Move the other stack's count onto this one"""
+        if not self.can_stack_with(other):
+            return False
+        self.count += other.count
+        other.count = 0
+        return True
+
+    def split(self, amount: int) -> Optional["Item"]:
+        """Take amount items off this stack as a new stack"""
+        if amount <= 0 or amount >= self.count:
+            return None
+        part = copy.copy(self)
+        part.rolled = dict(self.rolled) if self.rolled else None
+        part.uid = None
+        part.count = amount
+        self.count -= amount
+        return part
+
     def to_dict(self) -> Dict:
-        return {
-            "name": self.name,
-            "value": self.value
-        }
+        """Data templates save as their id plus rolled stats; ad-hoc items save every field"""
+        if get_item_database().is_data_template(self.template):
+            data = {"template": self.template.id}
+            data.update(self.rolled or {})
+        else:
+            data = {field: getattr(self, field) for field in self.FIELDS}
+            if self.template.slot:
+                data["slot"] = self.template.slot
+        if "stat_bonuses" in data:
+            data["stat_bonuses"] = dict(data["stat_bonuses"])
+        if self.count != 1:
+            data["count"] = self.count
+        return data
 
 class Equipment(Item):
-    VALID_SLOTS = ["weapon", "armor", "helmet", "boots", "accessory"]
-    
+    __slots__ = ()
+    stackable = False
+    VALID_SLOTS = list(EQUIPMENT_TYPES)
+    FIELDS = Item.FIELDS + ("rarity", "stat_bonuses")
+
+    stat_bonuses = _template_field("stat_bonuses")
+
     def __init__(self, name: str, value: int, slot: str, stat_bonuses: Optional[Dict[str, int]] = None):
-        super().__init__(name, value)
-        
         if slot not in self.VALID_SLOTS:
             raise ValueError(f"Invalid equipment slot: {slot}. Must be one of {self.VALID_SLOTS}")
-            
-        self.slot = slot
-        self.stat_bonuses = stat_bonuses or {}
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data.update({
-            "slot": self.slot,
-            "stat_bonuses": self.stat_bonuses
-        })
-        return data
+
+        self._bind(slot, {"name": name, "value": value, "stat_bonuses": stat_bonuses or {}}, 1)
+
+    @property
+    def slot(self) -> str:
+        return self.template.slot
 
 class Weapon(Equipment):
+    __slots__ = ()
+    item_type = "weapon"
+    FIELDS = Equipment.FIELDS + ("damage",)
+
+    damage = _template_field("damage")
+
     def __init__(self, name: str, damage: int, value: int, str_bonus: int = 0, dex_bonus: int = 0):
         stat_bonuses = {"strength": str_bonus, "dexterity": dex_bonus}
-        super().__init__(name, value, "weapon", stat_bonuses)
-        self._damage = damage
-        
-    @property
-    def damage(self):
-        return self._damage
-        
-    @damage.setter
-    def damage(self, value):
-        self._damage = value
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data["damage"] = self.damage
-        return data
+        self._bind("weapon", {"name": name, "value": value, "stat_bonuses": stat_bonuses, "damage": damage}, 1)
 
 class Armor(Equipment):
+    __slots__ = ()
+    item_type = "armor"
+    FIELDS = Equipment.FIELDS + ("defense",)
+
+    defense = _template_field("defense")
+
     def __init__(self, name: str, defense: int, value: int, con_bonus: int = 0):
         stat_bonuses = {"constitution": con_bonus}
-        super().__init__(name, value, "armor", stat_bonuses)
-        self._defense = defense
-        
-    @property
-    def defense(self):
-        return self._defense
-        
-    @defense.setter
-    def defense(self, value):
-        self._defense = value
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data["defense"] = self.defense
-        return data
+        self._bind("armor", {"name": name, "value": value, "stat_bonuses": stat_bonuses, "defense": defense}, 1)
 
 class Helmet(Equipment):
+    __slots__ = ()
+    item_type = "helmet"
+    FIELDS = Equipment.FIELDS + ("defense",)
+
+    defense = _template_field("defense")
+
     def __init__(self, name: str, defense: int, value: int, int_bonus: int = 0):
         stat_bonuses = {"intelligence": int_bonus}
-        super().__init__(name, value, "helmet", stat_bonuses)
-        self._defense = defense
-        
-    @property
-    def defense(self):
-        return self._defense
-        
-    @defense.setter
-    def defense(self, value):
-        self._defense = value
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data["defense"] = self.defense
-        return data
+        self._bind("helmet", {"name": name, "value": value, "stat_bonuses": stat_bonuses, "defense": defense}, 1)
 
 class Boots(Equipment):
+    __slots__ = ()
+    item_type = "boots"
+    FIELDS = Equipment.FIELDS + ("defense",)
+
+    defense = _template_field("defense")
+
     def __init__(self, name: str, defense: int, value: int, dex_bonus: int = 0):
         stat_bonuses = {"dexterity": dex_bonus}
-        super().__init__(name, value, "boots", stat_bonuses)
-        self._defense = defense
-        
-    @property
-    def defense(self):
-        return self._defense
-        
-    @defense.setter
-    def defense(self, value):
-        self._defense = value
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data["defense"] = self.defense
-        return data
+        self._bind("boots", {"name": name, "value": value, "stat_bonuses": stat_bonuses, "defense": defense}, 1)
 
 class Accessory(Equipment):
+    __slots__ = ()
+    item_type = "accessory"
+
     def __init__(self, name: str, value: int, stat_bonuses: Dict[str, int]):
-        super().__init__(name, value, "accessory", stat_bonuses)
-        
-    def to_dict(self) -> Dict:
-        return super().to_dict()
+        self._bind("accessory", {"name": name, "value": value, "stat_bonuses": stat_bonuses}, 1)
 
 class Potion(Item):
-    def __init__(self, name: str, value: int, effect_type: str, effect_value: int):
-        super().__init__(name, value)
-        self.effect_type = effect_type
-        self.effect_value = effect_value
-        
+    __slots__ = ()
+    item_type = "potion"
+    FIELDS = Item.FIELDS + ("effect_type", "effect_value")
+
+    effect_type = _template_field("effect_type")
+    effect_value = _template_field("effect_value")
+
+    def __init__(self, name: str, value: int, effect_type: str, effect_value: int, count: int = 1):
+        self._bind("potion", {"name": name, "value": value, "effect_type": effect_type, "effect_value": effect_value}, count)
+
     def use(self, target) -> bool:
+        if self.count <= 0:
+            return False
         if self.effect_type == "heal":
             if hasattr(target, 'heal'):
                 target.heal(self.effect_value)
+                self.count -= 1
                 return True
         return False
-        
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data.update({
-            "effect_type": self.effect_type,
-            "effect_value": self.effect_value
-        })
-        return data
+
+ITEM_CLASSES = {
+    "item": Item,
+    "weapon": Weapon,
+    "armor": Armor,
+    "helmet": Helmet,
+    "boots": Boots,
+    "accessory": Accessory,
+    "potion": Potion
+}
+
+def create_item(item_id: str, count: int = 1, **rolled) -> Item:
+    """Create an item from its template in data/items/items.json"""
+    template = get_item_database().get_template(item_id)
+    if template is None:
+        raise ValueError(f"Unknown item: {item_id}")
+    return ITEM_CLASSES.get(template.type, Item).from_template(template, count, rolled)
+
+def item_from_dict(data: Dict[str, Any]) -> Optional[Item]:
+    """Rebuild an item saved by Item.to_dict, including saves from before item templates"""
+    if not isinstance(data, dict):
+        return None
+
+    database = get_item_database()
+    count = data.get("count", 1)
+    fields = {field: data[field] for field in ITEM_FIELDS if field in data}
+
+    template = database.get_template(data["template"]) if "template" in data else None
+    if template is None:
+        if "effect_type" in data:
+            item_type = "potion"
+        else:
+            item_type = data.get("slot") or "item"
+        fields.setdefault("name", "Unknown Item")
+        template = database.template_for(item_type if item_type in ITEM_CLASSES else "item", fields)
+
+    return ITEM_CLASSES.get(template.type, Item).from_template(template, count, fields)
 
 def create_starter_weapon() -> Weapon:
-    return Weapon("Wooden Sword", 3, 10)
+    return create_item("wooden_sword")
 
 def create_starter_armor() -> Armor:
-    return Armor("Cloth Tunic", 2, 10)
+    return create_item("cloth_tunic")
 
 def create_health_potion(tier: int = 1) -> Potion:
     if tier == 1:
-        return Potion("Minor Health Potion", 20, "heal", 30)
+        return create_item("minor_health_potion")
     elif tier == 2:
-        return Potion("Health Potion", 50, "heal", 70)
+        return create_item("health_potion")
     else:
-        return Potion("Major Health Potion", 100, "heal", 150)
\ No newline at end of file
+        return create_item("major_health_potion")
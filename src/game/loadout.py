@@ -0,0 +1,212 @@
+"""
+Best-in-slot equipment search.
+Each slot keeps a cached Pareto frontier of inventory items over the stats an objective
+cares about; the frontier is patched as items come and go, and a branch-and-bound search
+over the frontiers scores complete loadouts with the real skill formulas.
+"""
+from typing import Dict, List, Any, Optional, Tuple
+
+from .combatant import CombatantCore, STAT_NAMES
+from .enemy_ai import SkillModel, expected_hits
+from .items import Equipment
+
+FEATURES = ("damage", "defense") + STAT_NAMES
+DEFAULT_ACTION_RATE = 8.0
+
+Loadout = Dict[str, Optional[Equipment]]
+
+
+def item_features(item: Equipment) -> Tuple[float, ...]:
+    bonuses = item.stat_bonuses
+    return (getattr(item, "damage", 0), getattr(item, "defense", 0)) + tuple(bonuses.get(stat, 0) for stat in STAT_NAMES)
+
+
+def dominates(first: Tuple[float, ...], second: Tuple[float, ...], mask: Tuple[bool, ...]) -> bool:
+    """first is at least as good as second in every stat the mask selects"""
+    return all(a >= b for a, b, used in zip(first, second, mask) if used)
+
+
+class LoadoutUser:
+    """Stand-in for the player wearing a candidate loadout, for the skill scaling formulas"""
+    __slots__ = ("player", "loadout")
+
+    def __init__(self, player, loadout: Loadout):
+        self.player = player
+        self.loadout = loadout
+
+    def get_weapon(self):
+        return self.loadout.get("weapon")
+
+    def get_stat(self, stat: str) -> int:
+        bonus = sum(item.stat_bonuses.get(stat, 0) for item in self.loadout.values() if item is not None)
+        return CombatantCore.get_stat(self.player, stat) + bonus
+
+
+class Objective:
+    """Linear score over item features; evaluate() gives the exact score of a full loadout"""
+    def __init__(self, weights: Dict[str, float], base: float = 0.0, slack: float = 0.0):
+        self.weights = tuple(weights.get(feature, 0.0) for feature in FEATURES)
+        self.mask = tuple(weight > 0 for weight in self.weights)
+        self.base = base
+        self.slack = slack
+
+    def linear(self, item: Optional[Equipment]) -> float:
+        if item is None:
+            return 0.0
+        return sum(weight * value for weight, value in zip(self.weights, item_features(item)) if weight)
+
+    def evaluate(self, loadout: Loadout) -> float:
+        return self.base + sum(self.linear(item) for item in loadout.values())
+
+
+class DpsObjective(Objective):
+    """
+    Expected damage per second of the player's combat sequence.
+    Linear weights come from the skills' weapon and stat scaling; they over-estimate
+    the integer damage rolls by at most one point per hit, which is added as slack.
+    """
+    def __init__(self, player):
+        self.player = player
+        self.skills = [skill for skill in player.combat_sequence if skill is not None]
+        action_manager = player.action_manager
+        rate = action_manager.get_action_rate(player.id) if action_manager else DEFAULT_ACTION_RATE
+        cost = sum(skill.action_cost for skill in self.skills) or 1.0
+        self.factor = rate / cost
+
+        weights = dict.fromkeys(FEATURES, 0.0)
+        base = 0.0
+        hits = 0
+        for skill in self.skills:
+            for effect in skill.effects:
+                params = effect.get("params", {})
+                if effect.get("type") == "damage":
+                    count, scale = 1, 1.0
+                elif effect.get("type") == "multi_hit":
+                    count = expected_hits(params)
+                    scale = sum(params.get("damage_scaling", 1.0) ** hit for hit in range(count))
+                else:
+                    continue
+                scale *= (params.get("variance_min", 0.8) + params.get("variance_max", 1.2)) / 2 * self.factor
+                hits += count
+                base += params.get("base_value", 0) * scale
+                if params.get("weapon_scaling", 0) > 0:
+                    weights["damage"] += params["weapon_scaling"] * scale
+                for stat, stat_scale in params.get("stat_scaling", {}).items():
+                    if stat in weights:
+                        weights[stat] += stat_scale * scale
+                        base += CombatantCore.get_stat(player, stat) * stat_scale * scale
+
+        super().__init__(weights, base, hits * self.factor)
+
+    def evaluate(self, loadout: Loadout) -> float:
+        user = LoadoutUser(self.player, loadout)
+        return sum(sum(SkillModel(skill, user).hits) for skill in self.skills) * self.factor
+
+
+class LoadoutOptimizer:
+    """
+    Picks the best item per equipment slot from the inventory and what is already worn.
+    Objectives: "damage" (weapon damage), "defense" (total defense) and "dps" (simulated
+    damage per second of the combat sequence).
+    """
+    def __init__(self, inventory):
+        self.inventory = inventory
+        self._frontiers: Dict[Tuple[Tuple[bool, ...], str], List[Tuple[Tuple[float, ...], Equipment]]] = {}
+        self.nodes = 0
+        inventory.inventory.add_listener(self._on_inventory_change)
+
+    def objective(self, name: str) -> Objective:
+        if name == "damage":
+            return Objective({"damage": 1.0})
+        if name == "defense":
+            return Objective({"defense": 1.0})
+        if name == "dps":
+            return DpsObjective(self.inventory.player)
+        raise ValueError(f"Unknown loadout objective: {name}")
+
+    def _on_inventory_change(self, item, added: bool) -> None:
+        if item is None:
+            self._frontiers.clear()
+            return
+        if not isinstance(item, Equipment):
+            return
+        features = item_features(item)
+        for (mask, slot), frontier in list(self._frontiers.items()):
+            if slot != item.slot:
+                continue
+            if added:
+                if not any(dominates(other, features, mask) for other, _ in frontier):
+                    frontier[:] = [entry for entry in frontier if not dominates(features, entry[0], mask)]
+                    frontier.append((features, item))
+            elif any(entry is item for _, entry in frontier):
+                del self._frontiers[(mask, slot)]
+
+    def candidates(self, slot: str, mask: Tuple[bool, ...]) -> List[Equipment]:
+        """Inventory items of a slot that no other item beats in every stat the mask selects"""
+        key = (mask, slot)
+        frontier = self._frontiers.get(key)
+        if frontier is None:
+            frontier = []
+            for item in self.inventory.inventory.by_slot(slot):
+                if not isinstance(item, Equipment):
+                    continue
+                features = item_features(item)
+                if any(dominates(other, features, mask) for other, _ in frontier):
+                    continue
+                frontier = [entry for entry in frontier if not dominates(features, entry[0], mask)]
+                frontier.append((features, item))
+            self._frontiers[key] = frontier
+        return [item for _, item in frontier]
+
+    def best_loadout(self, objective: str = "damage") -> Tuple[Loadout, float]:
+        """Best item per slot and the objective's score for that loadout"""
+        scoring = self.objective(objective)
+        equipment = self.inventory.equipment
+
+        slots = []
+        for slot in Equipment.VALID_SLOTS:
+            worn = equipment.get(slot)
+            options = self.candidates(slot, scoring.mask) + ([worn] if worn is not None else [])
+            ranked = sorted(((scoring.linear(item), item is not worn, item) for item in options),
+                            key=lambda entry: (-entry[0], entry[1]))
+            slots.append((slot, [(score, item) for score, _, item in ranked] or [(0.0, None)]))
+
+        remaining = [0.0] * (len(slots) + 1)
+        for depth in range(len(slots) - 1, -1, -1):
+            remaining[depth] = remaining[depth + 1] + max(0.0, slots[depth][1][0][0])
+
+        best: List[Any] = [float("-inf"), None]
+        chosen: Loadout = {}
+        self.nodes = 0
+
+        def search(depth: int, partial: float) -> None:
+            self.nodes += 1
+            if depth == len(slots):
+                score = scoring.evaluate(chosen)
+                if score > best[0]:
+                    best[0], best[1] = score, dict(chosen)
+                return
+            slot, ranked = slots[depth]
+            for score, item in ranked:
+                if scoring.base + partial + score + remaining[depth + 1] + scoring.slack <= best[0]:
+                    break
+                chosen[slot] = item
+                search(depth + 1, partial + score)
+            chosen.pop(slot, None)
+
+        search(0, 0.0)
+        return best[1], best[0]
+
+    def equip_best(self, objective: str = "damage") -> List[Equipment]:
+        """Equip the best loadout, moving replaced items back to the inventory"""
+        loadout, _ = self.best_loadout(objective)
+        equipped = []
+        for slot, item in loadout.items():
+            if item is None or item is self.inventory.equipment.get(slot):
+                continue
+            self.inventory.remove_from_inventory(item)
+            if self.inventory.equip_item(item):
+                equipped.append(item)
+            else:
+                self.inventory.add_to_inventory(item)
+        return equipped
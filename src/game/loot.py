@@ -0,0 +1,188 @@
+"""
+Seeded loot generation.
+Drop tables, rarity weights and affix pools come from data/items/loot.json and are compiled
+into alias tables, so each draw is O(1) and a batch of drops takes a handful of numpy calls.
+"""
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+from .item_database import ItemDatabase, ItemTemplate, EQUIPMENT_TYPES, get_item_database
+from .items import Item, ITEM_CLASSES
+
+DEFAULT_TABLE = "default"
+
+
+class AliasTable:
+    """Vose alias table for constant-time sampling from a fixed discrete distribution"""
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        scaled = np.asarray(weights, dtype=np.float64)
+        scaled = scaled * len(scaled) / scaled.sum()
+        self.probability = np.ones(len(scaled))
+        self.alias = np.arange(len(scaled))
+
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        columns = rng.integers(0, len(self.probability), size)
+        keep = rng.random(size) < self.probability[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+class LootTable:
+    __slots__ = ("drop_chance", "templates", "entries")
+
+    def __init__(self, drop_chance: float, templates: List[ItemTemplate], weights: List[float]):
+        self.drop_chance = drop_chance
+        self.templates = templates
+        self.entries = AliasTable(weights)
+
+
+class AffixPool:
+    __slots__ = ("affixes", "minimum", "maximum", "choices")
+
+    def __init__(self, affixes: List[Dict[str, Any]]):
+        self.affixes = affixes
+        self.minimum = np.array([affix.get("min", 1) for affix in affixes], dtype=np.int64)
+        self.maximum = np.array([affix.get("max", 1) for affix in affixes], dtype=np.int64)
+        self.choices = AliasTable([affix.get("weight", 1) for affix in affixes])
+
+
+class LootGenerator:
+    """
+    Rolls drops for defeated enemies from per-enemy drop tables.
+    Owns its own RNG stream, so the same seed always yields the same drops.
+    """
+    def __init__(self, database: Optional[ItemDatabase] = None, seed: Optional[int] = None):
+        self.database = database or get_item_database()
+        self.rng = np.random.default_rng(seed)
+        self.tables: Dict[str, LootTable] = {}
+        self.affix_pools: Dict[str, AffixPool] = {}
+        self.compile()
+
+    def seed(self, seed: Optional[int]) -> None:
+        self.rng = np.random.default_rng(seed)
+
+    def compile(self) -> None:
+        """Build alias tables from the loot data"""
+        loot = self.database.get_loot_data()
+
+        rarities = loot.get("rarities") or {"common": {"weight": 1}}
+        self.rarity_names = list(rarities)
+        self.rarity_affixes = np.array([rarity.get("affixes", 0) for rarity in rarities.values()], dtype=np.int64)
+        self.rarity_multipliers = [rarity.get("value_multiplier", 1.0) for rarity in rarities.values()]
+        self.rarities = AliasTable([rarity.get("weight", 1) for rarity in rarities.values()])
+
+        self.affix_pools = {item_type: AffixPool(affixes)
+                            for item_type, affixes in loot.get("affixes", {}).items() if affixes}
+
+        self.tables = {}
+        for table_id, table in loot.get("tables", {}).items():
+            entries = [(self.database.get_template(entry["item"]), entry.get("weight", 1))
+                       for entry in table.get("entries", [])]
+            entries = [(template, weight) for template, weight in entries if template is not None]
+            if entries:
+                self.tables[table_id] = LootTable(table.get("drop_chance", 1.0),
+                                                  [template for template, _ in entries],
+                                                  [weight for _, weight in entries])
+
+    def table_for(self, enemy_id: str) -> Optional[LootTable]:
+        return self.tables.get(enemy_id) or self.tables.get(DEFAULT_TABLE)
+
+    def roll(self, enemy_id: str, kills: int = 1) -> List[Item]:
+        """Drops for defeating kills enemies of one kind; identical consumables come back as one stack"""
+        table = self.table_for(enemy_id)
+        if table is None or kills <= 0:
+            return []
+
+        drops = int(self.rng.binomial(kills, table.drop_chance))
+        if not drops:
+            return []
+
+        counts = np.bincount(table.entries.sample(self.rng, drops), minlength=len(table.templates))
+        items = []
+        for index in np.flatnonzero(counts).tolist():
+            template = table.templates[index]
+            if template.type in EQUIPMENT_TYPES:
+                items.extend(self._roll_equipment(template, int(counts[index])))
+            else:
+                items.append(ITEM_CLASSES.get(template.type, Item).from_template(template, int(counts[index])))
+        return items
+
+    def roll_kills(self, kills: Dict[str, int]) -> List[Item]:
+        """Drops for a whole fight, given the number of kills per enemy id"""
+        items = []
+        stacks = {}
+        for enemy_id, count in kills.items():
+            for item in self.roll(enemy_id, count):
+                if item.stackable:
+                    stack = stacks.setdefault(item.stack_key(), item)
+                    if stack is not item:
+                        stack.merge(item)
+                        continue
+                items.append(item)
+        return items
+
+    def _roll_equipment(self, template: ItemTemplate, count: int) -> List[Item]:
+        rarity_picks = self.rarities.sample(self.rng, count)
+        affix_counts = self.rarity_affixes[rarity_picks]
+        pool = self.affix_pools.get(template.type)
+        if pool is None:
+            affix_counts = np.zeros(count, dtype=np.int64)
+
+        total = int(affix_counts.sum())
+        if total:
+            affix_picks = pool.choices.sample(self.rng, total)
+            amounts = self.rng.integers(pool.minimum[affix_picks], pool.maximum[affix_picks] + 1).tolist()
+            affix_picks = affix_picks.tolist()
+
+        item_class = ITEM_CLASSES.get(template.type, Item)
+        items = []
+        offset = 0
+        for rarity, affixes in zip(rarity_picks.tolist(), affix_counts.tolist()):
+            rolled = {
+                "rarity": self.rarity_names[rarity],
+                "value": int(template.value * self.rarity_multipliers[rarity])
+            }
+            bonuses = None
+            prefix = None
+            for pick in range(offset, offset + affixes):
+                affix = pool.affixes[affix_picks[pick]]
+                stat = affix["stat"]
+                if stat in ("damage", "defense"):
+                    rolled[stat] = rolled.get(stat, getattr(template, stat)) + amounts[pick]
+                else:
+                    bonuses = bonuses or dict(template.stat_bonuses)
+                    bonuses[stat] = bonuses.get(stat, 0) + amounts[pick]
+                prefix = prefix or affix.get("prefix")
+            offset += affixes
+
+            if bonuses:
+                rolled["stat_bonuses"] = bonuses
+            if prefix:
+                rolled["name"] = f"{prefix} {template.name}"
+            items.append(item_class.from_template(template, 1, rolled))
+        return items
+
+
+_loot_generator: Optional[LootGenerator] = None
+
+
+def get_loot_generator() -> LootGenerator:
+    """Shared generator built from the default data directory"""
+    global _loot_generator
+    if _loot_generator is None:
+        _loot_generator = LootGenerator()
+    return _loot_generator
@@ -2,23 +2,25 @@ from typing import Dict, List, Optional, Any, Union
 from .action_manager import ActionManager
 from .player_inventory import PlayerInventory
 from .player_skills import PlayerSkills
+from .combatant import CombatantCore
+from .save_migrations import SCHEMA_KEY, SCHEMA_VERSION, migrate, needs_migration
 
-class Player:
+class Player(CombatantCore):
     def __init__(self, name: str, action_manager: Optional[ActionManager] = None):
         self.name = name
         self.id = f"player_{name}"
-        self.level = 1
         self.experience = 0
         self.experience_to_level = 100
         self.gold = 50
+        self.playtime = 0.0
         
-        self.base_stats = {
+        self._init_core(1, {
             "strength": 10,
             "dexterity": 10,
             "constitution": 10,
             "intelligence": 10,
             "wisdom": 10
-        }
+        })
         
         # Initialize HP before other components that might need it
         self.max_hp = self._calculate_max_hp()
@@ -30,37 +32,48 @@ class Player:
         
         # Initialize component managers after HP is set
         self.inventory = PlayerInventory(self)
+        self.equipment = self.inventory.equipment
         self.skills_manager = PlayerSkills(self)
         
         # If we have an action manager, make sure it's available to the skills manager
         if self.action_manager and not hasattr(self.skills_manager, 'action_manager'):
             self.skills_manager.action_manager = self.action_manager
         
-    def __getattr__(self, name):
-        # Forward attribute access to the appropriate component
-        if name == 'equipment':
-            return self.inventory.equipment
-        elif name in ['skills', 'combat_sequence', 'buffs', 'status_effects', 'skill_manager', 'skill_database']:
-            if hasattr(self.skills_manager, name):
-                return getattr(self.skills_manager, name)
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+    @property
+    def skills(self):
+        return self.skills_manager.skills
+        
+    @skills.setter
+    def skills(self, skills):
+        self.skills_manager.skills = skills
+        
+    @property
+    def combat_sequence(self):
+        return self.skills_manager.combat_sequence
+        
+    @combat_sequence.setter
+    def combat_sequence(self, sequence):
+        self.skills_manager.combat_sequence = sequence
+        
+    @property
+    def skill_manager(self):
+        return self.skills_manager.skill_manager
+        
+    @property
+    def skill_database(self):
+        return self.skills_manager.skill_database
         
     def get_weapon(self):
-        if hasattr(self, 'inventory') and self.inventory:
-            if hasattr(self.inventory, 'equipment') and self.inventory.equipment:
-                weapon = self.inventory.equipment.get('weapon')
-                if weapon and hasattr(weapon, 'damage'):
-                    return weapon
-        return None
+        return self.inventory.weapon
         
     def _calculate_max_hp(self) -> int:
         base_hp = 50
-        con_bonus = self.base_stats["constitution"] * 5
+        con_bonus = self.constitution * 5
         level_bonus = (self.level - 1) * 20
         return base_hp + con_bonus + level_bonus
         
     def get_stats(self) -> Dict[str, int]:
-        stats = self.base_stats.copy()
+        stats = self.get_base_stats()
         equipment_stats = self.inventory.get_equipment_stats()
         
         for stat, value in equipment_stats.items():
@@ -69,6 +82,9 @@ class Player:
         
         return stats
     
+    def get_stat(self, stat: str) -> int:
+        return super().get_stat(stat) + self.inventory.get_equipment_stat(stat)
+    
     def _update_hp_after_stat_change(self):
         old_max_hp = self.max_hp
         self.max_hp = self._calculate_max_hp()
@@ -113,13 +129,11 @@ class Player:
         self.max_hp = self._calculate_max_hp()
         self.current_hp = self.max_hp
     
+    def get_damage_reduction(self) -> int:
+        return self.inventory.get_defense() + self.get_buff_value('defense')
+        
     def take_damage(self, amount: int) -> int:
-        damage_reduction = self.inventory.get_defense()
-                
-        if 'defense' in self.skills_manager.buffs:
-            damage_reduction += self.skills_manager.buffs['defense']['value']
-                
-        actual_damage = max(1, amount - damage_reduction)
+        actual_damage = max(1, amount - self.get_damage_reduction())
         self.current_hp = max(0, self.current_hp - actual_damage)
         return actual_damage
         
@@ -139,44 +153,53 @@ class Player:
         
     def to_dict(self) -> Dict[str, Any]:
         return {
+            SCHEMA_KEY: SCHEMA_VERSION,
             "name": self.name,
             "id": self.id,
             "level": self.level,
             "experience": self.experience,
             "experience_to_level": self.experience_to_level,
             "gold": self.gold,
-            "base_stats": self.base_stats,
+            "playtime": self.playtime,
+            "base_stats": self.get_base_stats(),
             "max_hp": self.max_hp,
             "current_hp": self.current_hp,
             "inventory": self.inventory.to_dict() if hasattr(self.inventory, 'to_dict') else {},
             "skills": self.skills_manager.to_dict() if hasattr(self.skills_manager, 'to_dict') else {}
         }
     
+    @classmethod
+    def from_save(cls, save, action_manager: Optional[ActionManager] = None) -> 'Player':
+        """
+        Build a player from a sectioned save such as engine.save_format.SaveFile.
+        The inventory bag is only decoded and rebuilt when something first uses it.
+        """
+        data, load_items = save.lazy_player_data()
+        if needs_migration(data):
+            return cls.from_dict(migrate(save.player_data()), action_manager)
+        player = cls.from_dict(data, action_manager)
+        player.inventory.defer_items(load_items)
+        return player
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any], action_manager: Optional[ActionManager] = None) -> 'Player':
-        if not isinstance(data, dict):
-            raise ValueError("Player data must be a dictionary")
-            
-        player = cls(data.get("name", "Hero"), action_manager)
-        
-        player.id = data.get("id", player.id)
-        player.level = data.get("level", 1)
-        player.experience = data.get("experience", 0)
-        player.experience_to_level = data.get("experience_to_level", 100)
-        player.gold = data.get("gold", 50)
-        
-        if "base_stats" in data and isinstance(data["base_stats"], dict):
-            for stat, value in data["base_stats"].items():
-                if stat in player.base_stats:
-                    player.base_stats[stat] = value
-        
-        player.max_hp = data.get("max_hp", player._calculate_max_hp())
-        player.current_hp = data.get("current_hp", player.max_hp)
-        
-        if "inventory" in data and hasattr(player.inventory, 'from_dict'):
-            player.inventory.from_dict(data["inventory"])
+        """Current-schema data is decoded directly; anything older goes through save_migrations first"""
+        if needs_migration(data):
+            data = migrate(data)
             
-        if "skills" in data and hasattr(player.skills_manager, 'from_dict'):
-            player.skills_manager.from_dict(data["skills"])
+        player = cls(data["name"], action_manager)
+        
+        player.id = data["id"]
+        player.level = data["level"]
+        player.experience = data["experience"]
+        player.experience_to_level = data["experience_to_level"]
+        player.gold = data["gold"]
+        player.playtime = data["playtime"]
+        player.base_stats.update(data["base_stats"])
+        player.max_hp = data["max_hp"]
+        player.current_hp = data["current_hp"]
+        
+        player.inventory.from_dict(data["inventory"])
+        player.skills_manager.from_dict(data["skills"])
             
         return player
\ No newline at end of file
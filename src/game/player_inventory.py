@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from .items import Item, Equipment
+from .item_store import ItemStore, ItemView
 
 class PlayerInventory:
     def __init__(self, player):
@@ -11,14 +12,20 @@ class PlayerInventory:
             "boots": None,
             "accessory": None
         }
-        self.inventory: List[Item] = []
+        self._items = ItemStore()
+        self._pending_items: Optional[Callable[[], List[Dict[str, Any]]]] = None
+        self._optimizer = None
+        self._shop = None
+        self.weapon: Optional[Equipment] = None
+        self._defense = 0
+        self._equipment_stats: Dict[str, int] = {}
         self._initialize_defaults()
 
     def _initialize_defaults(self):
-        from .items import Weapon, Armor
+        from .items import create_starter_weapon, create_starter_armor
         
-        starter_sword = Weapon("Wooden Sword", 5, 0, 0)
-        starter_armor = Armor("Cloth Tunic", 1, 0, 0)
+        starter_sword = create_starter_weapon()
+        starter_armor = create_starter_armor()
         
         self.equip_item(starter_sword)
         self.equip_item(starter_armor)
@@ -26,18 +33,51 @@ class PlayerInventory:
         if not self.equipment["weapon"] or not self.equipment["armor"]:
             raise RuntimeError("Failed to equip starter equipment")
 
-    def get_equipment_stats(self) -> Dict[str, int]:
-        stats = {}
+    @property
+    def inventory(self) -> ItemStore:
+        if self._pending_items is not None:
+            self._load_pending_items()
+        return self._items
+    
+    @property
+    def items_loaded(self) -> bool:
+        return self._pending_items is None
+    
+    def defer_items(self, loader: Callable[[], List[Dict[str, Any]]]) -> None:
+        """Empty the bag now and rebuild it from loader's saved items the first time it is used"""
+        self._items.clear()
+        self._pending_items = loader
+    
+    def _load_pending_items(self) -> None:
+        from .items import item_from_dict
         
-        for slot, item in self.equipment.items():
+        loader, self._pending_items = self._pending_items, None
+        for item_data in loader() or []:
+            item = item_from_dict(item_data)
+            if item is not None:
+                self._items.add(item)
+    
+    def refresh_equipment(self) -> None:
+        """Recompute the cached defense, stat bonuses and weapon after the worn items change"""
+        stats = {}
+        defense = 0
+        for item in self.equipment.values():
             if item:
                 for stat, value in item.stat_bonuses.items():
-                    if stat in stats:
-                        stats[stat] += value
-                    else:
-                        stats[stat] = value
+                    stats[stat] = stats.get(stat, 0) + value
+                defense += getattr(item, 'defense', 0)
         
-        return stats
+        weapon = self.equipment.get("weapon")
+        self.weapon = weapon if weapon is not None and hasattr(weapon, 'damage') else None
+        self._defense = defense
+        self._equipment_stats = stats
+    
+    def get_equipment_stats(self) -> Dict[str, int]:
+        """Cached stat bonuses of all worn items; treat as read-only"""
+        return self._equipment_stats
+    
+    def get_equipment_stat(self, stat: str) -> int:
+        return self._equipment_stats.get(stat, 0)
         
     def equip_item(self, item: Equipment) -> bool:
         if item.slot not in self.equipment:
@@ -62,94 +102,75 @@ class PlayerInventory:
         
         old_item = self.equipment[item.slot]
         if old_item:
-            if not hasattr(self, 'inventory') or self.inventory is None:
-                self.inventory = []
-            self.inventory.append(old_item)
+            self.inventory.add(old_item)
         
         self.equipment[item.slot] = item
+        self.refresh_equipment()
         self.player._update_hp_after_stat_change()
         return True
         
     def unequip_item(self, slot: str) -> bool:
         if slot in self.equipment and self.equipment[slot]:
             item = self.equipment[slot]
-            if not hasattr(self, 'inventory') or self.inventory is None:
-                self.inventory = []
-            self.inventory.append(item)
+            self.inventory.add(item)
             self.equipment[slot] = None
+            self.refresh_equipment()
             self.player._update_hp_after_stat_change()
             return True
         return False
     
     def get_defense(self) -> int:
-        defense = 0
-        for slot, item in self.equipment.items():
-            if item and hasattr(item, 'defense'):
-                defense += item.defense
-        return defense
+        return self._defense
     
     def add_to_inventory(self, item: Item) -> bool:
-        if not hasattr(self, 'inventory') or self.inventory is None:
-            self.inventory = []
-        self.inventory.append(item)
+        self.inventory.add(item)
         return True
     
+    def use_item(self, item: Item, target=None) -> bool:
+        """Use an inventory item, dropping its stack once it is used up"""
+        if item not in self.inventory:
+            return False
+        used = item.use(target if target is not None else self.player)
+        self.inventory.release_empty(item)
+        return used
+    
+    def add_items(self, items: List[Item]) -> None:
+        self.inventory.extend(items)
+    
     def remove_from_inventory(self, item: Item) -> bool:
-        if item in self.inventory:
-            self.inventory.remove(item)
-            return True
-        return False
+        return self.inventory.discard(item)
     
     def get_item_by_name(self, name: str) -> Optional[Item]:
-        for item in self.inventory:
-            if item.name == name:
-                return item
-        return None
+        return self.inventory.first_by_name(name)
+    
+    def get_items_by_slot(self, slot: str) -> ItemView:
+        return self.inventory.by_slot(slot)
+    
+    def get_items_by_type(self, type_name: str) -> ItemView:
+        return self.inventory.by_type(type_name)
+    
+    def get_optimizer(self):
+        if self._optimizer is None:
+            from .loadout import LoadoutOptimizer
+            self._optimizer = LoadoutOptimizer(self)
+        return self._optimizer
+    
+    def equip_best(self, objective: str = "damage") -> List[Equipment]:
+        """Equip the best item per slot for an objective: damage, defense or dps"""
+        return self.get_optimizer().equip_best(objective)
+    
+    def get_shop(self):
+        if self._shop is None:
+            from .shop import Shop
+            self._shop = Shop(self)
+        return self._shop
         
     def to_dict(self) -> Dict[str, Any]:
-        equipment_dict = {}
-        for slot, item in self.equipment.items():
-            if item:
-                if hasattr(item, 'to_dict'):
-                    equipment_dict[slot] = item.to_dict()
-                else:
-                    item_dict = {
-                        "name": item.name,
-                        "slot": item.slot,
-                        "value": getattr(item, 'value', 0),
-                        "stat_bonuses": getattr(item, 'stat_bonuses', {})
-                    }
-                    
-                    # Save specific attributes based on item type
-                    if slot == "weapon" and hasattr(item, 'damage'):
-                        item_dict["damage"] = item.damage
-                    elif hasattr(item, 'defense'):
-                        item_dict["defense"] = item.defense
-                        
-                    equipment_dict[slot] = item_dict
-            else:
-                equipment_dict[slot] = None
-                
-        inventory_list = []
-        for item in self.inventory:
-            if hasattr(item, 'to_dict'):
-                inventory_list.append(item.to_dict())
-            else:
-                item_dict = {
-                    "name": item.name,
-                    "value": getattr(item, 'value', 0),
-                    "slot": getattr(item, 'slot', '')
-                }
-                
-                # Save specific attributes based on item type
-                if hasattr(item, 'damage'):
-                    item_dict["damage"] = item.damage
-                if hasattr(item, 'defense'):
-                    item_dict["defense"] = item.defense
-                if hasattr(item, 'stat_bonuses'):
-                    item_dict["stat_bonuses"] = item.stat_bonuses
-                    
-                inventory_list.append(item_dict)
+        equipment_dict = {slot: item.to_dict() if item else None for slot, item in self.equipment.items()}
+        if self._pending_items is not None:
+            inventory_list = list(self._pending_items() or [])
+        else:
+            inventory_list = [item.to_dict() for item in self._items]
                 
         return {
             "equipment": equipment_dict,
@@ -157,97 +178,15 @@ class PlayerInventory:
         }
         
     def from_dict(self, data: Dict[str, Any]):
-        if not isinstance(data, dict):
-            return
-            
-        from .items import Weapon, Armor, Helmet, Boots, Accessory, Item, Potion
+        """Restore from current-schema data; a lazily loaded save leaves the bag out"""
+        from .items import item_from_dict
         
-        # Clear current equipment and inventory
+        self._pending_items = None
+        self._items.clear()
         for slot in self.equipment:
-            self.equipment[slot] = None
-            
-        # Ensure inventory is initialized
-        if not hasattr(self, 'inventory') or self.inventory is None:
-            self.inventory = []
-        else:
-            self.inventory.clear()
-        
-        # Restore equipment
-        if "equipment" in data and isinstance(data["equipment"], dict):
-            for slot, item_data in data["equipment"].items():
-                if item_data is None:
-                    continue
-                    
-                if not isinstance(item_data, dict):
-                    continue
-                    
-                name = item_data.get("name", "Unknown Item")
-                value = item_data.get("value", 0)
-                stat_bonuses = item_data.get("stat_bonuses", {})
-                
-                if slot == "weapon":
-                    damage = item_data.get("damage", 0)
-                    str_bonus = stat_bonuses.get("strength", 0)
-                    dex_bonus = stat_bonuses.get("dexterity", 0)
-                    item = Weapon(name, damage, value, str_bonus, dex_bonus)
-                elif slot == "armor":
-                    defense = item_data.get("defense", 0)
-                    con_bonus = stat_bonuses.get("constitution", 0)
-                    item = Armor(name, defense, value, con_bonus)
-                elif slot == "helmet":
-                    defense = item_data.get("defense", 0)
-                    int_bonus = stat_bonuses.get("intelligence", 0)
-                    item = Helmet(name, defense, value, int_bonus)
-                elif slot == "boots":
-                    defense = item_data.get("defense", 0)
-                    dex_bonus = stat_bonuses.get("dexterity", 0)
-                    item = Boots(name, defense, value, dex_bonus)
-                elif slot == "accessory":
-                    item = Accessory(name, value, stat_bonuses)
-                    
-                self.equipment[slot] = item
+            item_data = data["equipment"].get(slot)
+            self.equipment[slot] = item_from_dict(item_data) if item_data else None
+        self.refresh_equipment()
         
-        # Restore inventory
-        if "inventory" in data and isinstance(data["inventory"], list):
-            for item_data in data["inventory"]:
-                if not isinstance(item_data, dict):
-                    continue
-                    
-                name = item_data.get("name", "Unknown Item")
-                value = item_data.get("value", 0)
-                slot = item_data.get("slot", "")
-                
-                # Determine item type and create appropriate object
-                if "effect_type" in item_data and "effect_value" in item_data:
-                    # This is a potion
-                    effect_type = item_data.get("effect_type", "heal")
-                    effect_value = item_data.get("effect_value", 0)
-                    item = Potion(name, value, effect_type, effect_value)
-                elif slot == "weapon" and "damage" in item_data:
-                    damage = item_data.get("damage", 0)
-                    stat_bonuses = item_data.get("stat_bonuses", {})
-                    str_bonus = stat_bonuses.get("strength", 0)
-                    dex_bonus = stat_bonuses.get("dexterity", 0)
-                    item = Weapon(name, damage, value, str_bonus, dex_bonus)
-                elif slot in ["armor", "helmet", "boots"] and "defense" in item_data:
-                    defense = item_data.get("defense", 0)
-                    stat_bonuses = item_data.get("stat_bonuses", {})
-                    
-                    if slot == "armor":
-                        con_bonus = stat_bonuses.get("constitution", 0)
-                        item = Armor(name, defense, value, con_bonus)
-                    elif slot == "helmet":
-                        int_bonus = stat_bonuses.get("intelligence", 0)
-                        item = Helmet(name, defense, value, int_bonus)
-                    elif slot == "boots":
-                        dex_bonus = stat_bonuses.get("dexterity", 0)
-                        item = Boots(name, defense, value, dex_bonus)
-                elif slot == "accessory":
-                    stat_bonuses = item_data.get("stat_bonuses", {})
-                    item = Accessory(name, value, stat_bonuses)
-                else:
-                    item = Item(name, value)
-                    
-                if not hasattr(self, 'inventory') or self.inventory is None:
-                    self.inventory = []
-                self.inventory.append(item)
+        for item_data in data.get("inventory", ()):
+            self._items.add(item_from_dict(item_data))
@@ -3,14 +3,13 @@ from .skill import Skill
 from .skill_manager import SkillManager
 from .skill_database import SkillDatabase
 from .action_manager import ActionManager
+from .status_engine import get_status_engine
 
 class PlayerSkills:
     def __init__(self, player):
         self.player = player
         self.skills: List[Skill] = []
         self.combat_sequence: List[Skill] = []
-        self.buffs = {}
-        self.status_effects = {}
         
         self.skill_database = SkillDatabase()
         self.skill_manager = SkillManager(self.skill_database)
@@ -40,6 +39,22 @@ class PlayerSkills:
         else:
             print("Warning: healing skill not found")
     
+    @property
+    def buffs(self):
+        return self.player.buffs
+    
+    @buffs.setter
+    def buffs(self, data):
+        self.player.buffs = data
+    
+    @property
+    def status_effects(self):
+        return self.player.status_effects
+    
+    @status_effects.setter
+    def status_effects(self, data):
+        self.player.status_effects = data
+    
     def learn_skill(self, skill: Skill) -> bool:
         if not skill:
             return False
@@ -76,52 +91,7 @@ class PlayerSkills:
         return False
     
     def update_status_effects(self) -> List[str]:
-        messages = []
-        
-        buffs_to_remove = []
-        for buff_type, buff_data in self.buffs.items():
-            buff_data['duration'] -= 1
-            if buff_data['duration'] <= 0:
-                buffs_to_remove.append(buff_type)
-                messages.append(f"{self.player.name}'s {buff_type} buff has expired.")
-        
-        for buff_type in buffs_to_remove:
-            del self.buffs[buff_type]
-        
-        statuses_to_remove = []
-        for status_type, status_data in self.status_effects.items():
-            if status_type == 'poison':
-                damage = status_data['value']
-                self.player.current_hp = max(0, self.player.current_hp - damage)
-                messages.append(f"{self.player.name} takes {damage} poison damage.")
-            elif status_type == 'regeneration':
-                healing = status_data['value']
-                self.player.current_hp = min(self.player.max_hp, self.player.current_hp + healing)
-                messages.append(f"{self.player.name} regenerates {healing} health.")
-            elif status_type == 'stunned':
-                messages.append(f"{self.player.name} is stunned and cannot act.")
-                if self.player.action_manager:
-                    self.player.action_manager.add_action_modifier(self.player.id, "stunned", -1.0, 1)
-            elif status_type == 'slowed':
-                slow_value = status_data.get('value', 0.5)
-                messages.append(f"{self.player.name} is slowed and gains action more slowly.")
-                if self.player.action_manager:
-                    self.player.action_manager.add_action_modifier(self.player.id, "slowed", -slow_value, 1)
-            
-            status_data['duration'] -= 1
-            if status_data['duration'] <= 0:
-                statuses_to_remove.append(status_type)
-                messages.append(f"{self.player.name} is no longer affected by {status_type}.")
-        
-        for status_type in statuses_to_remove:
-            del self.status_effects[status_type]
-        
-        if self.player.action_manager:
-            expired_modifiers = self.player.action_manager.update_action_modifiers(self.player.id)
-            for modifier in expired_modifiers:
-                messages.append(f"{self.player.name}'s {modifier} effect has expired.")
-                
-        return messages
+        return get_status_engine().tick(self.player)
         
     def to_dict(self) -> Dict[str, Any]:
         skills_list = []
@@ -160,31 +130,9 @@ class PlayerSkills:
         }
         
     def from_dict(self, data: Dict[str, Any]):
-        if not isinstance(data, dict):
-            return
-            
-        self.skills.clear()
-        self.combat_sequence.clear()
-        self.buffs.clear()
-        self.status_effects.clear()
-        
-        if "skills" in data and isinstance(data["skills"], list):
-            for skill_id in data["skills"]:
-                if skill_id and isinstance(skill_id, str):
-                    skill = self.skill_manager.get_skill(skill_id)
-                    if skill:
-                        self.skills.append(skill)
-        
-        if "combat_sequence" in data and isinstance(data["combat_sequence"], list):
-            for skill_id in data["combat_sequence"]:
-                if skill_id and isinstance(skill_id, str):
-                    skill = self.skill_manager.get_skill(skill_id)
-                    self.combat_sequence.append(skill)
-                else:
-                    self.combat_sequence.append(None)
-        
-        if "buffs" in data and isinstance(data["buffs"], dict):
-            self.buffs = data["buffs"]
-            
-        if "status_effects" in data and isinstance(data["status_effects"], dict):
-            self.status_effects = data["status_effects"]
+        """Restore from current-schema data; see save_migrations for older saves"""
+        get_skill = self.skill_manager.get_skill
+        self.skills[:] = [skill for skill in map(get_skill, data["skills"]) if skill]
+        self.combat_sequence[:] = [get_skill(skill_id) if skill_id else None for skill_id in data["combat_sequence"]]
+        self.buffs = {name: dict(buff) for name, buff in data["buffs"].items()}
+        self.status_effects = {name: dict(status) for name, status in data["status_effects"].items()}
@@ -0,0 +1,108 @@
+"""
+Save schema migrations.
+Player.to_dict stamps its data with SCHEMA_VERSION. Older data is upgraded one registered step
+at a time, so the from_dict loaders only ever see current, well-formed data.
+"""
+from typing import Any, Callable, Dict
+
+from .item_database import EQUIPMENT_TYPES
+
+SCHEMA_VERSION = 2
+SCHEMA_KEY = "schema_version"
+
+Migration = Callable[[Dict[str, Any]], Dict[str, Any]]
+_migrations: Dict[int, Migration] = {}
+
+
+def migration(version: int) -> Callable[[Migration], Migration]:
+    """Register a step that upgrades data of the given schema version to the next one"""
+    def register(step: Migration) -> Migration:
+        _migrations[version] = step
+        return step
+    return register
+
+
+def schema_version(data: Dict[str, Any]) -> int:
+    """Saves from before schema versions count as version 1"""
+    return data.get(SCHEMA_KEY, 1)
+
+
+def needs_migration(data: Any) -> bool:
+    return not isinstance(data, dict) or data.get(SCHEMA_KEY) != SCHEMA_VERSION
+
+
+def migrate(data: Any) -> Dict[str, Any]:
+    """Upgrade player data to the current schema; never modifies the data passed in"""
+    if not isinstance(data, dict):
+        raise ValueError("Player data must be a dictionary")
+    version = schema_version(data)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Save schema {version} is newer than supported {SCHEMA_VERSION}")
+    while version < SCHEMA_VERSION:
+        step = _migrations.get(version)
+        if step is None:
+            raise ValueError(f"No migration from save schema {version}")
+        data = step(data)
+        version += 1
+        data[SCHEMA_KEY] = version
+    return data
+
+
+def _equipment_v1(equipment: Any) -> Dict[str, Any]:
+    from .items import Equipment, item_from_dict
+
+    equipment = equipment if isinstance(equipment, dict) else {}
+    result = {}
+    for slot in EQUIPMENT_TYPES:
+        item_data = equipment.get(slot)
+        if isinstance(item_data, dict):
+            item = item_from_dict(dict({"slot": slot}, **item_data))
+            if isinstance(item, Equipment) and item.slot == slot:
+                result[slot] = item.to_dict()
+                continue
+        result[slot] = None
+    return result
+
+
+def _skills_v1(skills: Dict[str, Any]) -> Dict[str, Any]:
+    def valid(value, kind):
+        return value if isinstance(value, kind) else kind()
+
+    return {
+        "skills": [skill_id for skill_id in valid(skills.get("skills"), list) if skill_id and isinstance(skill_id, str)],
+        "combat_sequence": [skill_id if skill_id and isinstance(skill_id, str) else None
+                            for skill_id in valid(skills.get("combat_sequence"), list)],
+        "buffs": valid(skills.get("buffs"), dict),
+        "status_effects": valid(skills.get("status_effects"), dict)
+    }
+
+
+@migration(1)
+def _fill_missing_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Unversioned saves: fill every missing or malformed field the way the old loaders defaulted it"""
+    from .player import Player
+
+    player = Player(data.get("name", "Hero"))
+    player.level = data.get("level", 1)
+    if isinstance(data.get("base_stats"), dict):
+        for stat, value in data["base_stats"].items():
+            if stat in player.base_stats:
+                player.base_stats[stat] = value
+
+    migrated = player.to_dict()
+    for field in ("id", "experience", "experience_to_level", "gold", "playtime"):
+        if field in data:
+            migrated[field] = data[field]
+    migrated["max_hp"] = data.get("max_hp", player._calculate_max_hp())
+    migrated["current_hp"] = data.get("current_hp", migrated["max_hp"])
+
+    inventory = data.get("inventory")
+    if isinstance(inventory, dict):
+        items = inventory.get("inventory")
+        migrated["inventory"] = {
+            "equipment": _equipment_v1(inventory.get("equipment")),
+            "inventory": [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+        }
+    if isinstance(data.get("skills"), dict):
+        migrated["skills"] = _skills_v1(data["skills"])
+    return migrated
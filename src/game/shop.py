@@ -0,0 +1,152 @@
+"""
+Vendor trading.
+Prices come from item values. The shop buckets the player's inventory by sell price, keeps the
+distinct prices sorted and groups equipment copies by template, so bulk sales only touch the
+items being sold.
+"""
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set
+
+from .item_database import ItemDatabase, ItemTemplate, get_item_database
+from .items import Item, create_item
+
+SELL_RATE = 0.5
+
+
+class Shop:
+    """
+    Buys the player's items for a share of their value and sells items from the data templates.
+    Every sale is one transaction: all items leave the inventory and the gold is paid, or nothing happens.
+    """
+    def __init__(self, inventory, database: Optional[ItemDatabase] = None):
+        self.inventory = inventory
+        self.store = inventory.inventory
+        self.database = database or get_item_database()
+        rarities = self.database.get_loot_data().get("rarities") or {"common": {}}
+        self.rarities = list(rarities)
+        self.stock = sorted((template for template in self.database.templates.values() if template.value > 0),
+                            key=lambda template: (template.value, template.name))
+
+        self._prices: List[int] = []
+        self._by_price: Dict[int, Dict[int, Item]] = {}
+        self._price_of: Dict[int, int] = {}
+        self._copies: Dict[str, Dict[int, Item]] = {}
+        self._duplicates: Set[str] = set()
+        for item in self.store:
+            self._index(item)
+        self.store.add_listener(self._on_inventory_change)
+
+    @staticmethod
+    def unit_price(item: Item) -> int:
+        return int(item.value * SELL_RATE)
+
+    def sell_price(self, item: Item) -> int:
+        return self.unit_price(item) * item.count
+
+    def buy_price(self, template: ItemTemplate) -> int:
+        return template.value
+
+    def _index(self, item: Item) -> None:
+        price = self.unit_price(item)
+        bucket = self._by_price.get(price)
+        if bucket is None:
+            bucket = self._by_price[price] = {}
+            insort(self._prices, price)
+        bucket[item.uid] = item
+        self._price_of[item.uid] = price
+        if not item.stackable:
+            copies = self._copies.setdefault(item.template.id, {})
+            copies[item.uid] = item
+            if len(copies) > 1:
+                self._duplicates.add(item.template.id)
+
+    def _unindex(self, item: Item) -> None:
+        price = self._price_of.pop(item.uid, None)
+        if price is not None:
+            bucket = self._by_price[price]
+            del bucket[item.uid]
+            if not bucket:
+                del self._by_price[price]
+                del self._prices[bisect_left(self._prices, price)]
+        copies = self._copies.get(item.template.id)
+        if copies is not None and copies.pop(item.uid, None) is not None and len(copies) < 2:
+            self._duplicates.discard(item.template.id)
+            if not copies:
+                del self._copies[item.template.id]
+
+    def _on_inventory_change(self, item, added: bool) -> None:
+        if item is None:
+            self._prices.clear()
+            self._by_price.clear()
+            self._price_of.clear()
+            self._copies.clear()
+            self._duplicates.clear()
+        elif added:
+            self._index(item)
+        else:
+            self._unindex(item)
+
+    def items_by_price(self, descending: bool = True) -> List[Item]:
+        """Inventory items ordered by unit sell price"""
+        prices = reversed(self._prices) if descending else self._prices
+        return [item for price in prices for item in self._by_price[price].values()]
+
+    def sell_items(self, items: List[Item]) -> int:
+        """Sell a batch of inventory items as one transaction; returns the gold paid"""
+        batch = list({id(item): item for item in items}.values())
+        if any(item not in self.store for item in batch):
+            return 0
+        total = sum(self.sell_price(item) for item in batch)
+        for item in batch:
+            self.store.discard(item)
+        self.inventory.player.gold += total
+        return total
+
+    def sell(self, item: Item, amount: Optional[int] = None) -> int:
+        """Sell a whole stack, or amount items off it"""
+        if item not in self.store:
+            return 0
+        if amount is None or amount >= item.count:
+            return self.sell_items([item])
+        sold = self.store.take(item, amount)
+        if sold is None:
+            return 0
+        total = self.sell_price(sold)
+        self.inventory.player.gold += total
+        return total
+
+    def sell_below_value(self, price: int) -> int:
+        """Sell every stack whose unit sell price is below price"""
+        end = bisect_left(self._prices, price)
+        return self.sell_items([item for unit in self._prices[:end] for item in self._by_price[unit].values()])
+
+    def sell_below_rarity(self, rarity: str, equipment_only: bool = True) -> int:
+        """
+        Sell every item of a rarity lower than the given one. Consumables have no rarity of their
+        own and count as common, so they are kept unless equipment_only is False.
+        """
+        if rarity not in self.rarities:
+            raise ValueError(f"Unknown rarity: {rarity}")
+        items = []
+        for lower in self.rarities[:self.rarities.index(rarity)]:
+            items.extend(item for item in self.store.by_rarity(lower).to_list()
+                         if not (equipment_only and item.stackable))
+        return self.sell_items(items)
+
+    def sell_duplicates(self) -> int:
+        """Sell every extra copy of a piece of equipment, keeping the most valuable one"""
+        items = []
+        for template_id in self._duplicates:
+            copies = list(self._copies[template_id].values())
+            keep = max(copies, key=lambda item: item.value)
+            items.extend(item for item in copies if item is not keep)
+        return self.sell_items(items)
+
+    def buy(self, template_id: str) -> Optional[Item]:
+        """Buy one item from the stock; returns the item, or None if it is unknown or too expensive"""
+        template = self.database.get_template(template_id)
+        player = self.inventory.player
+        if template is None or template.value <= 0 or player.gold < self.buy_price(template):
+            return None
+        player.gold -= self.buy_price(template)
+        return self.store.add(create_item(template_id))
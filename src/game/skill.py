@@ -1,35 +1,6 @@
 from typing import Dict, Any, Callable, List, Optional, Set
 import random
-import os
-import pygame
-
-# Initialize sound variables
-attack_sound = None
-heal_sound = None
-sounds_initialized = False
-
-def init_sounds():
-    global attack_sound, heal_sound, sounds_initialized
-    
-    if sounds_initialized:
-        return
-        
-    try:
-        if pygame.mixer.get_init() is None:
-            return
-            
-        audio_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'audio')
-        attack_sound_path = os.path.join(audio_dir, 'attack.wav')
-        heal_sound_path = os.path.join(audio_dir, 'heal.wav')
-        
-        if os.path.exists(attack_sound_path):
-            attack_sound = pygame.mixer.Sound(attack_sound_path)
-        if os.path.exists(heal_sound_path):
-            heal_sound = pygame.mixer.Sound(heal_sound_path)
-            
-        sounds_initialized = True
-    except Exception as e:
-        print(f"Error loading skill sounds: {e}")
+from .combatant import Combatant
 
 class Skill:
     def __init__(self, skill_id: str, data: Dict[str, Any], effect_functions: Dict[str, Callable]):
@@ -45,19 +16,21 @@ class Skill:
         self.conditions = data.get("conditions", [])
         self.sound = data.get("sound")
         self.category = data.get("category", "general")
+        self.targeting = data.get("targeting", "single")
         self.tags = data.get("tags", [])
         
-    def can_use(self, user) -> bool:
+    def can_use(self, user: Combatant) -> bool:
         if self.current_cooldown > 0:
             return False
             
         # Check energy cost
-        if hasattr(user, 'energy') and user.energy < self.energy_cost:
+        if user.energy is not None and user.energy < self.energy_cost:
             return False
             
         # Check action cost if user has an action manager
-        if hasattr(user, 'action_manager') and user.action_manager is not None and hasattr(user, 'id'):
-            current_action = user.action_manager.get_current_action(user.id)
+        action_manager = user.action_manager
+        if action_manager is not None:
+            current_action = action_manager.get_current_action(user.id)
             if current_action < self.action_cost:
                 return False
                 
@@ -67,7 +40,7 @@ class Skill:
             if condition_type == "min_stat":
                 stat = condition["stat"]
                 value = condition["value"]
-                if hasattr(user, 'get_stats') and user.get_stats().get(stat, 0) < value:
+                if user.get_stat(stat) < value:
                     return False
             elif condition_type == "required_item":
                 item_type = condition["item_type"]
@@ -76,32 +49,25 @@ class Skill:
                     
         return True
         
-    def _has_required_item(self, user, item_type: str) -> bool:
-        if hasattr(user, 'equipment') and user.equipment:
-            for slot, item in user.equipment.items():
-                if item and hasattr(item, 'type') and item.type == item_type:
+    def _has_required_item(self, user: Combatant, item_type: str) -> bool:
+        equipment = user.equipment
+        if equipment:
+            for item in equipment.values():
+                if item is not None and item.item_type == item_type:
                     return True
         return False
         
-    def use(self, user, target) -> Dict[str, Any]:
+    def use(self, user: Combatant, target: Combatant) -> Dict[str, Any]:
         self.current_cooldown = self.cooldown
         
         # Consume energy if applicable
-        if hasattr(user, 'energy'):
+        if user.energy is not None:
             user.energy -= self.energy_cost
             
         # Consume action if applicable
-        if hasattr(user, 'action_manager') and user.action_manager is not None and hasattr(user, 'id'):
-            user.action_manager.consume_action(user.id, self.action_cost)
-            
-        # Initialize sounds if needed
-        init_sounds()
-            
-        # Play sound if specified
-        if self.sound == "attack" and attack_sound:
-            attack_sound.play()
-        elif self.sound == "heal" and heal_sound:
-            heal_sound.play()
+        action_manager = user.action_manager
+        if action_manager is not None:
+            action_manager.consume_action(user.id, self.action_cost)
             
         result = {"success": True, "message": f"{user.name} used {self.name}"}
         
@@ -113,7 +79,7 @@ class Skill:
                 
                 # Add basic user and target info to params
                 params["user"] = user.name
-                params["target"] = target.name if hasattr(target, 'name') else "target"
+                params["target"] = target.name
                 
                 # Let the effect function handle the message formatting
                 effect_result = self.effect_functions[effect_type](user, target, params)
@@ -122,7 +88,7 @@ class Skill:
                 if "message" in effect_result and isinstance(effect_result["message"], str):
                     effect_result["message"] = effect_result["message"].format(
                         user=user.name,
-                        target=target.name if hasattr(target, 'name') else "target",
+                        target=target.name,
                         **{k: v for k, v in effect_result.items() if k != "message"}
                     )
                     
@@ -12,6 +12,7 @@ class SkillDatabase:
         self.skills_dir = self.data_dir / "skills"
         self.skills = {}
         self.effects = {}
+        self.statuses = {"statuses": {}, "buffs": {}}
         
         # Create directories if they don't exist
         os.makedirs(self.skills_dir, exist_ok=True)
@@ -32,6 +33,12 @@ class SkillDatabase:
         if effects_path.exists():
             with open(effects_path, 'r') as f:
                 self.effects = json.load(f)
+        
+        # Load status and buff definitions
+        statuses_path = self.skills_dir / "statuses.json"
+        if statuses_path.exists():
+            with open(statuses_path, 'r') as f:
+                self.statuses = json.load(f)
     
     def save_data(self) -> None:
         """Save all skill data to JSON files"""
@@ -42,6 +49,10 @@ class SkillDatabase:
         # Save effects
         with open(self.skills_dir / "effects.json", 'w') as f:
             json.dump(self.effects, f, indent=2)
+        
+        # Save status and buff definitions
+        with open(self.skills_dir / "statuses.json", 'w') as f:
+            json.dump(self.statuses, f, indent=2)
     
     def get_skill(self, skill_id: str) -> Optional[Dict[str, Any]]:
         """Get a skill definition by ID"""
@@ -68,3 +79,7 @@ class SkillDatabase:
     def get_all_effects(self) -> Dict[str, Any]:
         """Get all effects"""
         return self.effects
+    
+    def get_status_definitions(self, kind: str = "statuses") -> Dict[str, Any]:
+        """Get the tick definitions for statuses or buffs"""
+        return self.statuses.get(kind, {})
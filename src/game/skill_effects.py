@@ -1,5 +1,6 @@
 from typing import Dict, List, Any, Callable
 import random
+from .combatant import Combatant
 
 def register_default_effects(skill_manager):
     """Register the default effect functions with the skill manager"""
@@ -9,7 +10,7 @@ def register_default_effects(skill_manager):
     skill_manager.register_effect("status", status_effect)
     skill_manager.register_effect("multi_hit", multi_hit_effect)
 
-def damage_effect(user, target, params):
+def damage_effect(user: Combatant, target: Combatant, params):
     base_damage = calculate_base_damage(user, params)
     actual_damage = target.take_damage(base_damage)
     
@@ -24,39 +25,31 @@ def damage_effect(user, target, params):
         "message": message
     }
 
-def calculate_base_damage(user, params):
+def calculate_base_damage(user: Combatant, params):
     base_damage = params.get("base_value", 0)
     base_damage = apply_weapon_scaling(user, base_damage, params)
     base_damage = apply_stat_scaling(user, base_damage, params)
     return apply_variance(base_damage, params)
 
-def apply_weapon_scaling(user, base_damage, params):
+def apply_weapon_scaling(user: Combatant, base_damage, params):
     weapon_scaling = params.get("weapon_scaling", 0)
     
     if weapon_scaling <= 0:
         return base_damage
         
-    weapon = None
-    
-    if hasattr(user, 'get_weapon'):
-        weapon = user.get_weapon()
-    elif hasattr(user, 'equipment') and user.equipment.get('weapon'):
-        weapon = user.equipment['weapon']
-    
-    if weapon and hasattr(weapon, 'damage'):
+    weapon = user.get_weapon()
+    if weapon is not None:
         damage_from_weapon = int(weapon.damage * weapon_scaling)
         base_damage += damage_from_weapon
     
     return base_damage
 
-def apply_stat_scaling(user, base_damage, params):
+def apply_stat_scaling(user: Combatant, base_damage, params):
     stat_scaling = params.get("stat_scaling", {})
-    if hasattr(user, 'get_stats'):
-        stats = user.get_stats()
-        for stat, scale in stat_scaling.items():
-            stat_value = stats.get(stat, 0)
-            damage_from_stat = stat_value * scale
-            base_damage += damage_from_stat
+    if not stat_scaling:
+        return base_damage
+    for stat, scale in stat_scaling.items():
+        base_damage += user.get_stat(stat) * scale
     return base_damage
 
 def apply_variance(base_value, params, is_damage=True):
@@ -71,7 +64,7 @@ def apply_variance(base_value, params, is_damage=True):
     final_value = max(1, int(base_value * variance))
     return final_value
 
-def format_damage_message(user, target, damage, params):
+def format_damage_message(user: Combatant, target: Combatant, damage, params):
     message = params.get("message", "")
     if not message:
         return f"{user.name} deals {damage} damage to {target.name}!"
@@ -87,7 +80,7 @@ def format_damage_message(user, target, damage, params):
         # Fallback in case of missing keys
         return f"{user.name} deals {damage} damage to {target.name}!"
 
-def healing_effect(user, target, params):
+def healing_effect(user: Combatant, target: Combatant, params):
     base_healing = params.get("base_value", 0)
     base_healing = apply_stat_scaling(user, base_healing, params)
     healing = apply_variance(base_healing, params, is_damage=False)
@@ -110,7 +103,7 @@ def healing_effect(user, target, params):
         "message": message
     }
 
-def format_healing_message(user, target, healing, params):
+def format_healing_message(user: Combatant, target: Combatant, healing, params):
     message = params.get("message", "")
     if not message:
         if user == target:
@@ -132,7 +125,7 @@ def format_healing_message(user, target, healing, params):
         else:
             return f"{user.name} heals {target.name} for {healing} health!"
 
-def buff_effect(user, target, params):
+def buff_effect(user: Combatant, target: Combatant, params):
     buff_type = params.get("buff_type", "defense")
     value = params.get("value", 1)
     duration = params.get("duration", 3)
@@ -147,23 +140,20 @@ def buff_effect(user, target, params):
         "message": message
     }
 
-def apply_buff(target, buff_type, value, duration):
-    if not hasattr(target, 'buffs'):
-        target.buffs = {}
-        
+def apply_buff(target: Combatant, buff_type, value, duration):
     target.buffs[buff_type] = {
         "value": value,
         "duration": duration
     }
 
-def format_buff_message(user, target, buff_type, value, duration, params):
+def format_buff_message(user: Combatant, target: Combatant, buff_type, value, duration, params):
     message = params.get("message", "")
     if not message:
         return f"{target.name} gains {value} {buff_type} for {duration} turns!"
     return message.format(user=user.name, target=target.name, 
                         value=value, buff_type=buff_type, duration=duration)
 
-def status_effect(user, target, params):
+def status_effect(user: Combatant, target: Combatant, params):
     status_type = params.get("status_type", "poison")
     value = params.get("value", 1)
     duration = params.get("duration", 3)
@@ -186,23 +176,20 @@ def status_effect(user, target, params):
         "message": message
     }
 
-def apply_status(target, status_type, value, duration):
-    if not hasattr(target, 'status_effects'):
-        target.status_effects = {}
-        
+def apply_status(target: Combatant, status_type, value, duration):
     target.status_effects[status_type] = {
         "value": value,
         "duration": duration
     }
 
-def format_status_message(user, target, status_type, duration, params):
+def format_status_message(user: Combatant, target: Combatant, status_type, duration, params):
     message = params.get("message", "")
     if not message:
         return f"{target.name} is afflicted with {status_type} for {duration} turns!"
     return message.format(user=user.name, target=target.name, 
                         status_type=status_type, duration=duration)
 
-def multi_hit_effect(user, target, params):
+def multi_hit_effect(user: Combatant, target: Combatant, params):
     base_damage = calculate_base_damage_for_multi_hit(user, params)
     num_hits = determine_number_of_hits(params)
     
@@ -217,7 +204,7 @@ def multi_hit_effect(user, target, params):
         "damage": total_damage  # Add damage key for compatibility
     }
 
-def calculate_base_damage_for_multi_hit(user, params):
+def calculate_base_damage_for_multi_hit(user: Combatant, params):
     base_damage = params.get("base_value", 0)
     base_damage = apply_weapon_scaling(user, base_damage, params)
     base_damage = apply_stat_scaling(user, base_damage, params)
@@ -237,7 +224,7 @@ def determine_number_of_hits(params):
             num_hits += 1
     return max(min_hits, num_hits)
 
-def apply_multi_hits(user, target, base_damage, num_hits, params):
+def apply_multi_hits(user: Combatant, target: Combatant, base_damage, num_hits, params):
     total_damage = 0
     hit_results = []
     damage_scaling = params.get("damage_scaling", 1.0)
@@ -262,7 +249,7 @@ def calculate_hit_damage(base_damage, hit_damage_scaling, params):
     
     return max(1, int(base_damage * hit_damage_scaling * variance))
 
-def format_multi_hit_message(user, target, num_hits, total_damage, params=None):
+def format_multi_hit_message(user: Combatant, target: Combatant, num_hits, total_damage, params=None):
     if params and "message" in params:
         # Add values to params for message formatting
         params["user"] = user.name
@@ -33,6 +33,10 @@ class SkillBuilder:
         self.skill_data["sound"] = sound_type
         return self
         
+    def with_targeting(self, targeting: str) -> 'SkillBuilder':
+        self.skill_data["targeting"] = targeting
+        return self
+        
     def with_category(self, category: str) -> 'SkillBuilder':
         self.skill_data["category"] = category
         return self
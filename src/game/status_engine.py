@@ -0,0 +1,150 @@
+"""
+Table-driven buff and status ticking shared by every combatant.
+Status types are defined in data and point at registered handlers; definitions are
+compiled into a table indexed by effect code so a tick never walks an if/elif chain.
+"""
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+from .combatant import effect_code, effect_name
+from .skill_database import SkillDatabase
+
+StatusHandler = Callable[[Any, Any, Dict[str, Any]], Any]
+
+
+def damage_handler(combatant, value, definition) -> int:
+    damage = min(combatant.current_hp, value)
+    combatant.current_hp -= damage
+    return damage
+
+
+def heal_handler(combatant, value, definition) -> int:
+    healed = max(0, min(combatant.max_hp - combatant.current_hp, value))
+    combatant.current_hp += healed
+    return healed
+
+
+def action_modifier_handler(combatant, value, definition) -> float:
+    action_manager = getattr(combatant, "action_manager", None)
+    if action_manager:
+        action_manager.add_action_modifier(combatant.id, definition["name"], action_modifier(value, definition), 1)
+    return value
+
+
+def action_modifier(value, definition) -> float:
+    """Action rate modifier of an action_modifier status: fixed in data, or minus the status value"""
+    return definition.get("modifier", -value)
+
+
+def message_handler(combatant, value, definition) -> Any:
+    return value
+
+
+class StatusEngine:
+    """
+    Ticks buffs and statuses for any number of combatants in one pass per round.
+    Handlers are registered by name and referenced from data/skills/statuses.json.
+    """
+    def __init__(self, database: Optional[SkillDatabase] = None):
+        self.database = database or SkillDatabase()
+        self.handlers: Dict[str, StatusHandler] = {}
+        self.definitions: Dict[str, Dict[str, Dict[str, Any]]] = {"statuses": {}, "buffs": {}}
+        self._tables: Dict[str, List[Optional[Tuple[StatusHandler, Dict[str, Any]]]]] = {"statuses": [], "buffs": []}
+
+        self.register_default_handlers()
+        self.load_definitions()
+
+    def register_handler(self, handler_name: str, handler: StatusHandler) -> None:
+        self.handlers[handler_name] = handler
+        self._compile()
+
+    def register_default_handlers(self) -> None:
+        self.handlers.update({
+            "damage": damage_handler,
+            "heal": heal_handler,
+            "action_modifier": action_modifier_handler,
+            "message": message_handler
+        })
+
+    def load_definitions(self) -> None:
+        """Load status and buff definitions from the skill database"""
+        for kind in ("statuses", "buffs"):
+            for name, definition in self.database.get_status_definitions(kind).items():
+                self.define(kind, name, definition)
+
+    def define(self, kind: str, name: str, definition: Dict[str, Any]) -> None:
+        """Add or replace the definition of a status or buff"""
+        self.definitions[kind][name] = dict(definition, name=name)
+        effect_code(name)
+        self._compile()
+
+    def _compile(self) -> None:
+        for kind, definitions in self.definitions.items():
+            table = [None] * (max((effect_code(name) for name in definitions), default=-1) + 1)
+            for name, definition in definitions.items():
+                handler = self.handlers.get(definition.get("handler", "message"))
+                if handler:
+                    table[effect_code(name)] = (handler, definition)
+            self._tables[kind] = table
+
+    def codes_for_handler(self, handler_name: str, kind: str = "statuses") -> List[int]:
+        """Effect codes whose definition uses the given handler"""
+        return [effect_code(name) for name, definition in self.definitions[kind].items()
+                if definition.get("handler") == handler_name]
+
+    def get_definition(self, name: str, kind: str = "statuses") -> Optional[Dict[str, Any]]:
+        return self.definitions[kind].get(name)
+
+    def tick_round(self, combatants: Iterable[Any]) -> List[str]:
+        """Advance buffs and statuses of every combatant by one round"""
+        messages = []
+        for combatant in combatants:
+            if combatant is not None:
+                messages.extend(self.tick(combatant))
+        return messages
+
+    def tick(self, combatant) -> List[str]:
+        """Apply each active effect's handler once, then expire effects whose time is up"""
+        messages = []
+        name = combatant.name
+
+        action_manager = getattr(combatant, "action_manager", None)
+        if action_manager:
+            for modifier in action_manager.update_action_modifiers(combatant.id):
+                messages.append(f"{name}'s {modifier} effect has expired.")
+
+        buffs, statuses = combatant.get_effect_lists()
+        if buffs is not None and buffs.codes:
+            self._apply(buffs, self._tables["buffs"], combatant, messages)
+            for code in buffs.advance():
+                messages.append(f"{name}'s {effect_name(code)} buff has expired.")
+
+        if statuses is not None and statuses.codes:
+            self._apply(statuses, self._tables["statuses"], combatant, messages)
+            for code in statuses.advance():
+                messages.append(f"{name} is no longer affected by {effect_name(code)}.")
+        return messages
+
+    def _apply(self, effects, table, combatant, messages: List[str]) -> None:
+        size = len(table)
+        for code, value in zip(effects.codes.tolist(), list(effects.values)):
+            entry = table[code] if code < size else None
+            if entry is None:
+                continue
+            handler, definition = entry
+            if value is None or value == 0:
+                value = definition.get("default_value", value)
+            amount = handler(combatant, value, definition)
+            message = definition.get("message")
+            if message:
+                messages.append(message.format(name=combatant.name, value=amount))
+
+
+_status_engine: Optional[StatusEngine] = None
+
+
+def get_status_engine() -> StatusEngine:
+    """Shared engine built from the default data directory"""
+    global _status_engine
+    if _status_engine is None:
+        _status_engine = StatusEngine()
+    return _status_engine
@@ -0,0 +1,330 @@
+"""
+Wave encounters: one battle against dozens to hundreds of enemies.
+Per-enemy HP, action points and effects live in shared numpy arrays, so action
+generation, targeting, area damage and status ticks are bulk operations.
+"""
+from typing import Dict, List, Any, Optional, Sequence, Iterator, Mapping, Tuple
+from collections.abc import MutableMapping
+import numpy as np
+
+from .combatant import effect_code, effect_name
+from .enemy_ai import SkillModel
+from .status_engine import get_status_engine, action_modifier
+
+TARGET_FRONT = "front"
+TARGET_LOWEST_HP = "lowest_hp"
+TARGET_RANDOM = "random"
+TARGET_ALL = "all"
+TARGET_RULES = (TARGET_FRONT, TARGET_LOWEST_HP, TARGET_RANDOM, TARGET_ALL)
+
+_DEFENSE = effect_code("defense")
+
+
+class EffectTable:
+    """Effect values and remaining durations for every wave member, one column per effect code."""
+    __slots__ = ("values", "durations")
+
+    def __init__(self, size: int):
+        self.values = np.zeros((size, 0), dtype=np.float64)
+        self.durations = np.zeros((size, 0), dtype=np.int32)
+
+    def _ensure_column(self, code: int) -> None:
+        missing = code + 1 - self.values.shape[1]
+        if missing > 0:
+            self.values = np.pad(self.values, ((0, 0), (0, missing)))
+            self.durations = np.pad(self.durations, ((0, 0), (0, missing)))
+
+    def set(self, indices: np.ndarray, code: int, value: float, duration: int) -> None:
+        self._ensure_column(code)
+        self.values[indices, code] = value
+        self.durations[indices, code] = duration
+
+    def clear(self, indices: np.ndarray, code: int) -> None:
+        if code < self.values.shape[1]:
+            self.values[indices, code] = 0
+            self.durations[indices, code] = 0
+
+    def active(self, code: int) -> np.ndarray:
+        if code >= self.durations.shape[1]:
+            return np.zeros(self.durations.shape[0], dtype=bool)
+        return self.durations[:, code] > 0
+
+    def value(self, code: int) -> np.ndarray:
+        if code >= self.values.shape[1]:
+            return np.zeros(self.values.shape[0])
+        return np.where(self.durations[:, code] > 0, self.values[:, code], 0.0)
+
+    def tick(self, alive: np.ndarray) -> np.ndarray:
+        """Count down one round for living members and return how many effects expired per code"""
+        running = (self.durations > 0) & alive[:, None]
+        self.durations -= running
+        expired = running & (self.durations == 0)
+        self.values[expired] = 0
+        return expired.sum(axis=0)
+
+
+class WaveEffects(MutableMapping):
+    """Dict-like effects of a group of wave members, so skill effects can apply buffs and statuses to it."""
+    __slots__ = ("table", "indices")
+
+    def __init__(self, table: EffectTable, indices: np.ndarray):
+        self.table = table
+        self.indices = indices
+
+    def _codes(self) -> List[int]:
+        if not len(self.indices):
+            return []
+        running = (self.table.durations[self.indices] > 0).any(axis=0)
+        return [int(code) for code in np.flatnonzero(running)]
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        code = effect_code(name)
+        if code not in self._codes():
+            raise KeyError(name)
+        first = self.indices[self.table.durations[self.indices, code] > 0][0]
+        return {"value": self.table.values[first, code], "duration": int(self.table.durations[first, code])}
+
+    def __setitem__(self, name: str, data: Mapping) -> None:
+        self.table.set(self.indices, effect_code(name), data.get("value", 0), int(data.get("duration", 0)))
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self.table.clear(self.indices, effect_code(name))
+
+    def __contains__(self, name) -> bool:
+        return effect_code(name) in self._codes()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([effect_name(code) for code in self._codes()])
+
+    def __len__(self) -> int:
+        return len(self._codes())
+
+
+class WaveTarget:
+    """One or more wave members presented as a single skill target."""
+    __slots__ = ("wave", "indices")
+    action_manager = None
+    energy = None
+    equipment = None
+
+    def __init__(self, wave: 'Wave', indices: np.ndarray):
+        self.wave = wave
+        self.indices = indices
+
+    @property
+    def id(self) -> str:
+        return f"wave_{'_'.join(str(index) for index in self.indices.tolist())}"
+
+    @property
+    def name(self) -> str:
+        if len(self.indices) == 1:
+            return self.wave.member_name(int(self.indices[0]))
+        return f"{len(self.indices)} enemies"
+
+    @property
+    def current_hp(self) -> int:
+        return int(self.wave.hp[self.indices].sum())
+
+    @property
+    def max_hp(self) -> int:
+        return int(self.wave.max_hp[self.indices].sum())
+
+    @property
+    def buffs(self) -> WaveEffects:
+        return WaveEffects(self.wave.buffs, self.indices)
+
+    @property
+    def status_effects(self) -> WaveEffects:
+        return WaveEffects(self.wave.statuses, self.indices)
+
+    def take_damage(self, amount: int) -> int:
+        return self.wave.damage_members(self.indices, amount)
+
+    def heal(self, amount: int) -> int:
+        return self.wave.heal_members(self.indices, amount)
+
+    def is_alive(self) -> bool:
+        return bool((self.wave.hp[self.indices] > 0).any())
+
+    def get_weapon(self) -> None:
+        return None
+
+    def get_stat(self, stat: str) -> int:
+        return 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return {}
+
+
+class Wave:
+    """
+    A horde of enemies built from a few archetypes. Each archetype is a regular Enemy
+    that provides the name, stats and skills; members only carry their own numbers.
+    Members attack with their archetype's strongest damaging skill per action point.
+    """
+    def __init__(self, archetypes: List[Any], kinds: Sequence[int], action_rates: Optional[Sequence[float]] = None,
+                 rng: Optional[np.random.Generator] = None):
+        self.archetypes = archetypes
+        self.rng = rng or np.random.default_rng()
+        self.kinds = np.asarray(kinds, dtype=np.int32)
+        self.size = len(self.kinds)
+
+        kind_rates = np.asarray(action_rates if action_rates is not None else [1.0] * len(archetypes), dtype=np.float64)
+        kind_attacks = [self._attack_skill(archetype) for archetype in archetypes]
+        self.kind_attack_cost = np.array([model.action_cost if model else np.inf for _, model in kind_attacks])
+        self.kind_attack_power = np.array([float(sum(model.hits)) if model else 0.0 for _, model in kind_attacks])
+        self.kind_attack_name = [skill.name if skill else "an attack" for skill, _ in kind_attacks]
+
+        self.levels = np.array([archetype.level for archetype in archetypes], dtype=np.int32)[self.kinds]
+        self.max_hp = np.array([archetype.max_hp for archetype in archetypes], dtype=np.int32)[self.kinds]
+        self.hp = self.max_hp.copy()
+        self.defense = np.array([archetype.defense for archetype in archetypes], dtype=np.int32)[self.kinds]
+        self.ap_rate = kind_rates[self.kinds]
+        self.attack_cost = self.kind_attack_cost[self.kinds]
+        self.ap = self.rng.uniform(0.0, np.where(np.isfinite(self.attack_cost), self.attack_cost, 0.0))
+
+        self.buffs = EffectTable(self.size)
+        self.statuses = EffectTable(self.size)
+
+        engine = get_status_engine()
+        self.damage_codes = engine.codes_for_handler("damage")
+        self.heal_codes = engine.codes_for_handler("heal")
+        self.heal_buff_codes = engine.codes_for_handler("heal", "buffs")
+        self.modifiers = [(code, engine.get_definition(effect_name(code)))
+                          for code in engine.codes_for_handler("action_modifier")]
+
+    @staticmethod
+    def _attack_skill(archetype) -> Tuple[Optional[Any], Optional[SkillModel]]:
+        best_skill, best = None, None
+        for skill in archetype.skills:
+            model = SkillModel(skill, archetype)
+            if not model.hits:
+                continue
+            if best is None or sum(model.hits) / model.action_cost > sum(best.hits) / best.action_cost:
+                best_skill, best = skill, model
+        return best_skill, best
+
+    def member_name(self, index: int) -> str:
+        return self.archetypes[self.kinds[index]].name
+
+    def alive(self) -> np.ndarray:
+        return self.hp > 0
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.hp))
+
+    def is_cleared(self) -> bool:
+        return not self.hp.any()
+
+    def total_hp(self) -> int:
+        return int(self.hp.sum())
+
+    def total_max_hp(self) -> int:
+        return int(self.max_hp.sum())
+
+    def select(self, rule: str = TARGET_FRONT) -> Optional[WaveTarget]:
+        """Pick the members a skill hits: the front one, the weakest, a random one or everyone"""
+        alive = np.flatnonzero(self.hp)
+        if not len(alive):
+            return None
+        if rule == TARGET_ALL:
+            return WaveTarget(self, alive)
+        if rule == TARGET_LOWEST_HP:
+            return WaveTarget(self, alive[np.argmin(self.hp[alive])][None])
+        if rule == TARGET_RANDOM:
+            return WaveTarget(self, self.rng.choice(alive, size=1))
+        return WaveTarget(self, alive[:1])
+
+    def damage_members(self, indices: np.ndarray, amount: int) -> int:
+        indices = indices[self.hp[indices] > 0]
+        reduction = self.defense[indices] + self.buffs.value(_DEFENSE)[indices].astype(np.int32)
+        actual = np.minimum(np.maximum(1, int(amount) - reduction), self.hp[indices])
+        self.hp[indices] -= actual
+        return int(actual.sum())
+
+    def heal_members(self, indices: np.ndarray, amount: int) -> int:
+        indices = indices[self.hp[indices] > 0]
+        healed = np.minimum(int(amount), self.max_hp[indices] - self.hp[indices])
+        self.hp[indices] += healed
+        return int(healed.sum())
+
+    def action_factor(self) -> np.ndarray:
+        """Action rate multiplier of every member from action-modifying statuses such as stunned or slowed"""
+        modifier = np.zeros(self.size)
+        for code, definition in self.modifiers:
+            active = self.statuses.active(code)
+            if active.any():
+                modifier += np.where(active, action_modifier(self.statuses.value(code), definition), 0.0)
+        return np.maximum(0.0, 1.0 + modifier)
+
+    def generate_action(self, tick_time: float) -> None:
+        """Add action points to every living member in one pass"""
+        gain = self.ap_rate * tick_time * self.action_factor()
+        gain[self.hp <= 0] = 0.0
+        self.ap += gain
+
+    def resolve_attacks(self, target) -> Dict[str, Any]:
+        """Every member with enough action points attacks the target; damage is summed in bulk"""
+        ready = np.flatnonzero((self.hp > 0) & (self.ap >= self.attack_cost) & (self.action_factor() > 0))
+        if not len(ready):
+            return {"attackers": 0, "damage": 0, "message": ""}
+
+        self.ap[ready] -= self.attack_cost[ready]
+        raw = self.kind_attack_power[self.kinds[ready]] * self.rng.uniform(0.8, 1.2, size=len(ready))
+        hits = np.maximum(1, raw.astype(np.int64) - target.get_damage_reduction())
+        damage = min(int(hits.sum()), target.current_hp)
+        target.current_hp -= damage
+
+        if len(ready) == 1:
+            attacker = int(ready[0])
+            message = f"{self.member_name(attacker)} uses {self.kind_attack_name[self.kinds[attacker]]} on {target.name} for {damage} damage!"
+        else:
+            message = f"{len(ready)} enemies attack {target.name} for {damage} total damage!"
+        return {"attackers": len(ready), "damage": damage, "message": message}
+
+    def end_round(self) -> List[str]:
+        """Apply damage and healing over time, then count down all buffs and statuses"""
+        messages = []
+        alive = self.hp > 0
+
+        dot = sum((self.statuses.value(code) for code in self.damage_codes), np.zeros(self.size)).astype(np.int32)
+        dot[~alive] = 0
+        if dot.any():
+            dot = np.minimum(dot, self.hp)
+            self.hp -= dot
+            messages.append(f"{np.count_nonzero(dot)} enemies take {int(dot.sum())} damage over time.")
+
+        regen = sum((self.statuses.value(code) for code in self.heal_codes), np.zeros(self.size))
+        regen = sum((self.buffs.value(code) for code in self.heal_buff_codes), regen)
+        regen = np.minimum(regen.astype(np.int32), self.max_hp - self.hp)
+        regen[~alive | (self.hp <= 0)] = 0
+        if regen.any():
+            self.hp += regen
+            messages.append(f"{np.count_nonzero(regen)} enemies regenerate {int(regen.sum())} health.")
+
+        alive = self.hp > 0
+        for table in (self.buffs, self.statuses):
+            for code, count in enumerate(table.tick(alive)):
+                if count:
+                    messages.append(f"{effect_name(code)} wears off {int(count)} enemies.")
+        return messages
+
+    def defeated_by_kind(self) -> Dict[str, int]:
+        """Number of defeated members per archetype id"""
+        counts = np.bincount(self.kinds[self.hp <= 0], minlength=len(self.archetypes))
+        defeated: Dict[str, int] = {}
+        for archetype, count in zip(self.archetypes, counts.tolist()):
+            if count:
+                defeated[archetype.id] = defeated.get(archetype.id, 0) + count
+        return defeated
+
+    def rewards(self) -> Dict[str, int]:
+        """Experience and gold for every defeated member"""
+        defeated = self.levels[self.hp <= 0]
+        return {
+            "experience": int(defeated.sum()) * 20,
+            "gold": int(defeated.sum()) * 10 + int(self.rng.integers(0, 11))
+        }
+
@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import pygame
+from src.engine.asset_manager import AssetManager, AssetType
+
+class TestAssetManager(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.screen = pygame.display.set_mode((320, 240))
+        self.assets = AssetManager(320, 240)
+
+    def test_images_are_converted_to_the_display_format(self):
+        title = self.assets.get_image(AssetType.TITLE_SCREEN)
+        self.assertEqual(title.get_size(), (320, 240))
+        for asset_type, image in self.assets.images.items():
+            self.assertEqual(image.get_bitsize(), self.screen.get_bitsize())
+
+    def test_scaled_images_are_cached_per_size(self):
+        small = self.assets.get_scaled_image(AssetType.ENEMY_GOBLIN, (32, 32))
+        self.assertEqual(small.get_size(), (32, 32))
+        self.assertIs(self.assets.get_scaled_image(AssetType.ENEMY_GOBLIN, [32, 32]), small)
+        self.assertEqual(self.assets.get_scaled_image(AssetType.ENEMY_GOBLIN, (64, 64)).get_size(), (64, 64))
+        self.assertEqual(self.assets.scales, 2)
+
+    def test_images_load_without_a_display(self):
+        pygame.display.quit()
+        assets = AssetManager(320, 240)
+        self.assertIsNotNone(assets.get_scaled_image(AssetType.ENEMY_ORC, (16, 16)))
+
+if __name__ == '__main__':
+    unittest.main()
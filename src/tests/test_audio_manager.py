@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+import wave
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import pygame
+from src.engine.audio_manager import AudioManager, MusicType
+from src.engine.game import GameState, upcoming_music
+from src.engine.settings import SettingsStore
+from src.engine.sound_bank import SoundBank
+
+class TestAudioManager(unittest.TestCase):
+
+    def setUp(self):
+        pygame.mixer.init()
+        self.directory = tempfile.TemporaryDirectory()
+        self.audio = AudioManager(SettingsStore(os.path.join(self.directory.name, "settings.json")),
+                                  SoundBank(), SoundBank())
+        for music_type in MusicType:
+            path = os.path.join(self.directory.name, f"{music_type.name}.wav")
+            with wave.open(path, 'wb') as f:
+                f.setnchannels(2)
+                f.setsampwidth(2)
+                f.setframerate(44100)
+                f.writeframes(b"\x01\x00" * 2 * 44100 * 4)
+            self.audio.music_paths[music_type] = path
+
+    def tearDown(self):
+        self.audio.stop_music()
+        self.directory.cleanup()
+
+    def settle(self):
+        self.assertTrue(self.audio.music_bank.flush(5))
+        self.audio.update()
+
+    def test_tracks_crossfade_on_separate_channels(self):
+        self.audio.play_music(MusicType.MENU)
+        self.assertIsNone(self.audio.music_channel)
+        self.settle()
+        first = self.audio.music_channel
+        self.assertTrue(first.get_busy())
+
+        self.audio.play_music(MusicType.TOWN)
+        self.settle()
+        self.assertIsNot(self.audio.music_channel, first)
+        self.assertTrue(self.audio.music_channel.get_busy())
+        self.assertTrue(first.get_busy())
+
+    def test_prefetched_tracks_start_without_waiting(self):
+        self.audio.prefetch_music([MusicType.BATTLE])
+        self.assertTrue(self.audio.music_bank.flush(5))
+        self.assertIsNone(self.audio.music_channel)
+
+        self.audio.play_music(MusicType.BATTLE)
+        self.assertTrue(self.audio.music_channel.get_busy())
+        self.assertEqual(self.audio.music_bank.decodes, 1)
+
+    def test_superseded_track_never_starts(self):
+        self.audio.play_music(MusicType.MENU)
+        self.audio.play_music(MusicType.TOWN)
+        self.settle()
+        self.assertIs(self.audio.music_sound, self.audio.music_bank.get(self.audio.music_paths[MusicType.TOWN]))
+        self.assertEqual(sum(channel.get_busy() for channel in self.audio.music_channels), 1)
+
+    def test_upcoming_music_follows_state_transitions(self):
+        self.assertEqual(upcoming_music(GameState.MAIN_MENU), [MusicType.TOWN])
+        self.assertEqual(upcoming_music(GameState.COMBAT_SETUP), [MusicType.BATTLE, MusicType.AFTER_COMBAT])
+        self.assertEqual(upcoming_music(GameState.COMBAT), [MusicType.AFTER_COMBAT, MusicType.TOWN])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.channel_pool import ChannelMixer, ChannelPool
+
+class FakeChannel:
+    def __init__(self):
+        self.sound = None
+        self.volume = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def play(self, sound):
+        self.sound = sound
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def stop(self):
+        self.sound = None
+
+class TestChannelPool(unittest.TestCase):
+
+    def setUp(self):
+        self.channels = [FakeChannel(), FakeChannel()]
+        self.pool = ChannelPool("combat", self.channels)
+
+    def playing(self):
+        return [channel.sound for channel in self.channels]
+
+    def test_voices_are_capped_and_oldest_equal_priority_is_stolen(self):
+        for sound in ("a", "b", "c"):
+            self.assertTrue(self.pool.play(sound, 0.5))
+        self.assertEqual(self.playing(), ["c", "b"])
+        self.assertEqual((self.pool.plays, self.pool.stolen), (3, 1))
+        self.assertEqual(self.channels[0].volume, 0.5)
+
+    def test_low_priority_sounds_never_steal_from_higher(self):
+        self.pool.play("heal", priority=2)
+        self.pool.play("attack", priority=0)
+        self.assertTrue(self.pool.play("heal2", priority=1))
+        self.assertEqual(self.playing(), ["heal", "heal2"])
+        self.assertFalse(self.pool.play("attack2", priority=0))
+        self.assertEqual(self.pool.dropped, 1)
+
+        self.channels[0].stop()
+        self.assertTrue(self.pool.play("attack3", priority=0))
+        self.assertEqual(self.playing(), ["attack3", "heal2"])
+
+    def test_mixer_dedupes_a_frames_requests(self):
+        mixer = ChannelMixer({"combat": self.pool})
+        for _ in range(100):
+            mixer.request("combat", "attack.wav")
+        mixer.request("combat", "heal.wav", priority=1)
+        mixer.request("combat", "heal.wav", 0.3, priority=2)
+
+        self.assertEqual(self.playing(), [None, None])
+        self.assertEqual(mixer.update(), 2)
+        self.assertEqual(self.playing(), ["heal.wav", "attack.wav"])
+        self.assertEqual(self.channels[0].volume, 0.3)
+        self.assertEqual((mixer.requests, mixer.deduped), (102, 100))
+        self.assertEqual(mixer.update(), 0)
+
+    def test_mixer_loads_sounds_only_when_playing(self):
+        loaded = []
+        mixer = ChannelMixer({"combat": self.pool}, lambda key: loaded.append(key) or (key + ".wav" if key != "missing" else None))
+        for _ in range(10):
+            mixer.request("combat", "attack")
+        mixer.request("combat", "missing")
+        self.assertEqual(loaded, [])
+        self.assertEqual(mixer.update(), 1)
+        self.assertEqual(sorted(loaded), ["attack", "missing"])
+        self.assertEqual(self.playing(), ["attack.wav", None])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import sys
+import logging
+import subprocess
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.player import Player
+from game.action_manager import ActionManager
+from game.combat import CombatManager
+from game.combat_events import EventBus, SkillUsed, DamageDealt, CombatEnded
+
+class TestCombatEvents(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_events_are_delivered_in_batches_per_type(self):
+        bus = EventBus()
+        batches = []
+        bus.subscribe(SkillUsed, batches.append)
+        bus.subscribe(DamageDealt, batches.append)
+        bus.publish(SkillUsed("Hero", "Goblin", "basic_attack", "attack", "hit"))
+        bus.publish(DamageDealt("Hero", "Goblin", 5))
+        bus.publish(SkillUsed("Goblin", "Hero", "basic_attack", "attack", "hit back"))
+        bus.publish(CombatEnded("Hero", True, {}))
+
+        self.assertEqual(batches, [])
+        self.assertEqual(bus.dispatch(), 3)
+        self.assertEqual([[type(event) for event in batch] for batch in batches],
+                         [[SkillUsed, SkillUsed], [DamageDealt]])
+        self.assertEqual(bus.dispatch(), 0)
+
+        bus.unsubscribe(DamageDealt, batches.append)
+        bus.publish(DamageDealt("Hero", "Goblin", 5))
+        self.assertEqual(bus.published, 3)
+
+    def test_battle_publishes_skills_damage_and_end(self):
+        bus = EventBus()
+        seen = {SkillUsed: [], DamageDealt: [], CombatEnded: []}
+        for event_type, events in seen.items():
+            bus.subscribe(event_type, events.extend)
+
+        combat = CombatManager(Player("Hero", ActionManager()), bus)
+        combat.start_new_battle(enemy_level=1)
+        clock = 0.0
+        while combat.combat_active and clock < 2000:
+            clock += 1.0
+            combat.update(clock)
+        bus.dispatch()
+
+        self.assertTrue(seen[SkillUsed])
+        self.assertTrue(all(event.amount > 0 for event in seen[DamageDealt]))
+        self.assertEqual([(event.player, event.victory) for event in seen[CombatEnded]], [("Hero", combat.victory)])
+
+    def test_simulation_imports_without_pygame(self):
+        code = ("import sys; sys.path.insert(0, 'src'); import game.combat, game.expedition; "
+                "print('pygame' in sys.modules)")
+        output = subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parent.parent.parent),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+if __name__ == '__main__':
+    unittest.main()
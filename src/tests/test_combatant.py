@@ -0,0 +1,72 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.combatant import Combatant, CombatantCore, effect_code, effect_name
+from game.enemy_manager import Enemy
+from game.skill_manager import SkillManager
+from game.skill_database import SkillDatabase
+from game.player import Player
+
+class TestCombatantCore(unittest.TestCase):
+
+    def setUp(self):
+        self.skill_manager = SkillManager(SkillDatabase())
+        self.skill_manager.register_default_effects()
+        self.skill_manager.load_all_skills()
+        self.enemy = Enemy("orc", {"name": "Orc", "level": 2, "base_stats": {"strength": 12, "constitution": 9}},
+                           self.skill_manager)
+
+    def test_enemy_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.enemy, "__dict__"))
+        self.assertIsInstance(self.enemy, CombatantCore)
+
+    def test_players_and_enemies_are_combatants(self):
+        self.assertIsInstance(self.enemy, Combatant)
+        self.assertIsInstance(Player("Hero"), Combatant)
+
+    def test_effect_codes_are_stable(self):
+        code = effect_code("poison")
+        self.assertEqual(effect_code("poison"), code)
+        self.assertEqual(effect_name(code), "poison")
+
+    def test_stats_view_writes_through(self):
+        self.enemy.base_stats["strength"] += 3
+
+        self.assertEqual(self.enemy.strength, 15)
+        self.assertEqual(self.enemy.get_stats()["strength"], 15)
+        self.assertEqual(self.enemy.get_stats()["wisdom"], 0)
+
+    def test_effect_view_behaves_like_dict(self):
+        self.enemy.buffs["defense"] = {"value": 4, "duration": 2}
+        self.enemy.buffs["defense"]["duration"] -= 1
+
+        self.assertIn("defense", self.enemy.buffs)
+        self.assertEqual(self.enemy.buffs["defense"]["duration"], 1)
+        self.assertEqual(self.enemy.get_buff_value("defense"), 4)
+
+        del self.enemy.buffs["defense"]
+        self.assertNotIn("defense", self.enemy.buffs)
+        self.assertEqual(len(self.enemy.buffs), 0)
+
+    def test_defense_buff_reduces_damage(self):
+        self.enemy.defense = 0
+        self.enemy.buffs = {"defense": {"value": 5, "duration": 1}}
+
+        self.assertEqual(self.enemy.take_damage(8), 3)
+
+    def test_player_effects_round_trip(self):
+        player = Player("Hero")
+        player.status_effects["poison"] = {"value": 3, "duration": 2}
+        data = player.to_dict()
+
+        restored = Player.from_dict(data)
+
+        self.assertEqual(restored.status_effects["poison"]["value"], 3)
+        self.assertEqual(restored.base_stats["strength"], 10)
+        self.assertEqual(restored.skills_manager.status_effects["poison"]["duration"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
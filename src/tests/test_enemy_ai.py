@@ -0,0 +1,79 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.enemy_manager import Enemy
+from game.enemy_ai import SmartPlanner
+from game.skill_manager import SkillManager
+from game.skill_database import SkillDatabase
+from game.player import Player
+from game.action_manager import ActionManager
+
+class TestSmartPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.skill_manager = SkillManager(SkillDatabase())
+        self.skill_manager.register_default_effects()
+        self.skill_manager.load_all_skills()
+        self.action_manager = ActionManager()
+        self.player = Player("Test Player", self.action_manager)
+        self.enemy = Enemy("orc", {
+            "name": "Orc",
+            "level": 2,
+            "skills": ["basic_attack", "power_attack", "shield_bash"],
+            "behavior": "smart"
+        }, self.skill_manager, self.action_manager)
+        self.action_manager.generate_action(self.enemy.id, 10.0)
+
+    def test_chooses_available_skill(self):
+        planner = SmartPlanner()
+        available = self.enemy._get_available_skills()
+        choice = planner.choose(self.enemy, self.player, available)
+
+        self.assertIn(choice, available)
+
+    def test_respects_node_budget(self):
+        planner = SmartPlanner(time_budget=10.0, node_budget=50, max_depth=10)
+        planner.choose(self.enemy, self.player, self.enemy._get_available_skills())
+
+        self.assertLess(planner.last_depth, 10)
+        self.assertLessEqual(planner.nodes, 51)
+
+    def test_repeated_state_uses_cache(self):
+        planner = SmartPlanner()
+        available = self.enemy._get_available_skills()
+        first = planner.choose(self.enemy, self.player, available)
+        planner.nodes = 0
+        second = planner.choose(self.enemy, self.player, available)
+
+        self.assertIs(first, second)
+        self.assertEqual(planner.nodes, 0)
+        self.assertEqual(len(planner.cache), 1)
+
+    def test_finishing_blow_is_preferred(self):
+        self.player.current_hp = 1
+        choice = SmartPlanner().choose(self.enemy, self.player, self.enemy._get_available_skills())
+
+        self.assertIn("damage", [effect["type"] for effect in choice.effects])
+
+    def test_finishing_blow_beats_healing(self):
+        enemy = Enemy("orc", {
+            "name": "Orc",
+            "level": 2,
+            "skills": ["basic_attack", "healing"],
+            "behavior": "smart"
+        }, self.skill_manager, self.action_manager)
+        self.action_manager.generate_action(enemy.id, 10.0)
+        enemy.current_hp = 5
+
+        choice = SmartPlanner().choose(enemy, self.player, enemy._get_available_skills())
+        self.assertEqual(choice.id, "healing")
+
+        self.player.current_hp = 1
+        choice = SmartPlanner().choose(enemy, self.player, enemy._get_available_skills())
+        self.assertEqual(choice.id, "basic_attack")
+
+if __name__ == "__main__":
+    unittest.main()
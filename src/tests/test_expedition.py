@@ -0,0 +1,65 @@
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.player import Player
+from game.action_manager import ActionManager
+from game.expedition import Expedition, ExpeditionScheduler
+
+class TestExpeditionScheduler(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.scheduler = ExpeditionScheduler(frame_budget=1.0)
+        self.main = self.scheduler.add(self._expedition("Hero", auto_restart=False), focus=True)
+        self.parties = [self.scheduler.add(self._expedition(f"Mercenary {i}")) for i in range(3)]
+        for expedition in self.parties:
+            expedition.start()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _expedition(self, name, auto_restart=True):
+        return Expedition(Player(name, ActionManager()), enemy_level=1, auto_restart=auto_restart)
+
+    def test_focused_expedition_stays_focused(self):
+        self.assertIs(self.scheduler.focused, self.main)
+        self.assertEqual(self.scheduler.background(), self.parties)
+
+    def test_action_points_are_granted_per_tick(self):
+        combat = self.parties[0].combat
+        self.scheduler.update(100.0)
+        before = combat.action_manager.get_current_action(combat.player.id)
+        self.scheduler.update(102.0)
+
+        gained = combat.action_manager.get_current_action(combat.player.id) - before
+        self.assertGreaterEqual(gained, 0)
+        self.assertEqual(self.scheduler._tick_clock, 102.0)
+
+    def test_idle_expedition_does_not_advance(self):
+        self.scheduler.update(50.0)
+
+        self.assertFalse(self.main.combat.combat_active)
+        self.assertEqual(self.main.clock, 50.0)
+
+    def test_background_battles_progress(self):
+        for second in range(400):
+            self.scheduler.update(1000.0 + second)
+
+        finished = sum(expedition.victories + expedition.defeats for expedition in self.parties)
+        self.assertGreater(finished, 0)
+        self.assertTrue(all(expedition.combat.combat_active for expedition in self.parties))
+
+    def test_exhausted_budget_defers_work(self):
+        self.scheduler.update(10.0)
+        self.scheduler.frame_budget = 0.0
+        self.scheduler.update(12.0)
+
+        self.assertEqual(self.scheduler.lagging, len(self.parties))
+        self.assertTrue(all(expedition.clock < 12.0 for expedition in self.parties))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.item_store import ItemStore
+from game.items import Weapon, Armor, Potion
+from game.player import Player
+
+class TestItemStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ItemStore()
+        self.sword = self.store.add(Weapon("Sword", 5, 10))
+        self.potion = self.store.add(Potion("Potion", 20, "heal", 30))
+        self.armor = self.store.add(Armor("Mail", 3, 15))
+
+    def test_keeps_insertion_order(self):
+        self.assertEqual(list(self.store), [self.sword, self.potion, self.armor])
+        self.assertIs(self.store[1], self.potion)
+        self.assertIs(self.store[-1], self.armor)
+
+    def test_lookups(self):
+        self.assertIs(self.store.get(self.sword.uid), self.sword)
+        self.assertIs(self.store.first_by_name("Potion"), self.potion)
+        self.assertEqual(self.store.by_slot("armor").to_list(), [self.armor])
+        self.assertEqual(self.store.by_type("weapon").to_list(), [self.sword])
+        self.assertIsNone(self.store.first_by_name("Missing"))
+
+    def test_views_follow_changes(self):
+        cheap = self.store.view(lambda item: item.value < 16)
+        weapons = self.store.by_type("weapon")
+        self.assertEqual(cheap.to_list(), [self.sword, self.armor])
+
+        self.store.remove(self.sword)
+        spear = self.store.add(Weapon("Spear", 4, 8))
+
+        self.assertEqual(cheap.to_list(), [self.armor, spear])
+        self.assertEqual(weapons.to_list(), [spear])
+        self.assertNotIn(self.sword, self.store)
+        with self.assertRaises(ValueError):
+            self.store.remove(self.sword)
+
+    def test_equal_equipment_is_distinct(self):
+        copy = self.store.add(Weapon("Sword", 5, 10))
+        self.store.remove(self.sword)
+        self.assertIs(self.store.first_by_name("Sword"), copy)
+
+    def test_potions_stack(self):
+        stack = self.store.add(Potion("Potion", 20, "heal", 30, count=2))
+        self.assertIs(stack, self.potion)
+        self.assertEqual(self.potion.count, 3)
+        self.assertEqual(len(self.store), 3)
+
+        part = self.store.take(self.potion, 2)
+        self.assertEqual((part.count, self.potion.count), (2, 1))
+        self.assertNotIn(part, self.store)
+        self.store.add(part)
+        self.assertEqual(self.store.count("Potion"), 3)
+
+    def test_using_last_potion_drops_stack(self):
+        player = Player("Hero")
+        player.current_hp = 1
+        potion = player.inventory.inventory.add(Potion("Potion", 20, "heal", 30, count=2))
+
+        self.assertTrue(player.inventory.use_item(potion))
+        self.assertEqual(potion.count, 1)
+        self.assertTrue(player.inventory.use_item(potion))
+        self.assertIsNone(player.inventory.get_item_by_name("Potion"))
+        self.assertFalse(player.inventory.use_item(potion))
+
+    def test_player_inventory_round_trip(self):
+        player = Player("Hero")
+        player.inventory.add_items([Weapon("Axe", 7, 12)] + [Potion("Potion", 20, "heal", 30) for _ in range(50)])
+        player.equip_item(Armor("Plate", 6, 40))
+
+        restored = Player.from_dict(player.to_dict())
+
+        self.assertEqual([item.name for item in restored.inventory.inventory], ["Axe", "Potion", "Cloth Tunic"])
+        self.assertEqual(len(restored.inventory.get_items_by_slot("weapon")), 1)
+        self.assertEqual(restored.inventory.get_item_by_name("Potion").count, 50)
+
+    def test_equipment_aggregates_follow_equip(self):
+        player = Player("Hero")
+        base_defense = player.inventory.get_defense()
+        player.equip_item(Armor("Plate", 6, 40, 3))
+
+        self.assertEqual(player.inventory.get_defense(), 6)
+        self.assertEqual(player.get_stat("constitution"), 13)
+        player.unequip_item("armor")
+        self.assertEqual(player.inventory.get_defense(), 0)
+
+        restored = Player.from_dict(player.to_dict())
+        self.assertIsNone(restored.inventory.equipment["armor"])
+        self.assertIs(restored.get_weapon(), restored.inventory.equipment["weapon"])
+        self.assertGreater(base_defense, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.items import Weapon, Potion, Armor, create_item, create_health_potion, item_from_dict
+from game.item_database import get_item_database
+from game.player import Player
+
+class TestItemTemplates(unittest.TestCase):
+
+    def test_items_share_template(self):
+        first = create_item("iron_sword")
+        second = Weapon("Iron Sword", 8, 40, 2, 0)
+
+        self.assertIs(first.template, second.template)
+        self.assertIsNone(second.rolled)
+        self.assertEqual(second.stat_bonuses["strength"], 2)
+
+    def test_rolled_stats_override_template(self):
+        sword = create_item("iron_sword", damage=11)
+
+        self.assertEqual(sword.damage, 11)
+        self.assertEqual(sword.template.damage, 8)
+        self.assertEqual(sword.to_dict(), {"template": "iron_sword", "damage": 11})
+
+        sword.damage = 8
+        self.assertIsNone(sword.rolled)
+
+    def test_templates_are_immutable(self):
+        template = get_item_database().get_template("minor_health_potion")
+        with self.assertRaises(AttributeError):
+            template.effect_value = 1000
+
+    def test_round_trip(self):
+        potion = create_health_potion(2)
+        potion.count = 4
+        restored = item_from_dict(potion.to_dict())
+
+        self.assertIsInstance(restored, Potion)
+        self.assertIs(restored.template, potion.template)
+        self.assertEqual(restored.count, 4)
+
+        custom = Armor("Dragon Scale", 9, 500, 4)
+        restored = item_from_dict(custom.to_dict())
+        self.assertEqual((restored.name, restored.defense, restored.slot), ("Dragon Scale", 9, "armor"))
+
+    def test_loads_saves_without_templates(self):
+        player = Player("Hero")
+        player.inventory.from_dict({
+            "equipment": {"weapon": {"name": "Iron Sword", "slot": "weapon", "value": 40, "damage": 8,
+                                     "stat_bonuses": {"strength": 2, "dexterity": 0}}},
+            "inventory": [{"name": "Minor Health Potion", "value": 20, "effect_type": "heal", "effect_value": 30}]
+        })
+
+        weapon = player.inventory.equipment["weapon"]
+        self.assertIs(weapon.template, get_item_database().get_template("iron_sword"))
+        self.assertEqual(player.inventory.get_item_by_name("Minor Health Potion").effect_value, 30)
+
+if __name__ == "__main__":
+    unittest.main()
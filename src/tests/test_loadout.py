@@ -0,0 +1,75 @@
+import unittest
+import sys
+import itertools
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.player import Player
+from game.items import Weapon, Armor, Boots, Accessory, Equipment
+from game.loot import LootGenerator
+from game.loadout import FEATURES
+
+class TestLoadoutOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player("Hero")
+        self.inventory = self.player.inventory
+        self.optimizer = self.inventory.get_optimizer()
+
+    def test_picks_highest_damage_weapon(self):
+        axe = Weapon("Axe", 12, 30)
+        self.inventory.add_items([Weapon("Dagger", 6, 10), axe, Armor("Plate", 8, 50)])
+
+        loadout, score = self.optimizer.best_loadout("damage")
+
+        self.assertIs(loadout["weapon"], axe)
+        self.assertEqual(score, 12)
+
+    def test_dominated_items_are_pruned(self):
+        self.inventory.add_items([Boots("Old Boots", 1, 5), Boots("Good Boots", 3, 5, 2), Boots("Fast Boots", 1, 5, 4)])
+
+        mask = tuple(feature in ("defense", "dexterity") for feature in FEATURES)
+        names = {item.name for item in self.optimizer.candidates("boots", mask)}
+        self.assertEqual(names, {"Good Boots", "Fast Boots"})
+
+        names = {item.name for item in self.optimizer.candidates("boots", self.optimizer.objective("defense").mask)}
+        self.assertEqual(names, {"Good Boots"})
+
+    def test_candidates_follow_inventory(self):
+        mask = self.optimizer.objective("defense").mask
+        self.inventory.add_to_inventory(Armor("Leather", 3, 10))
+        self.assertEqual([item.name for item in self.optimizer.candidates("armor", mask)], ["Leather"])
+
+        plate = Armor("Plate", 8, 50)
+        self.inventory.add_to_inventory(plate)
+        self.assertEqual(self.optimizer.candidates("armor", mask), [plate])
+
+        self.inventory.remove_from_inventory(plate)
+        self.assertEqual([item.name for item in self.optimizer.candidates("armor", mask)], ["Leather"])
+
+    def test_dps_matches_exhaustive_search(self):
+        items = LootGenerator(seed=4).roll_kills({"orc_warrior": 60, "skeleton_mage": 60, "goblin_archer": 60})
+        self.inventory.add_items(items)
+        scoring = self.optimizer.objective("dps")
+
+        options = []
+        for slot in Equipment.VALID_SLOTS:
+            pool = [item for item in self.inventory.inventory if getattr(item, "slot", None) == slot]
+            pool.append(self.inventory.equipment[slot])
+            options.append(pool)
+        exhaustive = max(scoring.evaluate(dict(zip(Equipment.VALID_SLOTS, combo))) for combo in itertools.product(*options))
+
+        _, score = self.optimizer.best_loadout("dps")
+        self.assertAlmostEqual(score, exhaustive)
+
+    def test_equip_best_swaps_items(self):
+        ring = Accessory("Ring", 10, {"strength": 3})
+        self.inventory.add_to_inventory(ring)
+
+        self.assertEqual(self.inventory.equip_best("dps"), [ring])
+        self.assertIs(self.inventory.equipment["accessory"], ring)
+        self.assertNotIn(ring, self.inventory.inventory)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.loot import LootGenerator, AliasTable
+from game.items import Equipment, Potion
+
+class TestLootGenerator(unittest.TestCase):
+
+    def test_alias_table_matches_weights(self):
+        table = AliasTable([1, 3, 6])
+        samples = table.sample(np.random.default_rng(1), 60000)
+        frequencies = np.bincount(samples, minlength=3) / len(samples)
+
+        np.testing.assert_allclose(frequencies, [0.1, 0.3, 0.6], atol=0.01)
+
+    def test_same_seed_same_drops(self):
+        first = [item.to_dict() for item in LootGenerator(seed=7).roll("dragon_whelp", 500)]
+        second = [item.to_dict() for item in LootGenerator(seed=7).roll("dragon_whelp", 500)]
+
+        self.assertTrue(first)
+        self.assertEqual(first, second)
+
+    def test_bulk_roll_stacks_consumables(self):
+        items = LootGenerator(seed=3).roll("goblin", 10000)
+        potions = [item for item in items if isinstance(item, Potion)]
+
+        self.assertEqual(len(potions), 1)
+        self.assertGreater(potions[0].count, 1000)
+
+    def test_rarity_adds_affixes(self):
+        items = LootGenerator(seed=11).roll("orc_warrior", 5000)
+        rolled = [item for item in items if isinstance(item, Equipment) and item.rarity == "epic"]
+
+        self.assertTrue(rolled)
+        for item in rolled:
+            self.assertNotEqual(item.name, item.template.name)
+            self.assertGreater(item.value, item.template.value)
+
+    def test_unknown_enemy_uses_default_table(self):
+        generator = LootGenerator(seed=5)
+        self.assertIs(generator.table_for("slime"), generator.tables["default"])
+
+if __name__ == "__main__":
+    unittest.main()
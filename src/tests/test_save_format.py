@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine import save_format
+from src.engine.save_format import SaveFile, SaveFormatError, encode_save, HEADER
+from src.engine.save_manager import SaveManager
+from src.game.player import Player
+from src.game.loot import LootGenerator
+
+class TestSaveFormat(unittest.TestCase):
+
+    def setUp(self):
+        player = Player("Hero")
+        player.inventory.add_items(LootGenerator(seed=5).roll_kills({"orc_warrior": 200}))
+        self.data = json.loads(json.dumps(player.to_dict()))
+
+    def test_round_trip_with_each_codec(self):
+        for compression, level in (("none", 0), ("zlib", 1), ("zlib", 9), ("lzma", 6)):
+            save = SaveFile(encode_save(self.data, compression, level))
+            self.assertEqual(save.player_data(), self.data)
+            self.assertEqual(save.compression("inventory"), compression)
+
+    def test_sections_decode_lazily(self):
+        save = SaveFile(encode_save(self.data))
+
+        self.assertEqual(save.section("player")["name"], "Hero")
+        self.assertEqual(list(save._decoded), ["player"])
+        self.assertEqual(save.section("inventory"), self.data["inventory"]["inventory"])
+        self.assertIsNone(save.section("history"))
+
+    def test_rejects_corrupt_files(self):
+        encoded = bytearray(encode_save(self.data))
+        encoded[HEADER.size + 20] ^= 0xFF
+        with self.assertRaises(SaveFormatError):
+            SaveFile(bytes(encoded))
+        with self.assertRaises(SaveFormatError):
+            SaveFile(b'{"player": {}}')
+
+    def test_player_loads_without_decoding_the_bag(self):
+        save = SaveFile(encode_save(self.data))
+        player = Player.from_save(save)
+
+        self.assertFalse(player.inventory.items_loaded)
+        self.assertNotIn("inventory", save._decoded)
+        self.assertEqual(player.gold, self.data["gold"])
+        self.assertEqual(player.get_weapon().to_dict(), self.data["inventory"]["equipment"]["weapon"])
+        self.assertEqual(player.to_dict(), self.data)
+
+        self.assertEqual(len(player.inventory.inventory), len(self.data["inventory"]["inventory"]))
+        self.assertTrue(player.inventory.items_loaded)
+        self.assertEqual(player.to_dict(), self.data)
+
+    def test_reads_version_one_layout(self):
+        with mock.patch.object(save_format, "FORMAT_VERSION", 1):
+            save = SaveFile(encode_save(self.data))
+        self.assertEqual(save.version, 1)
+        self.assertEqual(save.player_data(), self.data)
+        self.assertEqual(Player.from_save(save).to_dict(), self.data)
+
+    def test_manager_reads_json_saves_and_exports_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SaveManager(directory, compression="lzma", level=1)
+            path = manager.slot_path(1)
+            with open(path, 'w') as f:
+                json.dump({"player": self.data}, f)
+            self.assertEqual(manager.load_game(), (True, self.data))
+
+            manager.save_game(self.data)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(4), b"DNUT")
+            with open(manager.export_json(), 'r') as f:
+                self.assertEqual(json.load(f)["player"], self.data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.save_journal import diff_items, apply_items, diff_player_data
+from src.engine.save_manager import SaveManager
+from src.game.player import Player
+from src.game.items import create_item
+from src.game.loot import LootGenerator
+
+class TestSaveJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = SaveManager(self.directory.name, journal_entries=4)
+        self.player = Player("Hero")
+        self.player.inventory.add_items(LootGenerator(seed=9).roll_kills({"orc_warrior": 300}))
+
+    def tearDown(self):
+        self.manager.flush(5)
+        self.directory.cleanup()
+
+    def snapshot(self):
+        return json.loads(json.dumps(self.player.to_dict()))
+
+    def test_item_diff_round_trip(self):
+        old = [{"template": "a"}, {"template": "p", "count": 2}, {"template": "b"}, {"template": "a"}]
+        new = [{"template": "a"}, {"template": "p", "count": 5}, {"template": "a"}, {"template": "c"}]
+
+        ops = diff_items(old, new)
+
+        self.assertEqual(ops, {"set": {"1": {"template": "p", "count": 5}}, "remove": [2], "append": [{"template": "c"}]})
+        self.assertEqual(apply_items(old, ops), new)
+        self.assertIsNone(diff_items(new, list(new)))
+
+    def test_saves_append_deltas_and_replay(self):
+        self.manager.save_game(self.snapshot())
+        snapshot_size = os.path.getsize(self.manager.slot_path(1))
+
+        self.player.gold += 25
+        self.manager.save_game(self.snapshot())
+        inventory = self.player.inventory
+        inventory.remove_from_inventory(inventory.inventory[3])
+        inventory.add_to_inventory(create_item("iron_helm"))
+        inventory.add_to_inventory(create_item("minor_health_potion", 2))
+        self.player.combat_sequence.pop(0)
+        self.manager.save_game(self.snapshot())
+        expected = self.snapshot()
+
+        self.assertEqual((self.manager.snapshots, self.manager.deltas), (1, 2))
+        self.assertEqual(os.path.getsize(self.manager.slot_path(1)), snapshot_size)
+        self.assertLess(os.path.getsize(self.manager.journal_path(1)), 1000)
+
+        reopened = SaveManager(self.directory.name)
+        self.assertEqual(reopened.read_save(1), expected)
+        success, save = reopened.load_save(1)
+        loaded = Player.from_save(save)
+        self.assertEqual(loaded.to_dict(), expected)
+        self.assertEqual(len(loaded.inventory.inventory), len(expected["inventory"]["inventory"]))
+
+    def test_compacts_after_entry_limit(self):
+        for gold in range(7):
+            self.player.gold = gold
+            self.manager.save_game(self.snapshot())
+
+        self.assertEqual((self.manager.snapshots, self.manager.deltas), (2, 5))
+        self.assertEqual(SaveManager(self.directory.name).read_save(1)["gold"], 6)
+
+    def test_torn_or_stale_journal(self):
+        self.manager.save_game(self.snapshot())
+        self.player.gold = 99
+        self.manager.save_game(self.snapshot())
+        with open(self.manager.journal_path(1), 'ab') as f:
+            f.write(b'{"set":{"gold":')
+
+        reopened = SaveManager(self.directory.name)
+        self.assertEqual(reopened.read_save(1)["gold"], 99)
+        self.player.gold = 5
+        reopened.save_game(self.snapshot())
+        self.assertEqual(reopened.snapshots, 1)
+
+        self.player.gold = 6
+        reopened.save_game(self.snapshot())
+        with open(self.manager.slot_path(1), 'wb') as f:
+            f.write(self.manager.encode(dict(self.snapshot(), gold=7)))
+        self.assertEqual(SaveManager(self.directory.name).read_save(1)["gold"], 7)
+
+    def test_unchanged_save_writes_no_delta(self):
+        data = self.snapshot()
+        self.assertIsNone(diff_player_data(data, json.loads(json.dumps(data))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+from unittest import mock
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.save_manager import SaveManager, SaveWriter, write_atomic
+
+class TestSaveManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = SaveManager(self.directory.name)
+        self.path = self.manager.slot_path(1)
+
+    def tearDown(self):
+        self.manager.flush(5)
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        success, _ = self.manager.save_game({"name": "Hero", "gold": 12})
+        self.assertTrue(success)
+        self.assertEqual(self.manager.load_game(), (True, {"name": "Hero", "gold": 12}))
+
+    def test_failed_write_keeps_old_save(self):
+        self.manager.save_game({"gold": 1})
+
+        with mock.patch("src.engine.save_manager.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b'{"gold": 2}')
+            self.manager.writer.submit(self.path, lambda: write_atomic(self.path, b'{"gold": 3}'))
+            self.assertTrue(self.manager.flush(5))
+
+        files = os.listdir(self.directory.name)
+        self.assertFalse([name for name in files if name.endswith(".tmp")])
+        self.assertEqual(sorted(files), ["index.json", "slot_1.journal", "slot_1.sav"])
+        self.assertEqual(self.manager.load_game()[1], {"gold": 1})
+
+    def test_async_saves_are_coalesced(self):
+        release = threading.Event()
+        started = threading.Event()
+        writer = SaveWriter()
+        other = os.path.join(self.directory.name, "other.json")
+
+        def blocking():
+            started.set()
+            release.wait(5)
+
+        results = []
+        writer.submit(other, blocking)
+        started.wait(5)
+        for gold in range(3):
+            writer.submit(self.path, lambda gold=gold: write_atomic(self.path, json.dumps({"player": {"gold": gold}}).encode()),
+                          lambda success, message: results.append(success))
+        release.set()
+
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(writer.writes, 2)
+        self.assertEqual(writer.coalesced, 2)
+        self.assertEqual(self.manager.load_game()[1], {"gold": 2})
+        self.assertEqual(results, [])
+        self.assertEqual(writer.poll(), 3)
+        self.assertEqual(results, [True, True, True])
+
+    def test_slots_and_index(self):
+        self.assertFalse(self.manager.save_exists())
+        self.manager.save_game({"name": "Ann", "level": 3, "gold": 40, "playtime": 90.0}, slot=1)
+        self.manager.save_game_async({"name": "Bob", "level": 7, "gold": 5}, slot=2)
+        self.assertTrue(self.manager.flush(5))
+
+        reopened = SaveManager(self.directory.name)
+        self.assertTrue(reopened.save_exists())
+        self.assertEqual(reopened.slot_info(1)["name"], "Ann")
+        self.assertEqual(reopened.slot_info(1)["playtime"], 90.0)
+        self.assertEqual(reopened.slot_info(2)["level"], 7)
+        self.assertIsNone(reopened.slot_info(3))
+        self.assertEqual(reopened.free_slot(), 3)
+
+        self.assertEqual(reopened.load_game(2), (True, {"name": "Bob", "level": 7, "gold": 5}))
+        self.assertEqual(reopened.active_slot, 2)
+        self.assertEqual(reopened.load_game(3), (False, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.save_format import SaveFile, encode_save
+from src.engine.save_manager import SaveManager
+from src.game import save_migrations
+from src.game.save_migrations import SCHEMA_KEY, SCHEMA_VERSION, migrate, needs_migration
+from src.game.player import Player
+from src.game.loot import LootGenerator
+
+class TestSaveMigrations(unittest.TestCase):
+
+    def setUp(self):
+        player = Player("Hero")
+        player.gold = 321
+        player.inventory.add_items(LootGenerator(seed=3).roll_kills({"orc_warrior": 50}))
+        self.data = json.loads(json.dumps(player.to_dict()))
+        self.legacy = {key: value for key, value in self.data.items() if key != SCHEMA_KEY}
+
+    def test_current_saves_skip_migration(self):
+        self.assertEqual(self.data[SCHEMA_KEY], SCHEMA_VERSION)
+        self.assertFalse(needs_migration(self.data))
+        with mock.patch.object(save_migrations, "_migrations", {}):
+            self.assertEqual(Player.from_dict(self.data).to_dict(), self.data)
+
+    def test_unversioned_save_migrates_to_same_player(self):
+        migrated = migrate(self.legacy)
+        self.assertEqual(migrated, self.data)
+        self.assertNotIn(SCHEMA_KEY, self.legacy)
+        self.assertEqual(Player.from_dict(self.legacy).to_dict(), self.data)
+
+    def test_missing_and_malformed_fields_get_defaults(self):
+        player = Player.from_dict({"name": "Old", "level": 3, "base_stats": {"constitution": 14, "luck": 99},
+                                   "inventory": {"equipment": {"weapon": {"template": "cloth_tunic"},
+                                                               "armor": "plate"},
+                                                 "inventory": [None, {"name": "Apple"}]},
+                                   "skills": {"skills": ["basic_attack", 5], "combat_sequence": ["basic_attack", 7],
+                                              "buffs": []}})
+        self.assertEqual(player.gold, 50)
+        self.assertEqual(player.max_hp, 50 + 14 * 5 + 2 * 20)
+        self.assertEqual(player.current_hp, player.max_hp)
+        self.assertNotIn("luck", player.base_stats)
+        self.assertIsNone(player.get_weapon())
+        self.assertEqual(len(player.inventory.inventory), 1)
+        self.assertEqual([skill.id if skill else None for skill in player.combat_sequence], ["basic_attack", None])
+        self.assertEqual(player.skills_manager.buffs, {})
+
+        defaults = Player.from_dict({"name": "Bare"})
+        self.assertEqual(defaults.to_dict(), Player("Bare").to_dict())
+
+    def test_rejects_unknown_versions(self):
+        with self.assertRaises(ValueError):
+            migrate(dict(self.data, **{SCHEMA_KEY: SCHEMA_VERSION + 1}))
+        with mock.patch.object(save_migrations, "_migrations", {}):
+            with self.assertRaises(ValueError):
+                migrate(self.legacy)
+        with self.assertRaises(ValueError):
+            Player.from_dict([])
+
+    def test_lazy_load_of_old_save_migrates_everything(self):
+        save = SaveFile(encode_save(self.legacy))
+        player = Player.from_save(save)
+        self.assertTrue(player.inventory.items_loaded)
+        self.assertEqual(player.to_dict(), self.data)
+
+    def test_upgraded_save_is_rewritten_as_a_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SaveManager(directory)
+            manager.save_game(self.legacy)
+            manager.save_game(dict(self.legacy, gold=7))
+            self.assertEqual(manager.deltas, 1)
+
+            save = manager.open_save()
+            self.assertTrue(needs_migration(save.lazy_player_data()[0]))
+            manager.save_game_async(Player.from_save(save).to_dict(), compact=True)
+            self.assertTrue(manager.flush(5))
+            self.assertEqual(manager.snapshots, 2)
+
+            save = SaveManager(directory).open_save()
+            self.assertEqual(save.deltas, [])
+            self.assertFalse(needs_migration(save.lazy_player_data()[0]))
+            self.assertEqual(Player.from_save(save).to_dict(), dict(self.data, gold=7))
+
+if __name__ == '__main__':
+    unittest.main()
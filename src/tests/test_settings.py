@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import json
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.settings import SettingsStore
+
+class TestSettingsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "settings.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self):
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def test_burst_of_changes_is_written_once(self):
+        store = SettingsStore(self.path, delay=0.1)
+        for step in range(50):
+            store.set("audio.master_volume", step / 50)
+        self.assertEqual(store.get("audio.master_volume"), 0.98)
+        self.assertFalse(os.path.exists(self.path))
+
+        deadline = time.monotonic() + 5
+        while store.dirty and time.monotonic() < deadline:
+            time.sleep(0.02)
+        time.sleep(0.05)
+        self.assertEqual(store.writes, 1)
+        self.assertEqual(self.read(), {"audio.master_volume": 0.98})
+
+    def test_flush_writes_pending_changes_now(self):
+        store = SettingsStore(self.path, delay=60)
+        self.assertFalse(store.flush())
+        store.set("video.fullscreen", True)
+        store.set("video.fullscreen", True)
+        self.assertTrue(store.flush())
+        self.assertFalse(store.flush())
+        self.assertEqual(store.writes, 1)
+        self.assertEqual(SettingsStore(self.path).get("video.fullscreen"), True)
+
+    def test_listeners_see_changes_immediately(self):
+        store = SettingsStore(self.path, delay=60)
+        seen = []
+        store.subscribe("audio.music_volume", lambda key, value: seen.append(value))
+        store.set("audio.music_volume", 0.3)
+        store.set("audio.music_volume", 0.3)
+        store.set("audio.ui_volume", 0.1)
+        self.assertEqual(seen, [0.3])
+
+    def test_imports_legacy_audio_settings(self):
+        legacy = os.path.join(self.directory.name, "audio_settings.json")
+        with open(legacy, 'w') as f:
+            json.dump({"master_volume": 0.25, "sfx_volume": 1.0}, f)
+        store = SettingsStore(self.path, legacy_paths={"audio": legacy})
+        self.assertEqual(store.get("audio.master_volume"), 0.25)
+        self.assertEqual(store.get("audio.sfx_volume"), 1.0)
+        self.assertIsNone(store.get("audio.music_volume"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.player import Player
+from game.items import Weapon, create_item
+from game.loot import LootGenerator
+
+class TestShop(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player("Hero")
+        self.player.gold = 0
+        self.inventory = self.player.inventory
+        self.shop = self.inventory.get_shop()
+
+    def test_items_sorted_by_price(self):
+        cheap = create_item("wooden_sword")
+        pricey = create_item("chain_mail")
+        middle = create_item("leather_boots")
+        self.inventory.add_items([cheap, pricey, middle])
+
+        self.assertEqual(self.shop.items_by_price(), [pricey, middle, cheap])
+        self.inventory.remove_from_inventory(middle)
+        self.assertEqual(self.shop.items_by_price(descending=False), [cheap, pricey])
+
+    def test_sell_stack_and_part_of_stack(self):
+        potions = self.inventory.inventory.add(create_item("health_potion", 4))
+        unit = self.shop.unit_price(potions)
+
+        self.assertEqual(self.shop.sell(potions, 1), unit)
+        self.assertEqual(potions.count, 3)
+        self.assertEqual(self.shop.sell(potions), unit * 3)
+        self.assertNotIn(potions, self.inventory.inventory)
+        self.assertEqual(self.player.gold, unit * 4)
+
+    def test_sell_below_rarity(self):
+        items = LootGenerator(seed=3).roll_kills({"orc_warrior": 300})
+        self.inventory.add_items(items)
+        common = [item for item in self.inventory.inventory.by_rarity("common").to_list() if not item.stackable]
+        expected = sum(self.shop.sell_price(item) for item in common)
+
+        self.assertEqual(self.shop.sell_below_rarity("uncommon"), expected)
+        self.assertEqual(self.player.gold, expected)
+        self.assertTrue(all(item.stackable for item in self.inventory.inventory.by_rarity("common")))
+        self.assertTrue(all(item.rarity != "common" or item.stackable for item in self.shop.items_by_price()))
+        with self.assertRaises(ValueError):
+            self.shop.sell_below_rarity("mythic")
+
+    def test_sell_below_rarity_keeps_potions(self):
+        potions = self.inventory.inventory.add(create_item("health_potion", 3))
+        sword = create_item("wooden_sword")
+        self.inventory.add_items([sword])
+
+        self.assertEqual(self.shop.sell_below_rarity("uncommon"), self.shop.sell_price(sword))
+        self.assertEqual(self.shop.items_by_price(), [potions])
+        self.assertEqual(potions.count, 3)
+
+        self.assertEqual(self.shop.sell_below_rarity("uncommon", equipment_only=False), self.shop.sell_price(potions))
+        self.assertFalse(self.inventory.inventory)
+
+    def test_sell_duplicates_keeps_most_valuable(self):
+        plain = create_item("iron_sword")
+        rare = create_item("iron_sword", value=90, rarity="rare")
+        spare = create_item("iron_sword")
+        other = Weapon("Club", 3, 4)
+        self.inventory.add_items([plain, rare, spare, other])
+
+        gold = self.shop.sell_duplicates()
+
+        self.assertEqual(gold, self.shop.sell_price(plain) * 2)
+        self.assertEqual(self.inventory.get_items_by_slot("weapon").to_list(), [rare, other])
+        self.assertEqual(self.shop.sell_duplicates(), 0)
+
+    def test_batch_is_all_or_nothing(self):
+        sword = create_item("iron_sword")
+        self.inventory.add_to_inventory(sword)
+        equipped = self.inventory.equipment["weapon"]
+
+        self.assertEqual(self.shop.sell_items([sword, equipped]), 0)
+        self.assertIn(sword, self.inventory.inventory)
+        self.assertEqual(self.player.gold, 0)
+
+    def test_buy_spends_gold(self):
+        template = self.shop.database.get_template("iron_helm")
+        self.assertIsNone(self.shop.buy("iron_helm"))
+
+        self.player.gold = template.value
+        helm = self.shop.buy("iron_helm")
+
+        self.assertEqual(helm.name, template.name)
+        self.assertIn(helm, self.inventory.inventory)
+        self.assertEqual(self.player.gold, 0)
+        self.assertIsNone(self.shop.buy("missing_item"))
+
+if __name__ == '__main__':
+    unittest.main()
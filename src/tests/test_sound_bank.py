@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.engine.sound_bank import SoundBank
+
+class FakeSound:
+    def __init__(self, path):
+        self.path = path
+
+class TestSoundBank(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ("attack.wav", "heal.wav", "click.wav"):
+            path = os.path.join(self.directory.name, name)
+            open(path, 'wb').close()
+            self.paths.append(path)
+        self.loaded = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def loader(self, path):
+        self.loaded.append(os.path.basename(path))
+        return FakeSound(path)
+
+    def test_sounds_are_decoded_once_per_path(self):
+        bank = SoundBank(loader=self.loader, measure=lambda sound: 10)
+        attack = bank.get(self.paths[0])
+        relative = os.path.relpath(self.paths[0])
+        self.assertIs(bank.get(relative), attack)
+        self.assertIsNone(bank.get(os.path.join(self.directory.name, "missing.wav")))
+        self.assertEqual(self.loaded, ["attack.wav"])
+        self.assertEqual(bank.cached_bytes, 10)
+
+    def test_least_recently_used_sounds_are_evicted(self):
+        bank = SoundBank(cache_bytes=25, loader=self.loader, measure=lambda sound: 10)
+        bank.get(self.paths[0])
+        bank.get(self.paths[1])
+        bank.get(self.paths[0])
+        bank.get(self.paths[2])
+
+        self.assertNotIn(self.paths[1], bank)
+        self.assertIn(self.paths[0], bank)
+        self.assertEqual((bank.cached_bytes, bank.evictions), (20, 1))
+        bank.get(self.paths[1])
+        self.assertEqual(self.loaded, ["attack.wav", "heal.wav", "click.wav", "heal.wav"])
+
+    def test_preload_decodes_in_background(self):
+        release = threading.Event()
+
+        def slow_loader(path):
+            release.wait(5)
+            return self.loader(path)
+
+        bank = SoundBank(loader=slow_loader, measure=lambda sound: 10)
+        bank.preload(self.paths)
+        self.assertEqual(self.loaded, [])
+        release.set()
+        self.assertIsNotNone(bank.get(self.paths[2]))
+        self.assertTrue(bank.flush(5))
+        self.assertEqual(sorted(self.loaded), ["attack.wav", "click.wav", "heal.wav"])
+
+    def test_job_callbacks_run_on_poll(self):
+        bank = SoundBank(loader=self.loader)
+        results = []
+        bank.submit(lambda: "music", results.append)
+        self.assertTrue(bank.flush(5))
+        self.assertEqual(results, [])
+        self.assertEqual(bank.poll(), 1)
+        self.assertEqual(results, ["music"])
+
+if __name__ == '__main__':
+    unittest.main()
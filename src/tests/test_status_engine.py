@@ -0,0 +1,90 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.status_engine import StatusEngine
+from game.combatant import EffectList, effect_code
+from game.enemy_manager import Enemy
+from game.skill_manager import SkillManager
+from game.skill_database import SkillDatabase
+from game.player import Player
+from game.action_manager import ActionManager
+
+class TestStatusEngine(unittest.TestCase):
+
+    def setUp(self):
+        database = SkillDatabase()
+        self.engine = StatusEngine(database)
+        skill_manager = SkillManager(database)
+        skill_manager.register_default_effects()
+        skill_manager.load_all_skills()
+        self.action_manager = ActionManager()
+        self.enemy = Enemy("orc", {"name": "Orc", "level": 2}, skill_manager, self.action_manager)
+        self.player = Player("Hero", self.action_manager)
+
+    def test_effects_stay_sorted_by_expiry(self):
+        effects = EffectList()
+        effects.set(effect_code("poison"), 2, 3)
+        effects.set(effect_code("stunned"), 1, 1)
+        effects.set(effect_code("slowed"), 0.5, 2)
+
+        self.assertEqual(list(effects.expiries), [1, 2, 3])
+        self.assertEqual(effects.advance(), [effect_code("stunned")])
+        self.assertEqual(len(effects), 2)
+
+    def test_poison_ticks_and_expires(self):
+        self.enemy.status_effects["poison"] = {"value": 3, "duration": 2}
+        hp = self.enemy.current_hp
+
+        self.engine.tick(self.enemy)
+        self.assertEqual(self.enemy.current_hp, hp - 3)
+        self.assertEqual(self.enemy.status_effects["poison"]["duration"], 1)
+
+        messages = self.engine.tick(self.enemy)
+        self.assertEqual(self.enemy.current_hp, hp - 6)
+        self.assertNotIn("poison", self.enemy.status_effects)
+        self.assertIn("Orc is no longer affected by poison.", messages)
+
+    def test_stun_blocks_action_until_next_round(self):
+        self.enemy.status_effects["stunned"] = {"value": 1, "duration": 1}
+        self.engine.tick(self.enemy)
+
+        self.assertTrue(self.action_manager.is_stunned(self.enemy.id))
+        self.engine.tick(self.enemy)
+        self.assertFalse(self.action_manager.is_stunned(self.enemy.id))
+
+    def test_data_defined_status(self):
+        self.engine.define("statuses", "bleeding", {"handler": "damage", "message": "{name} bleeds for {value}."})
+        self.player.status_effects["bleeding"] = {"value": 4, "duration": 1}
+        hp = self.player.current_hp
+
+        messages = self.engine.tick_round([self.player, self.enemy])
+
+        self.assertEqual(self.player.current_hp, hp - 4)
+        self.assertIn("Hero bleeds for 4.", messages)
+
+    def test_ticks_report_the_amount_applied(self):
+        self.engine.define("statuses", "bleeding", {"handler": "damage", "message": "{name} bleeds for {value}."})
+        self.player.status_effects["bleeding"] = {"value": 50, "duration": 1}
+        self.player.current_hp = 5
+        self.enemy.status_effects["regeneration"] = {"value": 10, "duration": 1}
+        self.enemy.current_hp = self.enemy.max_hp - 3
+
+        messages = self.engine.tick_round([self.player, self.enemy])
+
+        self.assertEqual(self.player.current_hp, 0)
+        self.assertIn("Hero bleeds for 5.", messages)
+        self.assertEqual(self.enemy.current_hp, self.enemy.max_hp)
+        self.assertIn("Orc regenerates 3 health.", messages)
+
+    def test_buffs_expire_with_message(self):
+        self.player.buffs["defense"] = {"value": 3, "duration": 1}
+        messages = self.player.update_status_effects()
+
+        self.assertNotIn("defense", self.player.buffs)
+        self.assertIn("Hero's defense buff has expired.", messages)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game.enemy_manager import EnemyManager
+from game.enemy_database import EnemyDatabase
+from game.skill_manager import SkillManager
+from game.skill_database import SkillDatabase
+from game.player import Player
+from game.action_manager import ActionManager
+from game.combatant import Combatant
+from game.wave import TARGET_ALL, TARGET_LOWEST_HP
+
+class TestWave(unittest.TestCase):
+
+    def setUp(self):
+        skill_manager = SkillManager(SkillDatabase())
+        skill_manager.register_default_effects()
+        skill_manager.load_all_skills()
+        self.enemy_manager = EnemyManager(EnemyDatabase(), skill_manager)
+        self.wave = self.enemy_manager.create_wave(["goblin", "orc", "goblin", "orc"], rng=np.random.default_rng(7))
+        self.player = Player("Hero", ActionManager())
+
+    def test_members_share_archetypes(self):
+        self.assertEqual(self.wave.size, 4)
+        self.assertEqual(len(self.wave.archetypes), 2)
+        self.assertEqual(self.wave.member_name(1), self.wave.archetypes[1].name)
+
+    def test_targeting_rules(self):
+        self.wave.hp[0] = 0
+        self.wave.hp[3] = 5
+
+        self.assertEqual(list(self.wave.select().indices), [1])
+        self.assertEqual(list(self.wave.select(TARGET_LOWEST_HP).indices), [3])
+        self.assertEqual(list(self.wave.select(TARGET_ALL).indices), [1, 2, 3])
+
+    def test_selected_members_are_a_combatant(self):
+        target = self.wave.select(TARGET_ALL)
+        self.assertIsInstance(target, Combatant)
+        self.assertEqual(target.current_hp, int(self.wave.hp.sum()))
+
+    def test_area_damage_hits_every_living_member(self):
+        before = self.wave.hp.copy()
+        dealt = self.wave.select(TARGET_ALL).take_damage(10)
+
+        expected = np.minimum(np.maximum(1, 10 - self.wave.defense), before)
+        self.assertEqual(dealt, int(expected.sum()))
+        self.assertTrue((self.wave.hp == before - expected).all())
+
+    def test_statuses_tick_in_bulk(self):
+        target = self.wave.select(TARGET_ALL)
+        target.status_effects["poison"] = {"value": 2, "duration": 1}
+        before = self.wave.total_hp()
+
+        self.wave.end_round()
+
+        self.assertEqual(self.wave.total_hp(), before - 8)
+        self.assertNotIn("poison", target.status_effects)
+
+    def test_stunned_members_do_not_act(self):
+        self.wave.ap[:] = 0
+        self.wave.select(TARGET_ALL).status_effects["stunned"] = {"value": 1, "duration": 1}
+        self.wave.generate_action(100.0)
+
+        self.assertEqual(self.wave.resolve_attacks(self.player)["attackers"], 0)
+
+    def test_ready_members_attack_player(self):
+        self.wave.ap[:] = self.wave.attack_cost
+        hp = self.player.current_hp
+        result = self.wave.resolve_attacks(self.player)
+
+        self.assertEqual(result["attackers"], 4)
+        self.assertEqual(self.player.current_hp, hp - result["damage"])
+        self.assertTrue((self.wave.ap < self.wave.attack_cost).all())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for Project Donut hot paths.
+
+Usage: python3 tools/benchmark.py [name ...]
+Run from the project root so data files resolve.
+"""
+import os
+import sys
+import time
+import logging
+import tracemalloc
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+logging.disable(logging.CRITICAL)
+
+def _timeit(func, repeat: int = 15, number: int = 20000) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+def bench_combatants():
+    """Memory per enemy and per-action attribute access cost"""
+    from src.game.enemy import _enemy_manager
+
+    enemy_data = _enemy_manager.database.get_enemy("goblin")
+    count = 2000
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    enemies = [_enemy_manager.create_enemy("goblin", enemy_data) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"enemy memory: {allocated / count:.0f} bytes per enemy ({count} enemies)")
+
+    enemy = enemies[0]
+
+    def attributes():
+        return enemy.current_hp + enemy.max_hp + enemy.level + enemy.defense + enemy.damage
+
+    print(f"enemy attribute reads: {_timeit(attributes, number=100000) * 1e9:.0f} ns per 5 reads")
+
+    def action():
+        enemy.current_hp = enemy.max_hp
+        enemy.take_damage(10)
+        enemy.heal(5)
+        enemy.get_stats()
+        enemy.is_alive()
+
+    print(f"enemy action: {_timeit(action) * 1e9:.0f} ns per action")
+
+    skill = enemy.skills[0]
+    target = _enemy_manager.create_enemy("goblin", enemy_data)
+
+    def skill_use():
+        target.current_hp = target.max_hp
+        skill.reset_cooldown()
+        skill.use(enemy, target)
+
+    print(f"enemy skill use: {_timeit(skill_use, number=5000) * 1e6:.2f} us per use ({skill.id})")
+
+def bench_waves():
+    """Per-frame cost of a large wave versus one Enemy object per member"""
+    import numpy as np
+    from src.game.enemy import _enemy_manager
+    from src.game.player import Player
+    from src.game.action_manager import ActionManager
+    from src.game.wave import TARGET_ALL
+
+    player = Player("Hero", ActionManager())
+    enemy_data = _enemy_manager.database.get_enemy("goblin")
+
+    for size in (50, 500):
+        wave = _enemy_manager.create_wave(["goblin"] * size, rng=np.random.default_rng(0))
+        wave.select(TARGET_ALL).status_effects["poison"] = {"value": 0, "duration": 10 ** 9}
+
+        def wave_frame():
+            wave.hp[:] = wave.max_hp
+            player.current_hp = player.max_hp
+            wave.generate_action(1.0)
+            wave.resolve_attacks(player)
+            wave.select(TARGET_ALL).take_damage(5)
+            wave.end_round()
+
+        action_manager = ActionManager()
+        enemies = []
+        for i in range(size):
+            enemy = _enemy_manager.create_enemy("goblin", enemy_data)
+            enemy.id = f"goblin_{i}"
+            enemy.action_manager = action_manager
+            action_manager.register_entity(enemy.id, 1.0)
+            enemy.status_effects["poison"] = {"value": 0, "duration": 10 ** 9}
+            enemies.append(enemy)
+        attack_cost = wave.kind_attack_cost[0]
+
+        def object_frame():
+            player.current_hp = player.max_hp
+            for enemy in enemies:
+                enemy.current_hp = enemy.max_hp
+                action_manager.generate_action(enemy.id, 1.0)
+                if action_manager.consume_action(enemy.id, attack_cost):
+                    player.take_damage(enemy.damage)
+                enemy.take_damage(5)
+                enemy.update_status_effects()
+
+        wave_time = _timeit(wave_frame, number=200)
+        object_time = _timeit(object_frame, number=20)
+        print(f"{size} enemies: wave {wave_time * 1e6:.0f} us/frame, enemy objects {object_time * 1e6:.0f} us/frame")
+
+def bench_expeditions():
+    """Scheduler frame time as the number of background expeditions grows"""
+    from src.game.player import Player
+    from src.game.action_manager import ActionManager
+    from src.game.expedition import Expedition, ExpeditionScheduler
+
+    for count in (1, 10, 50, 200):
+        scheduler = ExpeditionScheduler()
+        for i in range(count):
+            expedition = scheduler.add(Expedition(Player(f"Mercenary {i}", ActionManager()), enemy_level=1))
+            expedition.start()
+
+        now = 0.0
+        frames = []
+        for _ in range(600):
+            now += 1 / 60
+            start = time.perf_counter()
+            scheduler.update(now)
+            frames.append(time.perf_counter() - start)
+        frames.sort()
+        print(f"{count} expeditions: mean {sum(frames) / len(frames) * 1e3:.2f} ms, "
+              f"p99 {frames[int(len(frames) * 0.99)] * 1e3:.2f} ms per frame, lagging {scheduler.lagging}")
+
+def bench_statuses():
+    """One status/buff round for a combatant carrying several effects"""
+    from src.game.enemy import _enemy_manager
+
+    enemy = _enemy_manager.get_enemy("goblin")
+    effects = {
+        "poison": {"value": 1, "duration": 10 ** 6},
+        "regeneration": {"value": 1, "duration": 10 ** 6},
+        "slowed": {"value": 0.5, "duration": 10 ** 6},
+        "burning": {"value": 1, "duration": 10 ** 6}
+    }
+    enemy.status_effects = effects
+    enemy.buffs = {"defense": {"value": 2, "duration": 10 ** 6}, "strength": {"value": 2, "duration": 10 ** 6}}
+
+    def tick():
+        enemy.current_hp = enemy.max_hp
+        enemy.update_status_effects()
+
+    print(f"status round: {_timeit(tick, number=20000) * 1e6:.2f} us per combatant (4 statuses, 2 buffs)")
+
+def bench_inventory():
+    """Name lookups and removals against a large inventory"""
+    from src.game.player import Player
+    from src.game.items import Weapon, Potion
+
+    player = Player("Bench")
+    inventory = player.inventory
+    count = 5000
+    for i in range(count):
+        inventory.add_to_inventory(Weapon(f"Sword {i}", i, i) if i % 2 else Potion(f"Potion {i}", i, "heal", i))
+
+    names = [f"Sword {i}" for i in range(1, count, 2)]
+    position = [0]
+
+    def lookup():
+        position[0] = (position[0] + 1) % len(names)
+        return inventory.get_item_by_name(names[position[0]])
+
+    print(f"name lookup: {_timeit(lookup, repeat=5, number=2000) * 1e6:.2f} us ({count} items)")
+
+    def churn():
+        item = inventory.get_item_by_name(names[position[0]])
+        inventory.remove_from_inventory(item)
+        inventory.add_to_inventory(item)
+        position[0] = (position[0] + 1) % len(names)
+
+    print(f"remove + re-add: {_timeit(churn, repeat=5, number=2000) * 1e6:.2f} us ({count} items)")
+
+def bench_items():
+    """Memory and save size of a large loot pile made of a few item kinds"""
+    import json
+    from src.game.items import Weapon, Armor, Boots
+
+    kinds = [
+        lambda: Weapon("Iron Sword", 8, 40, 2, 0),
+        lambda: Weapon("Hunting Bow", 7, 45, 0, 3),
+        lambda: Armor("Leather Armor", 3, 30, 1),
+        lambda: Boots("Leather Boots", 2, 25, 1)
+    ]
+    count = 5000
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [kinds[i % len(kinds)]() for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"item memory: {allocated / count:.0f} bytes per item ({count} items)")
+
+    saved = json.dumps([item.to_dict() for item in items])
+    print(f"item save size: {len(saved) / count:.1f} bytes per item")
+
+def bench_loot():
+    """Bulk drop rolls for idle fast-forward"""
+    from src.game.loot import LootGenerator
+
+    generator = LootGenerator(seed=1)
+    kills = 10000
+
+    def roll():
+        generator.roll_kills({"goblin": kills // 2, "dragon_whelp": kills // 2})
+
+    seconds = _timeit(roll, repeat=5, number=20)
+    drops = sum(item.count for item in generator.roll_kills({"goblin": kills // 2, "dragon_whelp": kills // 2}))
+    print(f"loot: {seconds * 1e3:.2f} ms per {kills} kills (~{drops} drops), {drops / seconds:,.0f} drops/s")
+
+def bench_loadout():
+    """Best-in-slot search over a large looted inventory"""
+    import time as clock
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.game.items import Weapon
+
+    player = Player("Bench")
+    inventory = player.inventory
+    inventory.add_items(LootGenerator(seed=1).roll_kills({"dragon_whelp": 8000, "orc_warrior": 8000, "goblin_archer": 8000}))
+    optimizer = inventory.get_optimizer()
+    print(f"inventory: {len(inventory.inventory)} entries")
+
+    for objective in ("damage", "defense", "dps"):
+        optimizer._frontiers.clear()
+        start = clock.perf_counter()
+        optimizer.best_loadout(objective)
+        cold = clock.perf_counter() - start
+        warm = _timeit(lambda: optimizer.best_loadout(objective), repeat=5, number=200)
+        print(f"{objective}: cold {cold * 1e3:.2f} ms, cached {warm * 1e3:.3f} ms, {optimizer.nodes} nodes")
+
+    def add_and_solve():
+        sword = Weapon("Bench Sword", 1, 1)
+        inventory.add_to_inventory(sword)
+        optimizer.best_loadout("dps")
+        inventory.remove_from_inventory(sword)
+
+    print(f"dps after add/remove: {_timeit(add_and_solve, repeat=5, number=200) * 1e3:.3f} ms")
+
+def bench_equipment():
+    """Per-hit equipment reads on the player"""
+    from src.game.player import Player
+    from src.game.items import Helmet, Boots, Accessory
+
+    player = Player("Bench")
+    player.equip_item(Helmet("Iron Helm", 3, 50, 1))
+    player.equip_item(Boots("Leather Boots", 2, 25, 1))
+    player.equip_item(Accessory("Copper Ring", 30, {"wisdom": 1}))
+
+    def hit():
+        player.current_hp = player.max_hp
+        player.take_damage(10)
+
+    def weapon():
+        return player.get_weapon()
+
+    def stat():
+        return player.get_stat("strength")
+
+    print(f"take_damage: {_timeit(hit, number=100000) * 1e9:.0f} ns")
+    print(f"get_weapon: {_timeit(weapon, number=100000) * 1e9:.0f} ns")
+    print(f"get_stat: {_timeit(stat, number=100000) * 1e9:.0f} ns")
+
+def bench_attributes():
+    """Per-action attribute cost of a player using skills against an enemy"""
+    import random
+    from src.game.player import Player
+    from src.game.action_manager import ActionManager
+    from src.game.enemy import _enemy_manager
+
+    action_manager = ActionManager()
+    player = Player("Bench", action_manager)
+    enemy = _enemy_manager.get_enemy("goblin")
+    attack = player.skills_manager.skill_manager.get_skill("basic_attack")
+    random.seed(1)
+
+    def reads():
+        return player.combat_sequence, player.equipment, player.skills
+
+    def action():
+        enemy.current_hp = enemy.max_hp
+        attack.current_cooldown = 0
+        action_manager.action_consumers[player.id]["current_action"] = 100.0
+        if attack.can_use(player):
+            attack.use(player, enemy)
+
+    print(f"forwarded reads: {_timeit(reads, number=100000) * 1e9:.0f} ns per 3 reads")
+    print(f"skill action: {_timeit(action, number=20000) * 1e6:.2f} us per can_use + use")
+
+def bench_shop():
+    """Bulk sales from inventories of growing size; cost should follow the items sold"""
+    import time as clock
+    from src.game.player import Player
+    from src.game.items import Weapon, create_item
+
+    for size in (1000, 10000, 50000):
+        player = Player("Bench")
+        inventory = player.inventory
+        for i in range(size):
+            sword = Weapon(f"Bench Sword {i}", 5, 40 + i % 500)
+            sword.rarity = "rare"
+            inventory.add_to_inventory(sword)
+        shop = inventory.get_shop()
+
+        def timed(sale, build):
+            best = float("inf")
+            for _ in range(20):
+                inventory.add_items(build())
+                start = clock.perf_counter()
+                sale()
+                best = min(best, clock.perf_counter() - start)
+            return best * 1e6
+
+        commons = lambda: [create_item("leather_cap") for _ in range(100)]
+        below = timed(lambda: shop.sell_below_rarity("uncommon"), commons)
+        duplicates = timed(shop.sell_duplicates, lambda: [create_item("iron_helm") for _ in range(100)])
+        scan = timed(lambda: [inventory.remove_from_inventory(item) for item in list(inventory.inventory)
+                              if item.rarity == "common"], commons)
+        print(f"{size} items: sell 100 below rarity {below:.0f} us, 100 duplicates {duplicates:.0f} us, "
+              f"full scan {scan:.0f} us")
+
+def bench_saving():
+    """Main-thread cost of an autosave with a large inventory"""
+    import os
+    import tempfile
+    import time as clock
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.engine.save_manager import SaveManager
+
+    player = Player("Bench")
+    player.inventory.add_items(LootGenerator(seed=1).roll_kills({"orc_warrior": 3000, "dragon_whelp": 3000}))
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(directory)
+
+        def timed(save):
+            best = float("inf")
+            for _ in range(10):
+                start = clock.perf_counter()
+                save()
+                best = min(best, clock.perf_counter() - start)
+                manager.flush()
+            return best * 1e3
+
+        sync = timed(lambda: manager.save_game(player.to_dict()))
+        background = timed(lambda: manager.save_game_async(player.to_dict()))
+        print(f"{len(player.inventory.inventory)} items, {os.path.getsize(manager.save_file_path)} bytes")
+        print(f"frame cost: synchronous {sync:.2f} ms, background {background:.2f} ms")
+
+        for slot in range(1, manager.slots + 1):
+            manager.save_game(player.to_dict(), slot=slot)
+        menu = _timeit(lambda: [SaveManager(directory).slot_info(slot) for slot in range(1, 4)], repeat=5, number=200)
+        parse = _timeit(lambda: [manager.read_save(slot)["level"] for slot in range(1, 4)], repeat=5, number=20)
+        print(f"load screen for 3 slots: index {menu * 1e6:.0f} us, parsing every save {parse * 1e3:.2f} ms")
+
+def bench_save_format():
+    """Save size and encode/decode time, JSON against the binary format"""
+    import json
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.engine.save_format import SaveFile, encode_save
+
+    player = Player("Bench")
+    player.inventory.add_items(LootGenerator(seed=1).roll_kills({"orc_warrior": 6000, "dragon_whelp": 6000}))
+    data = player.to_dict()
+    print(f"{len(player.inventory.inventory)} items")
+
+    encoded = json.dumps({"player": data}).encode("utf-8")
+    encode = _timeit(lambda: json.dumps({"player": data}).encode("utf-8"), repeat=5, number=20)
+    decode = _timeit(lambda: json.loads(encoded), repeat=5, number=20)
+    print(f"json: {len(encoded)} bytes, encode {encode * 1e3:.2f} ms, decode {decode * 1e3:.2f} ms")
+
+    for compression, level in (("zlib", 1), ("zlib", 6), ("zlib", 9), ("lzma", 0), ("lzma", 6)):
+        encoded = encode_save(data, compression, level)
+        encode = _timeit(lambda: encode_save(data, compression, level), repeat=3, number=5)
+        decode = _timeit(lambda: SaveFile(encoded).player_data(), repeat=3, number=5)
+        core = _timeit(lambda: SaveFile(encoded).section("player"), repeat=3, number=20)
+        print(f"{compression} {level}: {len(encoded)} bytes, encode {encode * 1e3:.2f} ms, "
+              f"decode {decode * 1e3:.2f} ms, core section only {core * 1e3:.3f} ms")
+
+def bench_loading():
+    """Time from reading a late-game save to a player ready for the character screen"""
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.engine.save_format import SaveFile, encode_save
+
+    player = Player("Bench")
+    player.inventory.add_items(LootGenerator(seed=1).roll_kills({"orc_warrior": 30000, "dragon_whelp": 30000}))
+    encoded = encode_save(player.to_dict())
+    print(f"{len(player.inventory.inventory)} items, {len(encoded)} bytes")
+
+    full = _timeit(lambda: Player.from_dict(SaveFile(encoded).player_data()), repeat=5, number=3)
+    lazy = _timeit(lambda: Player.from_save(SaveFile(encoded)), repeat=5, number=20)
+    bag = _timeit(lambda: len(Player.from_save(SaveFile(encoded)).inventory.inventory), repeat=5, number=3)
+    print(f"full load {full * 1e3:.2f} ms, lazy load {lazy * 1e3:.2f} ms, lazy load + first bag access {bag * 1e3:.2f} ms")
+
+def bench_journal():
+    """Bytes and time per autosave after a battle: full snapshots against journal deltas"""
+    import os
+    import tempfile
+    import time as clock
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.engine.save_manager import SaveManager
+
+    player = Player("Bench")
+    loot = LootGenerator(seed=1)
+    player.inventory.add_items(loot.roll_kills({"orc_warrior": 30000, "dragon_whelp": 30000}))
+    print(f"{len(player.inventory.inventory)} items")
+
+    for label, entries in (("snapshot", 0), ("journal", 32)):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SaveManager(directory, journal_entries=entries)
+            manager.save_game(player.to_dict())
+            written = 0
+            elapsed = 0.0
+            for battle in range(30):
+                player.gold += 10
+                player.experience += 5
+                player.inventory.add_items(loot.roll_kills({"goblin_archer": 3}))
+                data = player.to_dict()
+                before = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+                start = clock.perf_counter()
+                manager.save_game(data)
+                elapsed += clock.perf_counter() - start
+                after = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+                written += max(after - before, 0) if entries else os.path.getsize(manager.slot_path(1))
+            print(f"{label}: {written / 30:.0f} bytes and {elapsed / 30 * 1e3:.2f} ms per save "
+                  f"({manager.snapshots} snapshots, {manager.deltas} deltas)")
+
+def bench_migrations():
+    """Decoding current-schema saves directly against running them through the migration pipeline"""
+    from src.game.player import Player
+    from src.game.loot import LootGenerator
+    from src.game.save_migrations import SCHEMA_KEY
+
+    for kills in (0, 300):
+        player = Player("Bench")
+        player.inventory.add_items(LootGenerator(seed=1).roll_kills({"orc_warrior": kills}))
+        data = player.to_dict()
+        legacy = {key: value for key, value in data.items() if key != SCHEMA_KEY}
+        current = _timeit(lambda: Player.from_dict(data), repeat=5, number=200)
+        migrated = _timeit(lambda: Player.from_dict(legacy), repeat=5, number=200)
+        print(f"{len(player.inventory.inventory)} items: current schema {current * 1e3:.3f} ms, "
+              f"unversioned save through migrations {migrated * 1e3:.3f} ms")
+
+def bench_settings():
+    """A 120-event slider drag: rewriting the settings file on each event against the debounced store"""
+    import json
+    import os
+    import tempfile
+    import time as clock
+    from src.engine.settings import SettingsStore
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "audio_settings.json")
+
+        def write_each_event():
+            for step in range(120):
+                with open(path, 'w') as f:
+                    json.dump({"master_volume": step / 120, "music_volume": 0.7, "ui_volume": 0.8, "sfx_volume": 0.9}, f)
+
+        store = SettingsStore(os.path.join(directory, "settings.json"), delay=0.05)
+
+        def debounced():
+            for step in range(120):
+                store.set("audio.master_volume", step / 120 + clock.perf_counter() % 1e-6)
+
+        direct = _timeit(write_each_event, repeat=5, number=1)
+        store_time = _timeit(debounced, repeat=5, number=1)
+        clock.sleep(0.2)
+        print(f"write per event {direct * 1e3:.2f} ms for 120 writes, "
+              f"settings store {store_time * 1e3:.3f} ms for {store.writes} background writes over 5 drags")
+
+def bench_audio():
+    """AudioManager start-up, and a fast-forwarded battle firing 60 skill sounds per frame for 10 frames"""
+    import os
+    import time as clock
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from src.engine.audio_manager import AudioManager, SoundType
+    from src.engine.sound_bank import SoundBank
+
+    pygame.mixer.init()
+    bank = SoundBank()
+    start = clock.perf_counter()
+    audio = AudioManager(sound_bank=bank)
+    startup = clock.perf_counter() - start
+    bank.flush()
+    print(f"start-up {startup * 1e3:.2f} ms, {bank.decodes} sounds decoded in the background, "
+          f"{bank.cached_bytes // 1024} KB cached")
+
+    sounds = [bank.get(audio.sound_paths[SoundType.ATTACK]), bank.get(audio.sound_paths[SoundType.HEAL])]
+
+    def direct():
+        for frame in range(10):
+            for action in range(60):
+                sound = sounds[action % 2]
+                sound.set_volume(0.9)
+                sound.play()
+
+    def pooled():
+        for frame in range(10):
+            for action in range(60):
+                audio.play_skill_sound("heal" if action % 2 else "attack")
+            audio.update()
+
+    direct_time = _timeit(direct, repeat=5, number=1)
+    pygame.mixer.stop()
+    pooled_time = _timeit(pooled, repeat=5, number=1)
+    pools = audio.mixer.pools
+    print(f"Sound.play per action {direct_time * 1e3:.2f} ms for 600 plays, channel pools {pooled_time * 1e3:.2f} ms "
+          f"for {sum(pool.plays for pool in pools.values()) // 5} plays per run")
+
+def bench_events():
+    """Headless battles with nobody listening against a bus whose subscribers take a batch per frame"""
+    import logging
+    from src.game.player import Player
+    from src.game.action_manager import ActionManager
+    from src.game.combat import CombatManager
+    from src.game.combat_events import EventBus, SkillUsed, DamageDealt, CombatEnded
+
+    logging.disable(logging.CRITICAL)
+
+    def battles(bus, count=20):
+        combat = CombatManager(Player("Bench", ActionManager()), bus)
+        clock = 0.0
+        for _ in range(count):
+            combat.player.current_hp = combat.player.max_hp
+            combat.start_new_battle(enemy_level=1)
+            while combat.combat_active:
+                clock += 1.0
+                combat.update(clock)
+                bus.dispatch()
+        return bus.published
+
+    silent = _timeit(lambda: battles(EventBus()), repeat=5, number=1)
+    listened = EventBus()
+    batches = []
+    for event_type in (SkillUsed, DamageDealt, CombatEnded):
+        listened.subscribe(event_type, batches.append)
+    busy = _timeit(lambda: battles(listened), repeat=5, number=1)
+    logging.disable(logging.NOTSET)
+    print(f"20 battles: no subscribers {silent * 1e3:.2f} ms, three subscribers {busy * 1e3:.2f} ms "
+          f"({listened.published // 5} events per run in {len(batches) // 5} batches)")
+
+def bench_images():
+    """Per-frame cost of the combat screen's enemy image: scaling and blitting raw against converted, cached surfaces"""
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from src.engine.asset_manager import AssetManager, AssetType
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((800, 600))
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images", "goblin.png")
+    raw = pygame.image.load(path)
+    assets = AssetManager(800, 600)
+    size = (72, 72)
+
+    def scale_every_frame():
+        screen.blit(pygame.transform.scale(raw, size), (400, 300))
+
+    def cached():
+        screen.blit(assets.get_scaled_image(AssetType.ENEMY_GOBLIN, size), (400, 300))
+
+    title_raw = pygame.transform.scale(raw, (800, 600))
+    title = assets.get_image(AssetType.TITLE_SCREEN)
+    before = _timeit(scale_every_frame, repeat=5, number=200)
+    after = _timeit(cached, repeat=5, number=200)
+    blit_raw = _timeit(lambda: screen.blit(title_raw, (0, 0)), repeat=5, number=200)
+    blit_converted = _timeit(lambda: screen.blit(title, (0, 0)), repeat=5, number=200)
+    print(f"enemy image per frame: scale + blit {before * 1e3:.3f} ms, cached {after * 1e3:.3f} ms ({assets.scales} scale)")
+    print(f"full-screen blit: unconverted {blit_raw * 1e3:.3f} ms, converted {blit_converted * 1e3:.3f} ms")
+
+BENCHMARKS = {
+    "combatants": bench_combatants,
+    "waves": bench_waves,
+    "expeditions": bench_expeditions,
+    "statuses": bench_statuses,
+    "inventory": bench_inventory,
+    "items": bench_items,
+    "loot": bench_loot,
+    "loadout": bench_loadout,
+    "equipment": bench_equipment,
+    "attributes": bench_attributes,
+    "shop": bench_shop,
+    "saving": bench_saving,
+    "save_format": bench_save_format,
+    "loading": bench_loading,
+    "journal": bench_journal,
+    "migrations": bench_migrations,
+    "settings": bench_settings,
+    "audio": bench_audio,
+    "events": bench_events,
+    "images": bench_images,
+}
+
+def main(names):
+    for name in names or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name]()
+
+if __name__ == "__main__":
+    main(sys.argv[1:])